@@ -0,0 +1,44 @@
+"""
+Backfill intent scores in parallel.
+
+Rescores contacts in keyset-paginated ID ranges across a process pool,
+checkpointing progress so an interrupted run resumes where it stopped.
+Run after changing keywords, weights or thresholds:
+
+    python -m app.commands.backfill_intent_scores --mode all --workers 8
+"""
+import argparse
+import logging
+from app.database import Base, SessionLocal, engine
+from app.services.scoring_backfill import BACKFILL_MODES, ScoringBackfillService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--mode", choices=BACKFILL_MODES, default="all",
+                        help="all: rescore everything; stale: only changed contacts; unscored: only new ones")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes (default: INTENT_BACKFILL_WORKERS, or one per CPU)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Contacts per range (default: INTENT_BATCH_CHUNK_SIZE)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    Base.metadata.create_all(bind=engine)
+    
+    db = SessionLocal()
+    try:
+        service = ScoringBackfillService(db)
+        backfill = service.run(service.start_or_resume(args.mode), args.workers, args.chunk_size)
+        print({
+            "backfill_id": backfill.id,
+            "status": backfill.status,
+            "contacts_scanned": backfill.contacts_scanned,
+            "contacts_scored": backfill.contacts_scored
+        })
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Compact intent score history.
+
+Rolls every contact's superseded intent scores up into daily rollups,
+deletes them and prunes rollups past the retention period. Meant to run
+from cron:
+
+    python -m app.commands.compact_intent_history --retention-days 365
+"""
+import argparse
+import logging
+from app.database import Base, SessionLocal, engine
+from app.models import audience  # noqa: F401 -- registers Contact relationship targets
+from app.services.score_history import ScoreHistoryService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--retention-days", type=int, default=None,
+                        help="Keep daily rollups this many days (default: INTENT_HISTORY_RETENTION_DAYS)")
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Contacts per transaction (default: INTENT_BATCH_CHUNK_SIZE)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    Base.metadata.create_all(bind=engine)
+    
+    db = SessionLocal()
+    try:
+        stats = ScoreHistoryService(db).compact(args.retention_days, args.chunk_size)
+    finally:
+        db.close()
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Compact stored intent score signals.
+
+Rewrites signals saved in the old readable form (keyword strings and
+reasoning sentences) as rule set version + keyword ids + flags. Safe to
+re-run; already compact rows are skipped:
+
+    python -m app.commands.compact_intent_signals
+"""
+import argparse
+import logging
+from app.database import Base, SessionLocal, engine
+from app.models import audience  # noqa: F401 -- registers Contact relationship targets
+from app.services.batch_scorer import BatchIntentScorer
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--chunk-size", type=int, default=None,
+                        help="Scores per chunk (default: INTENT_BATCH_CHUNK_SIZE)")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    Base.metadata.create_all(bind=engine)
+    
+    db = SessionLocal()
+    try:
+        stats = BatchIntentScorer(db).compact_legacy_signals(args.chunk_size)
+    finally:
+        db.close()
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Compact stored SerpAPI raw responses.
+
+Moves legacy inline ``raw_response`` JSON into the compressed payload
+store and prunes raw responses past the retention period. Meant to run
+from cron:
+
+    python -m app.commands.compact_serpapi_payloads --retention-days 30
+"""
+import argparse
+import logging
+from app.database import Base, SessionLocal, engine
+from app.services.serpapi_payload_store import SerpAPIPayloadStore
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--retention-days", type=int, default=None,
+                        help="Keep raw responses this many days (default: SERPAPI_RAW_RETENTION_DAYS)")
+    parser.add_argument("--batch-size", type=int, default=500)
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    Base.metadata.create_all(bind=engine)
+    
+    db = SessionLocal()
+    try:
+        stats = SerpAPIPayloadStore(db).compact(args.retention_days, args.batch_size)
+    finally:
+        db.close()
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Relabel intent scores after a threshold change.
+
+Rewrites stored labels with set-based UPDATEs instead of rescoring. Set
+the new INTENT_HIGH_THRESHOLD / INTENT_MEDIUM_THRESHOLD first, then pass
+the thresholds the scores were built with:
+
+    python -m app.commands.relabel_intent_scores --previous-high 0.7 --previous-medium 0.4 --dry-run
+    python -m app.commands.relabel_intent_scores --previous-high 0.7 --previous-medium 0.4
+"""
+import argparse
+import logging
+from app.config import get_settings
+from app.database import Base, SessionLocal, engine
+from app.models import audience  # noqa: F401 -- registers Contact relationship targets
+from app.services.score_relabel import ScoreRelabelService
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--previous-high", type=float, required=True,
+                        help="HIGH threshold the existing scores were built with")
+    parser.add_argument("--previous-medium", type=float, required=True,
+                        help="MEDIUM threshold the existing scores were built with")
+    parser.add_argument("--batch-size", type=int, default=None,
+                        help="IDs per UPDATE (default: INTENT_BATCH_CHUNK_SIZE)")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Only count contacts moving between labels")
+    args = parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    Base.metadata.create_all(bind=engine)
+    settings = get_settings()
+    
+    db = SessionLocal()
+    try:
+        service = ScoreRelabelService(db)
+        if args.dry_run:
+            result = service.preview(
+                settings.intent_high_threshold,
+                settings.intent_medium_threshold,
+                args.previous_high,
+                args.previous_medium
+            )
+        else:
+            result = service.relabel(args.previous_high, args.previous_medium, args.batch_size)
+    finally:
+        db.close()
+    print(result)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Run queued CSV import jobs.
+
+For deployments that run imports outside the API process
+(CSV_IMPORT_WORKER_ENABLED=false). Processes queued and abandoned jobs
+until none are left:
+
+    python -m app.commands.run_csv_imports
+"""
+import argparse
+import logging
+from app.database import Base, engine
+from app.models import audience  # noqa: F401 -- registers Contact relationship targets
+from app.services.csv_import_jobs import run_next_import
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.parse_args()
+    
+    logging.basicConfig(level=logging.INFO)
+    Base.metadata.create_all(bind=engine)
+    
+    job_ids = []
+    while (job_id := run_next_import()) is not None:
+        job_ids.append(job_id)
+    print({"jobs_run": job_ids})
+
+
+if __name__ == "__main__":
+    main()
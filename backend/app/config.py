@@ -38,10 +38,71 @@ class Settings(BaseSettings):
             return [i.strip() for i in v.split(",")]
         return v
     
+    # SerpAPI HTTP client
+    serpapi_base_url: str = "https://serpapi.com"
+    serpapi_timeout_seconds: float = 30.0
+    serpapi_connect_timeout_seconds: float = 5.0
+    serpapi_max_connections: int = 20
+    serpapi_max_keepalive_connections: int = 10
+    serpapi_keepalive_expiry_seconds: float = 30.0
+    
+    # SerpAPI rate limit and credit budgets (0 disables a limit)
+    serpapi_rate_limit_per_second: float = 5.0
+    serpapi_rate_limit_burst: int = 10
+    serpapi_rate_limit_max_wait_seconds: float = 10.0
+    serpapi_daily_credit_budget: int = 0
+    serpapi_monthly_credit_budget: int = 0
+    
+    # SerpAPI response cache (TTL of 0 disables the cache)
+    serpapi_cache_ttl_seconds: int = 86400
+    serpapi_cache_memory_size: int = 256
+    
+    # SerpAPI raw response storage (empty blob dir stores payloads in the database,
+    # retention of 0 keeps raw responses forever)
+    serpapi_blob_dir: str = ""
+    serpapi_payload_compression_level: int = 6
+    serpapi_raw_retention_days: int = 0
+    
+    # SerpAPI paged search
+    serpapi_max_paged_results: int = 500
+    
+    # SerpAPI batch search
+    serpapi_batch_concurrency: int = 5
+    serpapi_batch_max_concurrency: int = 20
+    serpapi_batch_max_searches: int = 5000
+    serpapi_batch_import_size: int = 25
+    
+    # Search watchlist scheduler
+    watchlist_scheduler_enabled: bool = True
+    watchlist_scheduler_interval_seconds: int = 60
+    watchlist_scheduler_batch_size: int = 10
+    
+    # CSV import (uploads are spooled to disk and parsed in chunks;
+    # an empty spool dir uses the system temp dir)
+    csv_import_chunk_size: int = 10000
+    csv_upload_spool_dir: str = ""
+    
+    # Background CSV import worker (runs queued import jobs in the API process;
+    # a running job whose worker made no progress for the stale timeout is
+    # taken over, so it must exceed the time a chunk takes)
+    csv_import_worker_enabled: bool = True
+    csv_import_poll_seconds: int = 5
+    csv_import_stale_seconds: int = 120
+    
+    # Background rescore after a scoring rule set is activated (runs in the API
+    # process; a rollout still running after the stale timeout is taken over)
+    rule_rollout_worker_enabled: bool = True
+    rule_rollout_poll_seconds: int = 30
+    rule_rollout_stale_seconds: int = 3600
+    
     # Intent Scoring Configuration
     intent_high_threshold: float = 0.7
     intent_medium_threshold: float = 0.4
     intent_recency_days: int = 90
+    intent_batch_chunk_size: int = 5000
+    intent_backfill_workers: int = 0  # 0 = one per CPU
+    intent_rules_refresh_seconds: int = 30  # How often processes check for a newly activated rule set
+    intent_history_retention_days: int = 365  # Daily score rollups kept by the compaction job (0 = forever)
     
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -5,7 +5,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config import get_settings
 from app.database import Base, engine
-from app.routers import contacts, data_sources, audiences, exports
+from app.routers import contacts, data_sources, audiences, exports, watchlists, scoring_rules
+from app.services.csv_import_worker import csv_import_worker
+from app.services.rule_rollout_worker import rule_rollout_worker
+from app.services.serpapi_client import close_serpapi_client
+from app.services.watchlist_scheduler import watchlist_scheduler
 
 settings = get_settings()
 
@@ -33,6 +37,28 @@ app.include_router(contacts.router)
 app.include_router(data_sources.router)
 app.include_router(audiences.router)
 app.include_router(exports.router)
+app.include_router(watchlists.router)
+app.include_router(scoring_rules.router)
+
+
+@app.on_event("startup")
+async def startup():
+    """Start background schedulers."""
+    if settings.watchlist_scheduler_enabled:
+        watchlist_scheduler.start()
+    if settings.csv_import_worker_enabled:
+        csv_import_worker.start()
+    if settings.rule_rollout_worker_enabled:
+        rule_rollout_worker.start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Stop background schedulers and release pooled upstream connections."""
+    await watchlist_scheduler.stop()
+    await csv_import_worker.stop()
+    await rule_rollout_worker.stop()
+    await close_serpapi_client()
 
 
 @app.get("/")
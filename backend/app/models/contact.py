@@ -1,7 +1,8 @@
 """Contact/Lead data model."""
-from sqlalchemy import Column, Integer, String, TIMESTAMP, JSON
+from sqlalchemy import Column, Integer, String, Float, TIMESTAMP, JSON, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
+from typing import Optional
 from app.database import Base
 
 
@@ -22,12 +23,46 @@ class Contact(Base):
     state = Column(String(100), nullable=True)
     country = Column(String(100), nullable=True)
     source = Column(String(50), nullable=True)  # 'serpapi' or 'csv'
+    dedupe_key = Column(String(255), nullable=True, index=True)  # Identity key for import-time dedupe
     raw_data = Column(JSON, nullable=True)  # Original data from source
+    score_fingerprint = Column(String(64), nullable=True)  # Hash of the inputs the intent rules read
+    score_rule_version = Column(String(64), nullable=True)  # Scoring rules the current score was built with
+    intent_base_score = Column(Float, nullable=True)  # Base value of the latest intent score (recency applied on read)
+    intent_scored_at = Column(TIMESTAMP(timezone=True), nullable=True)  # When the latest intent score was calculated
     enriched_data = Column(JSON, nullable=True)  # Data from skip-trace API
     enriched_at = Column(TIMESTAMP(timezone=True), nullable=True)
     created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
-    intent_scores = relationship("IntentScore", back_populates="contact", cascade="all, delete-orphan")
+    intent_scores = relationship(
+        "IntentScore",
+        back_populates="contact",
+        cascade="all, delete-orphan",
+        order_by="[IntentScore.calculated_at.desc(), IntentScore.id.desc()]"  # Current score first
+    )
     audience_memberships = relationship("AudienceContact", back_populates="contact", cascade="all, delete-orphan")
+    keyword_matches = relationship("ContactKeyword", cascade="all, delete-orphan")
+    
+    __table_args__ = (
+        # Intent level filters and sorts range-scan the base score, then check recency
+        Index("ix_contacts_intent_base_score_created_at", "intent_base_score", "created_at"),
+    )
+    
+    @property
+    def intent_score_value(self) -> Optional[float]:
+        """Current intent score value (latest score, recency evaluated now)."""
+        from app.services.intent_scorer import IntentScoringService
+        if self.intent_base_score is None:
+            return None
+        return IntentScoringService.apply_recency(
+            self.intent_base_score,
+            IntentScoringService.is_recent(self.created_at)
+        )
+    
+    @property
+    def intent_level(self) -> Optional[str]:
+        """Current intent label ("HIGH", "MEDIUM", "LOW"), or None if unscored."""
+        from app.services.intent_scorer import IntentScoringService
+        value = self.intent_score_value
+        return None if value is None else IntentScoringService.label_for(value)
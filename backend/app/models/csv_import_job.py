@@ -0,0 +1,35 @@
+"""CSV import job model."""
+from sqlalchemy import Column, Integer, BigInteger, String, Float, Text, TIMESTAMP, JSON, ForeignKey
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class CSVImportJob(Base):
+    """A CSV file being imported in the background, with its checkpoint."""
+    
+    __tablename__ = "csv_import_jobs"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    filename = Column(String(255), nullable=False)
+    file_path = Column(String(1024), nullable=False)  # Spooled upload; removed once the job completes
+    file_size = Column(BigInteger, nullable=True)
+    content_sha256 = Column(String(64), nullable=True, index=True)  # Recognizes an exact re-upload
+    head_sha256 = Column(String(64), nullable=True, index=True)  # First 64 KiB; finds the file an upload extends
+    base_job_id = Column(Integer, ForeignKey("csv_import_jobs.id", ondelete="SET NULL"), nullable=True)
+    status = Column(String(20), nullable=False, default="pending", index=True)  # 'pending', 'running', 'failed', 'completed'
+    chunk_size = Column(Integer, nullable=False)
+    chunks_done = Column(Integer, nullable=False, default=0)  # Every chunk before this one is committed
+    rows_processed = Column(Integer, nullable=False, default=0)
+    contacts_imported = Column(Integer, nullable=False, default=0)
+    rows_skipped = Column(Integer, nullable=False, default=0)
+    contacts_scored = Column(Integer, nullable=False, default=0)
+    rows_unchanged = Column(Integer, nullable=False, default=0)  # Rows already imported by the base job
+    chunk_fingerprints = Column(JSON, nullable=True)  # [rows, digest] per committed chunk
+    rows_per_second = Column(Float, nullable=True)  # Throughput of the current (or last) run
+    peak_memory_mb = Column(Float, nullable=True)  # Peak resident memory of the worker process
+    errors = Column(JSON, nullable=True)  # First row errors
+    error = Column(Text, nullable=True)  # Why the job failed
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
+    started_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    heartbeat_at = Column(TIMESTAMP(timezone=True), nullable=True)  # Last progress of the worker running it
+    completed_at = Column(TIMESTAMP(timezone=True), nullable=True)
@@ -1,5 +1,5 @@
 """Intent score data model."""
-from sqlalchemy import Column, Integer, String, Float, ForeignKey, TIMESTAMP, JSON
+from sqlalchemy import Column, Integer, String, Float, ForeignKey, TIMESTAMP, JSON, Date, UniqueConstraint
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from app.database import Base
@@ -13,9 +13,65 @@ class IntentScore(Base):
     id = Column(Integer, primary_key=True, index=True)
     contact_id = Column(Integer, ForeignKey("contacts.id", ondelete="CASCADE"), nullable=False, index=True)
     score = Column(String(20), nullable=False, index=True)  # 'LOW', 'MEDIUM', 'HIGH'
-    score_value = Column(Float, nullable=False)  # Numerical score (0.0-1.0) for sorting
-    signals = Column(JSON, nullable=True)  # Matched keywords, activity data, reasoning
+    score_value = Column(Float, nullable=False)  # Numerical score (0.0-1.0) as of calculated_at
+    base_score_value = Column(Float, nullable=True)  # Keyword + source component; recency is applied when read
+    signals = Column(JSON, nullable=True)  # Compact: rule set version, matched keyword ids, boost flags
     calculated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
     
     # Relationships
     contact = relationship("Contact", back_populates="intent_scores")
+    
+    @property
+    def current_score_value(self) -> float:
+        """Score with the recency boost evaluated now instead of when it was calculated."""
+        from app.services.intent_scorer import IntentScoringService
+        return IntentScoringService.current_score_value(self.base_score_value, self.score_value, self.contact.created_at)
+    
+    @property
+    def readable_signals(self):
+        """Signals with keyword names and reasoning (see ``expand_signals``)."""
+        from app.services.intent_scorer import IntentScoringService
+        return IntentScoringService.expand_signals(self.signals)
+    
+    @property
+    def current_score(self) -> str:
+        """Categorical label of ``current_score_value``."""
+        from app.services.intent_scorer import IntentScoringService
+        if self.base_score_value is None:
+            return self.score
+        return IntentScoringService.label_for(self.current_score_value)
+
+
+class ContactKeyword(Base):
+    """Reverse index: which contacts' current score matched a keyword."""
+    
+    __tablename__ = "contact_keywords"
+    
+    # Keyword first, so the primary key index serves lookups by keyword
+    keyword = Column(String(255), primary_key=True)
+    contact_id = Column(Integer, ForeignKey("contacts.id", ondelete="CASCADE"), primary_key=True, index=True)
+
+
+class IntentScoreRollup(Base):
+    """
+    One day of a contact's superseded intent scores.
+    
+    Written by the history compaction job, which keeps only each contact's
+    current IntentScore row.
+    """
+    
+    __tablename__ = "intent_score_rollups"
+    __table_args__ = (
+        UniqueConstraint("contact_id", "day", name="uq_intent_score_rollups_contact_day"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    contact_id = Column(Integer, ForeignKey("contacts.id", ondelete="CASCADE"), nullable=False, index=True)
+    day = Column(Date, nullable=False, index=True)  # UTC day of calculated_at
+    first_label = Column(String(20), nullable=False)
+    last_label = Column(String(20), nullable=False)
+    transitions = Column(Integer, nullable=False, default=0)  # Label changes within the day
+    min_score_value = Column(Float, nullable=False)
+    max_score_value = Column(Float, nullable=False)
+    last_score_value = Column(Float, nullable=False)
+    score_count = Column(Integer, nullable=False, default=0)
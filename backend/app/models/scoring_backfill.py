@@ -0,0 +1,22 @@
+"""Intent scoring backfill checkpoint model."""
+from sqlalchemy import Column, Integer, String, Text, TIMESTAMP
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ScoringBackfill(Base):
+    """Progress of a (resumable) bulk intent scoring run."""
+    
+    __tablename__ = "scoring_backfills"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    mode = Column(String(20), nullable=False)  # 'all', 'stale' or 'unscored'
+    rule_version = Column(String(64), nullable=False, index=True)
+    status = Column(String(20), nullable=False, default="running")  # 'running', 'failed', 'completed'
+    last_contact_id = Column(Integer, nullable=False, default=0)  # Every contact up to this ID is done
+    contacts_scanned = Column(Integer, nullable=False, default=0)
+    contacts_scored = Column(Integer, nullable=False, default=0)
+    error = Column(Text, nullable=True)
+    started_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
+    completed_at = Column(TIMESTAMP(timezone=True), nullable=True)
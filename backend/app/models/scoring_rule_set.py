@@ -0,0 +1,28 @@
+"""Versioned intent scoring rule set model."""
+from sqlalchemy import Column, Integer, String, Float, Boolean, Text, TIMESTAMP, JSON
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ScoringRuleSet(Base):
+    """Intent keywords, weights and boosts, stored as data (one active at a time)."""
+    
+    __tablename__ = "scoring_rule_sets"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    version = Column(String(64), unique=True, nullable=False, index=True)  # Hash of the rules below
+    description = Column(Text, nullable=True)
+    keywords = Column(JSON, nullable=False)  # {"high": [...], "medium": [...], "low": [...]}
+    weights = Column(JSON, nullable=False)  # Score added per matched keyword of each tier
+    recency_boost = Column(Float, nullable=False)
+    source_boost = Column(Float, nullable=False)
+    is_active = Column(Boolean, nullable=False, default=False, index=True)
+    activated_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    # Rescore of the contacts an activation affects, run by the rollout worker
+    rollout_status = Column(String(20), nullable=True)  # 'pending', 'running', 'completed', 'failed' or 'superseded'
+    rollout_from_version = Column(String(64), nullable=True)  # Rules the contacts were scored with before
+    rollout_stats = Column(JSON, nullable=True)  # Summary from RuleSetService.rescore_changed
+    rollout_error = Column(Text, nullable=True)
+    rollout_started_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    rollout_completed_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
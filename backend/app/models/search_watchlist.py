@@ -0,0 +1,23 @@
+"""Saved recurring SerpAPI search model."""
+from sqlalchemy import Column, Integer, String, Boolean, Text, TIMESTAMP
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class SearchWatchlist(Base):
+    """A saved search that is re-run on a fixed cadence."""
+    
+    __tablename__ = "search_watchlists"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    name = Column(String(255), nullable=False)
+    query = Column(String(500), nullable=False)
+    location = Column(String(255), nullable=True)
+    num_results = Column(Integer, nullable=False, default=10)
+    cadence_hours = Column(Integer, nullable=False, default=72)
+    is_active = Column(Boolean, nullable=False, default=True)
+    last_run_at = Column(TIMESTAMP(timezone=True), nullable=True)
+    next_run_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False, index=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
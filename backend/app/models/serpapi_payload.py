@@ -0,0 +1,24 @@
+"""Content-addressed storage for raw SerpAPI responses."""
+from sqlalchemy import Column, Integer, String, LargeBinary, TIMESTAMP
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class SerpAPIPayload(Base):
+    """
+    One compressed raw SerpAPI response, stored once per distinct content.
+    
+    The compressed bytes live either inline in ``data`` or in a file under
+    the configured blob directory, in which case only ``blob_path`` is set.
+    """
+    
+    __tablename__ = "serpapi_payloads"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    content_hash = Column(String(64), nullable=False, unique=True, index=True)  # sha256 of canonical JSON
+    encoding = Column(String(20), nullable=False, default="zlib")
+    data = Column(LargeBinary, nullable=True)
+    blob_path = Column(String(500), nullable=True)  # Relative to settings.serpapi_blob_dir
+    raw_size = Column(Integer, nullable=False)
+    stored_size = Column(Integer, nullable=False)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
@@ -1,7 +1,9 @@
 """SerpAPI search tracking model."""
-from sqlalchemy import Column, Integer, String, TIMESTAMP, JSON
+from sqlalchemy import Column, Integer, String, TIMESTAMP, JSON, Index, ForeignKey
 from sqlalchemy.sql import func
 from app.database import Base
+# Foreign key targets must be registered on the same metadata
+from app.models import search_watchlist, serpapi_payload  # noqa: F401
 
 
 class SerpAPISearch(Base):
@@ -11,6 +13,17 @@ class SerpAPISearch(Base):
     
     id = Column(Integer, primary_key=True, index=True)
     query = Column(String(500), nullable=False)
+    location = Column(String(255), nullable=True)
+    num_results = Column(Integer, nullable=True)
+    start = Column(Integer, default=0)  # Result offset for paged searches
+    cache_key = Column(String(64), nullable=True)  # Hash of normalized search params
     results_count = Column(Integer, default=0)
-    raw_response = Column(JSON, nullable=True)  # Full API response for debugging
+    raw_response = Column(JSON, nullable=True)  # Legacy inline response; new rows use payload_id
+    payload_id = Column(Integer, ForeignKey("serpapi_payloads.id", ondelete="SET NULL"), nullable=True, index=True)
+    watchlist_id = Column(Integer, ForeignKey("search_watchlists.id", ondelete="SET NULL"), nullable=True, index=True)
+    result_keys = Column(JSON, nullable=True)  # Identity keys of the results (watchlist runs)
     searched_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False)
+    
+    __table_args__ = (
+        Index("ix_serpapi_searches_cache_key_searched_at", "cache_key", "searched_at"),
+    )
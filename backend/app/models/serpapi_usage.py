@@ -0,0 +1,15 @@
+"""SerpAPI credit usage ledger model."""
+from sqlalchemy import Column, Integer, String, TIMESTAMP
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class SerpAPIUsage(Base):
+    """One row per billed SerpAPI request."""
+    
+    __tablename__ = "serpapi_usage"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    query = Column(String(500), nullable=False)  # Normalized (lowercased, collapsed) query
+    credits = Column(Integer, nullable=False, default=1)
+    used_at = Column(TIMESTAMP(timezone=True), server_default=func.now(), nullable=False, index=True)
@@ -8,7 +8,6 @@ from datetime import datetime
 from app.database import get_db
 from app.models.contact import Contact
 from app.models.audience import Audience, AudienceContact
-from app.models.intent_score import IntentScore
 from app.schemas.audience import (
     AudienceCreate,
     AudienceUpdate,
@@ -17,6 +16,7 @@ from app.schemas.audience import (
     AudienceFilters
 )
 from app.schemas.contact import ContactListResponse
+from app.services.intent_scorer import IntentScoringService
 
 router = APIRouter(prefix="/audiences", tags=["audiences"])
 
@@ -182,9 +182,7 @@ def _apply_filters(db: Session, filters: dict) -> List[Contact]:
         query = query.filter(Contact.country.ilike(f"%{filters['country']}%"))
     
     if filters.get("intent_level"):
-        query = query.join(IntentScore).filter(
-            IntentScore.score == filters["intent_level"].upper()
-        )
+        query = query.filter(IntentScoringService.intent_level_condition(filters["intent_level"]))
     
     if filters.get("date_from"):
         query = query.filter(Contact.created_at >= filters["date_from"])
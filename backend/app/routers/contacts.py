@@ -7,15 +7,17 @@ from datetime import datetime
 
 from app.database import get_db
 from app.models.contact import Contact
-from app.models.intent_score import IntentScore
 from app.schemas.contact import (
     ContactCreate,
     ContactUpdate,
     ContactResponse,
-    ContactListResponse
+    ContactListResponse,
+    IntentHistoryResponse,
+    IntentHistoryCompactionResponse
 )
 from app.services.intent_scorer import IntentScoringService
 from app.services.enrichment_service import EnrichmentService
+from app.services.score_history import ScoreHistoryService
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
@@ -32,10 +34,15 @@ def list_contacts(
     intent_level: Optional[str] = None,
     date_from: Optional[datetime] = None,
     date_to: Optional[datetime] = None,
+    sort: Optional[str] = Query(None, pattern="^-?(created_at|intent_score)$"),
     db: Session = Depends(get_db)
 ):
     """
     List contacts with filtering and pagination.
+    
+    ``sort`` orders by ``created_at`` or current ``intent_score`` value;
+    prefix with "-" for descending. Intent filters and sorts read the
+    score materialized on ``contacts``, so no join is needed.
     """
     query = db.query(Contact)
     
@@ -69,11 +76,18 @@ def list_contacts(
     
     # Filter by intent level
     if intent_level:
-        query = query.join(IntentScore).filter(IntentScore.score == intent_level.upper())
+        query = query.filter(IntentScoringService.intent_level_condition(intent_level))
     
     # Get total count
     total = query.count()
     
+    # Apply sorting (unscored contacts last)
+    if sort:
+        column = sort.lstrip("-")
+        key = IntentScoringService.current_score_expression() if column == "intent_score" else Contact.created_at
+        order = key.desc() if sort.startswith("-") else key.asc()
+        query = query.order_by(order.nulls_last(), Contact.id)
+    
     # Apply pagination
     offset = (page - 1) * page_size
     contacts = query.offset(offset).limit(page_size).all()
@@ -86,6 +100,32 @@ def list_contacts(
     )
 
 
+@router.post("/rescore-stale")
+def rescore_stale_contacts(db: Session = Depends(get_db)):
+    """Rescore contacts whose scoring inputs or scoring rules changed."""
+    intent_scorer = IntentScoringService(db)
+    result = intent_scorer.rescore_stale_contacts()
+    return {
+        **result,
+        "rule_version": intent_scorer.rule_version,
+        "message": f"Rescored {result['rescored']} of {result['scanned']} contacts"
+    }
+
+
+@router.post("/intent-history/compact", response_model=IntentHistoryCompactionResponse)
+def compact_intent_history(
+    retention_days: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db)
+):
+    """
+    Roll superseded intent scores up into daily history and delete them.
+    
+    Rollups older than ``retention_days`` (default
+    ``INTENT_HISTORY_RETENTION_DAYS``) are dropped.
+    """
+    return ScoreHistoryService(db).compact(retention_days)
+
+
 @router.get("/{contact_id}", response_model=ContactResponse)
 def get_contact(contact_id: int, db: Session = Depends(get_db)):
     """Get a specific contact by ID."""
@@ -139,10 +179,10 @@ def update_contact(
     db.commit()
     db.refresh(contact)
     
-    # Recalculate intent score
+    # Recalculate intent score if a field the rules read changed
     intent_scorer = IntentScoringService(db)
-    intent_scorer.recalculate_score(contact_id)
-    db.refresh(contact)
+    if intent_scorer.rescore_if_changed(contact) is not None:
+        db.refresh(contact)
     
     return contact
 
@@ -166,6 +206,19 @@ async def enrich_contact(contact_id: int, db: Session = Depends(get_db)):
     return result
 
 
+@router.get("/{contact_id}/intent-history", response_model=IntentHistoryResponse)
+def get_intent_history(
+    contact_id: int,
+    days: Optional[int] = Query(None, ge=1),
+    db: Session = Depends(get_db)
+):
+    """Get a contact's current intent score and its daily score history."""
+    try:
+        return ScoreHistoryService(db).history(contact_id, days)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+
+
 @router.post("/{contact_id}/recalculate-intent")
 def recalculate_intent(contact_id: int, db: Session = Depends(get_db)):
     """Recalculate intent score for a contact."""
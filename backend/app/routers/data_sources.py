@@ -1,42 +1,64 @@
 """Data source API routes (SerpAPI and CSV upload)."""
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
+import logging
+import os
+import tempfile
+import traceback
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+from typing import List, Optional
 
-from app.database import get_db
+from app.config import get_settings
+from app.database import get_db, SessionLocal
 from app.schemas.data_sources import (
     SerpAPISearchRequest,
     SerpAPISearchResponse,
-    CSVUploadResponse
+    SerpAPIPagedSearchRequest,
+    SerpAPIPagedSearchResponse,
+    SerpAPIBatchSearchRequest,
+    SerpAPIBatchProgress,
+    SerpAPIBatchSummary,
+    SerpAPICacheStats,
+    SerpAPIUsageResponse,
+    SerpAPIPayloadCompactionResponse,
+    CSVImportJobResponse
 )
 from app.services.serpapi_service import SerpAPIService
+from app.services.serpapi_cache import get_cache_stats
+from app.services.serpapi_payload_store import SerpAPIPayloadStore
+from app.services.serpapi_quota import SerpAPIQuotaService, SerpAPIQuotaExceeded
 from app.services.csv_service import CSVService
+from app.services.csv_import_jobs import CSVImportJobService
+from app.services.csv_import_worker import csv_import_worker
+from app.services.ingest_readers import INGEST_READERS, ingest_format
 from app.services.intent_scorer import IntentScoringService
 
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
 router = APIRouter(prefix="/data-sources", tags=["data-sources"])
 
 
 @router.post("/serpapi/search", response_model=SerpAPISearchResponse)
-def search_serpapi(
+async def search_serpapi(
     request: SerpAPISearchRequest,
     db: Session = Depends(get_db)
 ):
     """
     Search Google via SerpAPI and import results as contacts.
     """
-    import logging
-    import traceback
-    logger = logging.getLogger(__name__)
-    
     try:
         logger.info(f"[SerpAPI] Starting search with query: {request.query}")
         
         serpapi_service = SerpAPIService(db)
         logger.info("[SerpAPI] Service initialized")
         
-        result = serpapi_service.search_and_import(
+        result = await serpapi_service.search_and_import_async(
             query=request.query,
             location=request.location,
-            num_results=request.num_results
+            num_results=request.num_results,
+            force_refresh=request.force_refresh
         )
         logger.info(f"[SerpAPI] Search completed: {result}")
         
@@ -46,7 +68,7 @@ def search_serpapi(
         
         logger.info("[SerpAPI] Starting to score unscored contacts")
         try:
-            scored_count = intent_scorer.score_all_unscored_contacts()
+            scored_count = await run_in_threadpool(intent_scorer.score_all_unscored_contacts)
             logger.info(f"[SerpAPI] Successfully scored {scored_count} contacts")
         except Exception as scoring_error:
             logger.error(f"[SerpAPI] Error scoring contacts: {type(scoring_error).__name__}: {str(scoring_error)}")
@@ -55,6 +77,9 @@ def search_serpapi(
         
         logger.info("[SerpAPI] Returning response")
         return SerpAPISearchResponse(**result)
+    except SerpAPIQuotaExceeded as e:
+        logger.warning(f"[SerpAPI] Rejected: {str(e)}")
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
     except ValueError as e:
         logger.error(f"[SerpAPI] ValueError: {str(e)}")
         raise HTTPException(status_code=400, detail=str(e))
@@ -64,49 +89,246 @@ def search_serpapi(
         raise HTTPException(status_code=500, detail=f"SerpAPI search failed: {str(e)}")
 
 
-@router.post("/csv/upload", response_model=CSVUploadResponse)
-async def upload_csv(
-    file: UploadFile = File(...),
+@router.post("/serpapi/search/pages", response_model=SerpAPIPagedSearchResponse)
+async def search_serpapi_pages(
+    request: SerpAPIPagedSearchRequest,
     db: Session = Depends(get_db)
 ):
     """
-    Upload and import contacts from CSV file.
+    Walk several SerpAPI result pages and import each page as it arrives.
+    
+    Each page is committed on its own. If a later page fails, the pages
+    already imported are kept and reported along with the error.
     """
-    # Validate file type
-    if not file.filename.endswith('.csv'):
-        raise HTTPException(status_code=400, detail="File must be a CSV")
+    if request.page_size < 1 or request.max_results < 1:
+        raise HTTPException(status_code=400, detail="page_size and max_results must be positive")
+    
+    serpapi_service = SerpAPIService(db)
+    pages = []
+    error = None
     
     try:
-        # Read file content
-        content = await file.read()
-        
-        # Process CSV
-        csv_service = CSVService(db)
-        result = csv_service.upload_and_import(content, file.filename)
-        
-        # Calculate intent scores for imported contacts
-        intent_scorer = IntentScoringService(db)
-        intent_scorer.score_all_unscored_contacts()
-        
-        return CSVUploadResponse(**result)
+        async for page in serpapi_service.search_and_import_pages(
+            query=request.query,
+            location=request.location,
+            max_results=min(request.max_results, settings.serpapi_max_paged_results),
+            page_size=request.page_size,
+            force_refresh=request.force_refresh
+        ):
+            logger.info(f"[SerpAPI] Imported page {page['page']}: {page}")
+            pages.append(page)
+    except SerpAPIQuotaExceeded as e:
+        if not pages:
+            raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+        error = str(e)
     except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        if not pages:
+            raise HTTPException(status_code=400, detail=str(e))
+        error = str(e)
     except Exception as e:
-        raise HTTPException(status_code=500, detail=f"CSV upload failed: {str(e)}")
+        logger.error(f"[SerpAPI] Paged search failed: {type(e).__name__}: {str(e)}")
+        logger.error(f"[SerpAPI] Traceback: {traceback.format_exc()}")
+        if not pages:
+            raise HTTPException(status_code=500, detail=f"SerpAPI search failed: {str(e)}")
+        error = str(e)
+    
+    return SerpAPIPagedSearchResponse(
+        query=request.query,
+        pages_fetched=len(pages),
+        results_count=sum(page["results_count"] for page in pages),
+        contacts_created=sum(page["contacts_created"] for page in pages),
+        contacts_updated=sum(page["contacts_updated"] for page in pages),
+        pages=pages,
+        error=error
+    )
+
+
+@router.post("/serpapi/batch")
+def batch_search_serpapi(request: SerpAPIBatchSearchRequest):
+    """
+    Run many SerpAPI searches concurrently and import the results.
+    
+    Streams newline-delimited JSON: one progress event per search as it
+    is imported, followed by a summary event.
+    """
+    searches = request.expand()
+    if not searches:
+        raise HTTPException(status_code=400, detail="At least one query is required")
+    if len(searches) > settings.serpapi_batch_max_searches:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Batch expands to {len(searches)} searches; the limit is {settings.serpapi_batch_max_searches}"
+        )
+    if not settings.serpapi_api_key:
+        raise HTTPException(status_code=400, detail="SERPAPI_API_KEY not configured")
+    
+    concurrency = min(
+        request.concurrency or settings.serpapi_batch_concurrency,
+        settings.serpapi_batch_max_concurrency
+    )
+    
+    def stream_events():
+        # The request-scoped session is closed before a streaming body is
+        # sent, so the batch owns its own session.
+        db = SessionLocal()
+        try:
+            serpapi_service = SerpAPIService(db)
+            for event in serpapi_service.batch_search_and_import(
+                searches,
+                num_results=request.num_results,
+                concurrency=max(concurrency, 1),
+                force_refresh=request.force_refresh
+            ):
+                schema = SerpAPIBatchSummary if event["type"] == "summary" else SerpAPIBatchProgress
+                yield schema(**event).model_dump_json() + "\n"
+        finally:
+            db.close()
+    
+    return StreamingResponse(stream_events(), media_type="application/x-ndjson")
+
+
+@router.get("/serpapi/cache/stats", response_model=SerpAPICacheStats)
+def serpapi_cache_stats():
+    """Get SerpAPI response cache hit/miss counters."""
+    return SerpAPICacheStats(**get_cache_stats())
+
+
+@router.get("/serpapi/usage", response_model=SerpAPIUsageResponse)
+def serpapi_usage(
+    prefix_words: int = Query(1, ge=1, le=10),
+    db: Session = Depends(get_db)
+):
+    """
+    Get SerpAPI credit usage against the daily/monthly budgets.
+    
+    Month-to-date usage is grouped by the first ``prefix_words`` words
+    of the normalized query.
+    """
+    quota_service = SerpAPIQuotaService(db)
+    return SerpAPIUsageResponse(**quota_service.get_usage(prefix_words))
+
+
+@router.post("/serpapi/payloads/compact", response_model=SerpAPIPayloadCompactionResponse)
+def compact_serpapi_payloads(
+    retention_days: Optional[int] = Query(None, ge=0),
+    db: Session = Depends(get_db)
+):
+    """
+    Compress legacy raw responses and prune old ones.
+    
+    Search records are kept; only raw responses older than
+    ``retention_days`` (default ``SERPAPI_RAW_RETENTION_DAYS``) are dropped.
+    """
+    payload_store = SerpAPIPayloadStore(db)
+    return SerpAPIPayloadCompactionResponse(**payload_store.compact(retention_days))
+
+
+# Bytes copied from an upload to its spool file per read
+UPLOAD_READ_SIZE = 1024 * 1024
+
+
+def _check_upload_format(file: UploadFile) -> str:
+    """The upload's format suffix; 400 if no ingest reader handles it."""
+    file_format = ingest_format(file.filename)
+    if file_format is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type, expected one of: {', '.join(INGEST_READERS)}"
+        )
+    return file_format
+
+
+async def _spool_upload(file: UploadFile, suffix: str) -> str:
+    """Copy an upload to a temporary file in fixed-size reads and return its path."""
+    spool = tempfile.NamedTemporaryFile(
+        prefix="csv-upload-",
+        suffix=suffix,
+        dir=settings.csv_upload_spool_dir or None,
+        delete=False
+    )
+    try:
+        with spool:
+            while chunk := await file.read(UPLOAD_READ_SIZE):
+                spool.write(chunk)
+    except Exception:
+        os.unlink(spool.name)
+        raise
+    return spool.name
+
+
+@router.post("/csv/upload", response_model=CSVImportJobResponse, status_code=202)
+async def upload_csv(
+    file: UploadFile = File(...),
+    force: bool = Query(False, description="Import every row even if this file was uploaded before"),
+    db: Session = Depends(get_db)
+):
+    """
+    Upload a contact file and queue its import.
+    
+    Accepts CSV, gzip CSV, JSONL, Parquet and Arrow files (see
+    ``INGEST_READERS``); all are mapped and imported the same way.
+    
+    The upload is spooled to disk and imported in chunks by the background
+    import worker; poll ``/csv/jobs/{job_id}`` for progress. Re-uploading
+    a file that is already queued or imported returns the existing job,
+    and a file with rows appended to an earlier upload only imports the
+    new rows (see ``rows_unchanged``).
+    """
+    file_format = _check_upload_format(file)
+    path = await _spool_upload(file, file_format)
+    try:
+        # Hashing the upload and looking up earlier jobs is blocking
+        job = await run_in_threadpool(CSVImportJobService(db).create, path, file.filename, force=force)
+    except Exception:
+        if os.path.exists(path):
+            os.unlink(path)
+        raise
+    csv_import_worker.notify()
+    return job
+
+
+@router.get("/csv/jobs", response_model=List[CSVImportJobResponse])
+def list_csv_import_jobs(
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """List recent CSV import jobs, newest first."""
+    return CSVImportJobService(db).list_recent(limit)
+
+
+@router.get("/csv/jobs/{job_id}", response_model=CSVImportJobResponse)
+def get_csv_import_job(job_id: int, db: Session = Depends(get_db)):
+    """Get a CSV import job's status and progress."""
+    job = CSVImportJobService(db).get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
+
+
+@router.post("/csv/jobs/{job_id}/retry", response_model=CSVImportJobResponse)
+def retry_csv_import_job(job_id: int, db: Session = Depends(get_db)):
+    """Queue a failed import again; it resumes after its last committed chunk."""
+    job_service = CSVImportJobService(db)
+    if not job_service.get(job_id):
+        raise HTTPException(status_code=404, detail="Import job not found")
+    try:
+        job = job_service.retry(job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    csv_import_worker.notify()
+    return job
 
 
 @router.post("/csv/preview")
 async def preview_csv(file: UploadFile = File(...)):
     """
-    Preview CSV file before import.
+    Preview an upload before import.
     """
-    if not file.filename.endswith('.csv'):
-        raise HTTPException(status_code=400, detail="File must be a CSV")
+    _check_upload_format(file)
     
     try:
-        content = await file.read()
         csv_service = CSVService(None)  # No DB needed for preview
-        result = csv_service.get_csv_preview(content)
+        result = csv_service.get_csv_preview(file.file, filename=file.filename)
         return result
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
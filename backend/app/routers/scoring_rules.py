@@ -0,0 +1,111 @@
+"""Scoring rule set API routes."""
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.database import get_db
+from app.models.scoring_rule_set import ScoringRuleSet
+from app.schemas.scoring_rules import (
+    ScoringRuleSetCreate,
+    ScoringRuleSetResponse,
+    ScoringRuleSetListResponse,
+    ActiveScoringRulesResponse,
+    ScoringRuleSetActivationResponse,
+    RelabelPreviewResponse,
+    RelabelResponse
+)
+from app.services.intent_scorer import IntentScoringService
+from app.services.rule_rollout_worker import rule_rollout_worker
+from app.services.rule_set_service import RuleSetService
+from app.services.score_relabel import ScoreRelabelService
+from app.services.scoring_rules import ScoringRules, scoring_rules
+
+router = APIRouter(prefix="/scoring-rules", tags=["scoring-rules"])
+
+
+@router.get("/", response_model=ScoringRuleSetListResponse)
+def list_rule_sets(db: Session = Depends(get_db)):
+    """List stored rule sets, newest first."""
+    rule_sets = db.query(ScoringRuleSet).order_by(ScoringRuleSet.id.desc()).all()
+    return ScoringRuleSetListResponse(
+        total=len(rule_sets),
+        rule_sets=rule_sets
+    )
+
+
+@router.get("/active", response_model=ActiveScoringRulesResponse)
+def get_active_rules():
+    """Get the rules currently used for scoring."""
+    rules = scoring_rules.current()
+    return ActiveScoringRulesResponse(
+        rule_set_id=rules.rule_set_id,
+        version=rules.version,
+        rule_version=IntentScoringService.compute_rule_version(rules),
+        **rules.to_dict()
+    )
+
+
+@router.get("/thresholds/preview", response_model=RelabelPreviewResponse)
+def preview_thresholds(
+    high_threshold: float = Query(..., ge=0, le=1),
+    medium_threshold: float = Query(..., ge=0, le=1),
+    db: Session = Depends(get_db)
+):
+    """Count contacts that would move between LOW/MEDIUM/HIGH under new thresholds."""
+    try:
+        return ScoreRelabelService(db).preview(high_threshold, medium_threshold)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/thresholds/relabel", response_model=RelabelResponse)
+def relabel_scores(
+    previous_high_threshold: float = Query(..., ge=0, le=1),
+    previous_medium_threshold: float = Query(..., ge=0, le=1),
+    db: Session = Depends(get_db)
+):
+    """Relabel stored scores in SQL after the configured thresholds changed."""
+    try:
+        return ScoreRelabelService(db).relabel(previous_high_threshold, previous_medium_threshold)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.post("/", response_model=ScoringRuleSetResponse, status_code=201)
+def create_rule_set(rule_set_data: ScoringRuleSetCreate, db: Session = Depends(get_db)):
+    """Store a new rule set version; it takes effect once activated."""
+    try:
+        return RuleSetService(db).create(**rule_set_data.model_dump())
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/{rule_set_id}", response_model=ScoringRuleSetResponse)
+def get_rule_set(rule_set_id: int, db: Session = Depends(get_db)):
+    """Get a rule set and the progress of its rescore after activation."""
+    rule_set = db.get(ScoringRuleSet, rule_set_id)
+    if not rule_set:
+        raise HTTPException(status_code=404, detail=f"Rule set {rule_set_id} not found")
+    return rule_set
+
+
+@router.post("/{rule_set_id}/activate", response_model=ScoringRuleSetActivationResponse, status_code=202)
+async def activate_rule_set(rule_set_id: int, db: Session = Depends(get_db)):
+    """
+    Activate a rule set and queue a rescore of the contacts whose score it changes.
+    
+    Returns right away; the rescore runs in the background and its progress
+    is on ``GET /scoring-rules/{rule_set_id}``.
+    """
+    try:
+        rule_set = await run_in_threadpool(RuleSetService(db).activate, rule_set_id)
+    except ValueError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    rule_rollout_worker.notify()
+    return ScoringRuleSetActivationResponse(
+        rule_set_id=rule_set.id,
+        version=rule_set.version,
+        rule_version=IntentScoringService.compute_rule_version(ScoringRules.from_model(rule_set)),
+        rollout_status=rule_set.rollout_status,
+        rollout_from_version=rule_set.rollout_from_version
+    )
@@ -0,0 +1,124 @@
+"""Search watchlist API routes."""
+import logging
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from app.database import get_db
+from app.models.search_watchlist import SearchWatchlist
+from app.models.serpapi_search import SerpAPISearch
+from app.schemas.watchlist import (
+    WatchlistCreate,
+    WatchlistUpdate,
+    WatchlistResponse,
+    WatchlistListResponse,
+    WatchlistRunResponse,
+    WatchlistRunHistoryItem,
+    WatchlistRunHistoryResponse
+)
+from app.services.serpapi_quota import SerpAPIQuotaExceeded
+from app.services.watchlist_service import WatchlistService
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/watchlists", tags=["watchlists"])
+
+
+def _get_watchlist(db: Session, watchlist_id: int) -> SearchWatchlist:
+    watchlist = db.query(SearchWatchlist).filter(SearchWatchlist.id == watchlist_id).first()
+    if not watchlist:
+        raise HTTPException(status_code=404, detail="Watchlist not found")
+    return watchlist
+
+
+@router.get("/", response_model=WatchlistListResponse)
+def list_watchlists(db: Session = Depends(get_db)):
+    """List all saved watchlists."""
+    watchlists = db.query(SearchWatchlist).order_by(SearchWatchlist.id).all()
+    return WatchlistListResponse(
+        total=len(watchlists),
+        watchlists=watchlists
+    )
+
+
+@router.get("/{watchlist_id}", response_model=WatchlistResponse)
+def get_watchlist(watchlist_id: int, db: Session = Depends(get_db)):
+    """Get a specific watchlist."""
+    return _get_watchlist(db, watchlist_id)
+
+
+@router.post("/", response_model=WatchlistResponse, status_code=201)
+def create_watchlist(
+    watchlist_data: WatchlistCreate,
+    db: Session = Depends(get_db)
+):
+    """Create a watchlist; its first run is due immediately."""
+    watchlist = SearchWatchlist(**watchlist_data.model_dump())
+    db.add(watchlist)
+    db.commit()
+    db.refresh(watchlist)
+    return watchlist
+
+
+@router.put("/{watchlist_id}", response_model=WatchlistResponse)
+def update_watchlist(
+    watchlist_id: int,
+    watchlist_data: WatchlistUpdate,
+    db: Session = Depends(get_db)
+):
+    """Update a watchlist."""
+    watchlist = _get_watchlist(db, watchlist_id)
+    
+    for field, value in watchlist_data.model_dump(exclude_unset=True).items():
+        setattr(watchlist, field, value)
+    
+    db.commit()
+    db.refresh(watchlist)
+    return watchlist
+
+
+@router.delete("/{watchlist_id}", status_code=204)
+def delete_watchlist(watchlist_id: int, db: Session = Depends(get_db)):
+    """Delete a watchlist (its past searches are kept)."""
+    watchlist = _get_watchlist(db, watchlist_id)
+    db.query(SerpAPISearch).filter(
+        SerpAPISearch.watchlist_id == watchlist_id
+    ).update({SerpAPISearch.watchlist_id: None}, synchronize_session=False)
+    db.delete(watchlist)
+    db.commit()
+
+
+@router.post("/{watchlist_id}/run", response_model=WatchlistRunResponse)
+def run_watchlist(watchlist_id: int, db: Session = Depends(get_db)):
+    """Run a watchlist now and import only results it hasn't seen before."""
+    watchlist = _get_watchlist(db, watchlist_id)
+    try:
+        return WatchlistService(db).run_watchlist(watchlist)
+    except SerpAPIQuotaExceeded as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": str(e.retry_after)})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.get("/{watchlist_id}/runs", response_model=WatchlistRunHistoryResponse)
+def list_watchlist_runs(
+    watchlist_id: int,
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """List the most recent runs of a watchlist."""
+    _get_watchlist(db, watchlist_id)
+    searches = db.query(SerpAPISearch).filter(
+        SerpAPISearch.watchlist_id == watchlist_id
+    ).order_by(SerpAPISearch.searched_at.desc()).limit(limit).all()
+    
+    return WatchlistRunHistoryResponse(
+        watchlist_id=watchlist_id,
+        runs=[
+            WatchlistRunHistoryItem(
+                search_id=search.id,
+                results_count=search.results_count or 0,
+                searched_at=search.searched_at
+            )
+            for search in searches
+        ]
+    )
@@ -1,7 +1,7 @@
 """Pydantic schemas for Contact API."""
-from pydantic import BaseModel, EmailStr, ConfigDict
+from pydantic import BaseModel, EmailStr, ConfigDict, Field
 from typing import Optional
-from datetime import datetime
+from datetime import date, datetime
 
 
 class ContactBase(BaseModel):
@@ -39,33 +39,67 @@ class ContactUpdate(BaseModel):
 
 
 class IntentScoreSchema(BaseModel):
-    """Schema for intent score."""
+    """Schema for intent score (score and score_value include recency as of now)."""
     id: int
     contact_id: int
-    score: str
-    score_value: float
-    signals: Optional[dict] = None
+    score: str = Field(validation_alias="current_score")
+    score_value: float = Field(validation_alias="current_score_value")
+    base_score_value: Optional[float] = None
+    signals: Optional[dict] = Field(None, validation_alias="readable_signals")
     calculated_at: datetime
     
     model_config = ConfigDict(from_attributes=True)
 
 
-class ContactResponse(ContactBase):
-    """Schema for contact response."""
+class ContactSummary(ContactBase):
+    """Schema for contacts in lists (current intent read from the contact row)."""
     id: int
     source: Optional[str] = None
     enriched_data: Optional[dict] = None
     enriched_at: Optional[datetime] = None
     created_at: datetime
     updated_at: datetime
-    intent_scores: list[IntentScoreSchema] = []
+    intent_level: Optional[str] = None
+    intent_score_value: Optional[float] = None
     
     model_config = ConfigDict(from_attributes=True)
 
 
+class ContactResponse(ContactSummary):
+    """Schema for contact response."""
+    intent_scores: list[IntentScoreSchema] = []
+
+
+class IntentScoreRollupSchema(BaseModel):
+    """Schema for one day of superseded intent scores."""
+    day: date
+    first_label: str
+    last_label: str
+    transitions: int
+    min_score_value: float
+    max_score_value: float
+    last_score_value: float
+    score_count: int
+
+
+class IntentHistoryResponse(BaseModel):
+    """Schema for a contact's current intent score and daily history."""
+    contact_id: int
+    current: Optional[IntentScoreSchema] = None
+    days: list[IntentScoreRollupSchema] = []
+
+
+class IntentHistoryCompactionResponse(BaseModel):
+    """Schema for intent score history compaction results."""
+    contacts: int
+    scores_compacted: int
+    rollups_written: int
+    rollups_pruned: int
+
+
 class ContactListResponse(BaseModel):
     """Schema for paginated contact list."""
     total: int
     page: int
     page_size: int
-    contacts: list[ContactResponse]
+    contacts: list[ContactSummary]
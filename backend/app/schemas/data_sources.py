@@ -1,6 +1,7 @@
 """Pydantic schemas for data source operations."""
-from pydantic import BaseModel
-from typing import Optional, List
+from datetime import datetime
+from pydantic import BaseModel, ConfigDict
+from typing import Optional, List, Tuple
 
 
 class SerpAPISearchRequest(BaseModel):
@@ -8,6 +9,7 @@ class SerpAPISearchRequest(BaseModel):
     query: str
     location: Optional[str] = None
     num_results: int = 10
+    force_refresh: bool = False  # Skip the response cache
 
 
 class SerpAPISearchResponse(BaseModel):
@@ -16,15 +18,152 @@ class SerpAPISearchResponse(BaseModel):
     query: str
     results_count: int
     contacts_created: int
+    contacts_updated: int = 0
+    cached: bool = False
 
 
-class CSVUploadResponse(BaseModel):
-    """Schema for CSV upload response."""
+class SerpAPIPagedSearchRequest(BaseModel):
+    """Schema for multi-page SerpAPI search request."""
+    query: str
+    location: Optional[str] = None
+    max_results: int = 100  # Cap on organic results walked across pages
+    page_size: int = 10
+    force_refresh: bool = False
+
+
+class SerpAPIPageResult(BaseModel):
+    """Schema for the import stats of one result page."""
+    page: int
+    start: int
+    search_id: int
+    results_count: int
+    contacts_created: int
+    contacts_updated: int = 0
+    contacts_scored: int
+    cached: bool = False
+
+
+class SerpAPIPagedSearchResponse(BaseModel):
+    """Schema for multi-page SerpAPI search response."""
+    query: str
+    pages_fetched: int
+    results_count: int
+    contacts_created: int
+    contacts_updated: int = 0
+    pages: List[SerpAPIPageResult] = []
+    error: Optional[str] = None  # Set when a page failed after earlier pages were imported
+
+
+class SerpAPIBatchSearchRequest(BaseModel):
+    """Schema for batch SerpAPI search request.
+    
+    When ``locations`` is given, every query is run once per location
+    (a query x location grid).
+    """
+    queries: List[str]
+    locations: Optional[List[str]] = None
+    num_results: int = 10
+    concurrency: Optional[int] = None
+    force_refresh: bool = False
+    
+    def expand(self) -> List[Tuple[str, Optional[str]]]:
+        """Expand the request into (query, location) pairs."""
+        queries = [q.strip() for q in self.queries if q and q.strip()]
+        if not self.locations:
+            return [(query, None) for query in queries]
+        locations = [l.strip() for l in self.locations if l and l.strip()]
+        return [(query, location) for query in queries for location in locations]
+
+
+class SerpAPIBatchProgress(BaseModel):
+    """Schema for one streamed batch progress event."""
+    type: str = "progress"
+    query: str
+    location: Optional[str] = None
+    status: str  # ok, error
+    completed: int
+    total: int
+    search_id: Optional[int] = None
+    results_count: int = 0
+    contacts_created: int = 0
+    contacts_updated: int = 0
+    cached: bool = False
+    error: Optional[str] = None
+
+
+class SerpAPIBatchSummary(BaseModel):
+    """Schema for the final streamed batch summary event."""
+    type: str = "summary"
+    total: int
+    succeeded: int
+    failed: int
+    results_count: int
+    contacts_created: int
+    contacts_updated: int
+    contacts_scored: int
+    elapsed_seconds: float
+
+
+class SerpAPICacheStats(BaseModel):
+    """Schema for SerpAPI response cache counters."""
+    memory_hits: int
+    db_hits: int
+    misses: int
+    hit_rate: float
+    memory_entries: int
+    ttl_seconds: int
+
+
+class SerpAPIUsageByPrefix(BaseModel):
+    """Schema for usage grouped by query prefix."""
+    prefix: str
+    searches: int
+    credits: int
+
+
+class SerpAPIUsageResponse(BaseModel):
+    """Schema for SerpAPI credit usage (budgets are None when unlimited)."""
+    daily_used: int
+    daily_budget: Optional[int] = None
+    daily_remaining: Optional[int] = None
+    monthly_used: int
+    monthly_budget: Optional[int] = None
+    monthly_remaining: Optional[int] = None
+    by_prefix: List[SerpAPIUsageByPrefix] = []
+
+
+class SerpAPIPayloadCompactionResponse(BaseModel):
+    """Schema for raw response compaction stats."""
+    migrated: int
+    pruned: int
+    payloads_deleted: int
+    bytes_freed: int
+
+
+class CSVImportJobResponse(BaseModel):
+    """Schema for a background CSV import job and its progress."""
+    id: int
     filename: str
-    total_rows: int
-    imported_contacts: int
-    skipped_rows: int
+    status: str  # 'pending', 'running', 'failed', 'completed'
+    chunk_size: int
+    chunks_done: int
+    rows_processed: int
+    contacts_imported: int
+    rows_skipped: int
+    contacts_scored: int
+    rows_unchanged: int = 0  # Rows of the base job's file, not imported again
+    base_job_id: Optional[int] = None  # Earlier import of the file this upload extends
+    content_sha256: Optional[str] = None
+    rows_per_second: Optional[float] = None
+    peak_memory_mb: Optional[float] = None  # Peak resident memory of the importing process
     errors: List[str] = []
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    heartbeat_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ExportRequest(BaseModel):
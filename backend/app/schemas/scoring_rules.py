@@ -0,0 +1,83 @@
+"""Pydantic schemas for scoring rule set API."""
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+
+class ScoringRuleSetBase(BaseModel):
+    """Base scoring rule set schema."""
+    description: Optional[str] = None
+    keywords: Dict[str, List[str]]
+    weights: Dict[str, float]
+    recency_boost: float = Field(0.2, ge=0)
+    source_boost: float = Field(0.1, ge=0)
+
+
+class ScoringRuleSetCreate(ScoringRuleSetBase):
+    """Schema for creating a scoring rule set."""
+    pass
+
+
+class ScoringRuleSetResponse(ScoringRuleSetBase):
+    """Schema for scoring rule set response."""
+    id: int
+    version: str
+    is_active: bool
+    activated_at: Optional[datetime] = None
+    created_at: datetime
+    rollout_status: Optional[str] = None  # Rescore after activation: pending, running, completed, failed, superseded
+    rollout_from_version: Optional[str] = None
+    rollout_stats: Optional[Dict[str, Any]] = None  # changed_keywords, scanned, rescored, version_bumped, full_rescore
+    rollout_error: Optional[str] = None
+    rollout_started_at: Optional[datetime] = None
+    rollout_completed_at: Optional[datetime] = None
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ScoringRuleSetListResponse(BaseModel):
+    """Schema for scoring rule set list."""
+    total: int
+    rule_sets: list[ScoringRuleSetResponse]
+
+
+class ActiveScoringRulesResponse(BaseModel):
+    """Schema for the rules currently in effect."""
+    rule_set_id: Optional[int] = None  # None while the built-in defaults apply
+    version: str
+    rule_version: str
+    keywords: Dict[str, List[str]]
+    weights: Dict[str, float]
+    recency_boost: float
+    source_boost: float
+
+
+class ScoringRuleSetActivationResponse(BaseModel):
+    """Schema for an activated rule set; poll the rule set for its rescore."""
+    rule_set_id: int
+    version: str
+    rule_version: str
+    rollout_status: str
+    rollout_from_version: str
+
+
+class LabelTransition(BaseModel):
+    """Number of contacts moving from one label to another."""
+    from_label: str = Field(validation_alias="from", serialization_alias="from")
+    to_label: str = Field(validation_alias="to", serialization_alias="to")
+    contacts: int
+
+
+class RelabelPreviewResponse(BaseModel):
+    """Schema for a threshold change preview."""
+    high_threshold: float
+    medium_threshold: float
+    transitions: list[LabelTransition]
+    moved: int
+    total: int
+
+
+class RelabelResponse(BaseModel):
+    """Schema for the result of a relabel."""
+    relabeled: int
+    version_bumped: int
@@ -0,0 +1,71 @@
+"""Pydantic schemas for search watchlist API."""
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Optional
+from datetime import datetime
+
+
+class WatchlistBase(BaseModel):
+    """Base watchlist schema."""
+    name: str
+    query: str
+    location: Optional[str] = None
+    num_results: int = Field(10, ge=1, le=100)
+    cadence_hours: int = Field(72, ge=1)
+    is_active: bool = True
+
+
+class WatchlistCreate(WatchlistBase):
+    """Schema for creating a watchlist."""
+    pass
+
+
+class WatchlistUpdate(BaseModel):
+    """Schema for updating a watchlist."""
+    name: Optional[str] = None
+    query: Optional[str] = None
+    location: Optional[str] = None
+    num_results: Optional[int] = Field(None, ge=1, le=100)
+    cadence_hours: Optional[int] = Field(None, ge=1)
+    is_active: Optional[bool] = None
+
+
+class WatchlistResponse(WatchlistBase):
+    """Schema for watchlist response."""
+    id: int
+    last_run_at: Optional[datetime] = None
+    next_run_at: datetime
+    last_error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+    
+    model_config = ConfigDict(from_attributes=True)
+
+
+class WatchlistListResponse(BaseModel):
+    """Schema for watchlist list."""
+    total: int
+    watchlists: list[WatchlistResponse]
+
+
+class WatchlistRunResponse(BaseModel):
+    """Schema for the result of one watchlist run."""
+    watchlist_id: int
+    search_id: int
+    results_count: int
+    new_results: int
+    contacts_created: int
+    contacts_updated: int
+    contacts_scored: int
+
+
+class WatchlistRunHistoryItem(BaseModel):
+    """Schema for a past watchlist run."""
+    search_id: int
+    results_count: int
+    searched_at: datetime
+
+
+class WatchlistRunHistoryResponse(BaseModel):
+    """Schema for a watchlist's run history."""
+    watchlist_id: int
+    runs: list[WatchlistRunHistoryItem]
@@ -0,0 +1,456 @@
+"""Column-wise batch intent scoring."""
+import logging
+import time
+import numpy as np
+import pandas as pd
+from datetime import datetime, timezone
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from app.config import get_settings
+from app.models.contact import Contact
+from app.models.intent_score import ContactKeyword, IntentScore
+from app.services.intent_scorer import IntentScoringService
+from app.services.scoring_rules import TIERS, ScoringRules, scoring_rules
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Columns read per contact, in the order ``score_rows`` expects them
+SCORING_COLUMNS = (
+    Contact.id,
+    Contact.company,
+    Contact.industry,
+    Contact.raw_data,
+    Contact.created_at,
+    Contact.source
+)
+
+
+class BatchIntentScorer:
+    """
+    Score many contacts at once with the same rules as ``IntentScoringService``.
+    
+    Only the columns the rules read are loaded, in keyset-paginated chunks.
+    Keywords are matched with the compiled single-pass matcher and the
+    score array is built up in the same order as ``calculate_intent`` adds
+    to its running total, so every score is bit-for-bit the same. Score
+    rows are written with one bulk insert per chunk.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def score_unscored(self, chunk_size: Optional[int] = None) -> int:
+        """
+        Calculate intent scores for all contacts without scores.
+        
+        Each chunk is committed on its own, so an interrupted run keeps the
+        scores already written and the next run picks up the rest.
+        
+        Args:
+            chunk_size: Contacts loaded and scored per chunk
+        
+        Returns:
+            Number of contacts scored
+        """
+        chunk_size = chunk_size or settings.intent_batch_chunk_size
+        now = datetime.now(timezone.utc)
+        rules = scoring_rules.current()
+        started = time.perf_counter()
+        
+        scored_count = 0
+        last_id = 0
+        while True:
+            rows = self.db.query(*SCORING_COLUMNS).filter(
+                Contact.id > last_id,
+                ~Contact.intent_scores.any()
+            ).order_by(Contact.id).limit(chunk_size).all()
+            if not rows:
+                break
+            
+            self._write(rows, self.searchable_texts(rows), now, rules)
+            self.db.commit()
+            
+            last_id = rows[-1][0]
+            scored_count += len(rows)
+            logger.info(f"[IntentScorer] Batch scored {scored_count} contacts")
+        
+        if scored_count:
+            elapsed = time.perf_counter() - started
+            logger.info(f"[IntentScorer] Scored {scored_count} contacts in {elapsed:.2f}s")
+        return scored_count
+    
+    def rescore_stale(self, chunk_size: Optional[int] = None) -> Dict[str, int]:
+        """
+        Rescore contacts whose scoring inputs or rule version changed.
+        
+        Every contact's fingerprint is recomputed from its text columns
+        (cheap, no scoring); only contacts where it differs from the
+        stored one, or that were scored under other rules, get a new
+        score. Each chunk is committed on its own.
+        
+        Contacts scored before the current score was materialized on
+        ``contacts`` are filled in first (see ``materialize_current_scores``).
+        
+        Args:
+            chunk_size: Contacts scanned per chunk
+        
+        Returns:
+            Dictionary with ``materialized``, ``scanned`` and ``rescored`` counts
+        """
+        chunk_size = chunk_size or settings.intent_batch_chunk_size
+        now = datetime.now(timezone.utc)
+        rules = scoring_rules.current()
+        rule_version = IntentScoringService.compute_rule_version(rules)
+        
+        stats = {"materialized": self.materialize_current_scores(), "scanned": 0, "rescored": 0}
+        last_id = 0
+        while True:
+            rows = self.db.query(
+                *SCORING_COLUMNS, Contact.score_fingerprint, Contact.score_rule_version
+            ).filter(
+                Contact.id > last_id
+            ).order_by(Contact.id).limit(chunk_size).all()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            stats["scanned"] += len(rows)
+            
+            stale_rows, stale_texts = self._stale(rows, self.searchable_texts(rows), rule_version)
+            if not stale_rows:
+                continue
+            
+            self._write(stale_rows, stale_texts, now, rules)
+            self.db.commit()
+            stats["rescored"] += len(stale_rows)
+            logger.info(f"[IntentScorer] Rescored {stats['rescored']} of {stats['scanned']} contacts scanned")
+        
+        return stats
+    
+    def score_range(
+        self,
+        first_id: int,
+        last_id: int,
+        mode: str = "all",
+        now: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """
+        Score the contacts with IDs in ``[first_id, last_id]`` and commit.
+        
+        New scores supersede the existing ones (which are kept as history
+        until ``ScoreHistoryService.compact`` rolls them up), so running a
+        range twice is harmless.
+        
+        Args:
+            first_id: First contact ID of the range
+            last_id: Last contact ID of the range (inclusive)
+            mode: "all" rescores every contact, "stale" only those whose
+                inputs or rule version changed, "unscored" only contacts
+                without scores
+            now: Reference time for the recency boost (default: now)
+        
+        Returns:
+            Dictionary with ``scanned`` and ``scored`` counts
+        """
+        now = now or datetime.now(timezone.utc)
+        rules = scoring_rules.current()
+        rule_version = IntentScoringService.compute_rule_version(rules)
+        
+        query = self.db.query(
+            *SCORING_COLUMNS, Contact.score_fingerprint, Contact.score_rule_version
+        ).filter(
+            Contact.id >= first_id,
+            Contact.id <= last_id
+        )
+        if mode == "unscored":
+            query = query.filter(~Contact.intent_scores.any())
+        rows = query.order_by(Contact.id).all()
+        scanned = len(rows)
+        texts = self.searchable_texts(rows)
+        if mode == "stale":
+            rows, texts = self._stale(rows, texts, rule_version)
+        else:
+            rows = [row[:len(SCORING_COLUMNS)] for row in rows]
+        
+        if rows:
+            self._write(rows, texts, now, rules)
+            self.db.commit()
+        return {"scanned": scanned, "scored": len(rows)}
+    
+    def score_ids(
+        self,
+        contact_ids: Sequence[int],
+        chunk_size: Optional[int] = None,
+        commit: bool = True,
+        rules: Optional[ScoringRules] = None
+    ) -> int:
+        """
+        Rescore specific contacts, superseding their current scores.
+        
+        Args:
+            contact_ids: Contacts to rescore
+            chunk_size: Contacts loaded and scored per transaction
+            commit: Commit after each chunk; with False the scores are only
+                flushed, to be committed with the caller's transaction
+            rules: Rule set to score with (default: the active one). Callers
+                with uncommitted writes pass it in, as reloading the active
+                rules uses another connection
+        
+        Returns:
+            Number of contacts rescored
+        """
+        chunk_size = chunk_size or settings.intent_batch_chunk_size
+        now = datetime.now(timezone.utc)
+        rules = rules or scoring_rules.current()
+        contact_ids = sorted(set(contact_ids))
+        
+        rescored = 0
+        for offset in range(0, len(contact_ids), chunk_size):
+            rows = self.db.query(*SCORING_COLUMNS).filter(
+                Contact.id.in_(contact_ids[offset:offset + chunk_size])
+            ).order_by(Contact.id).all()
+            if rows:
+                self._write(rows, self.searchable_texts(rows), now, rules)
+                if commit:
+                    self.db.commit()
+            rescored += len(rows)
+        return rescored
+    
+    @staticmethod
+    def _stale(
+        rows: Sequence[Sequence[Any]],
+        texts: List[str],
+        rule_version: str
+    ) -> Tuple[List[Sequence[Any]], List[str]]:
+        """
+        Keep the rows whose fingerprint or rule version differs.
+        
+        Rows are ``SCORING_COLUMNS`` followed by the stored fingerprint and
+        rule version; the returned rows are trimmed to ``SCORING_COLUMNS``.
+        """
+        stale_rows = []
+        stale_texts = []
+        for row, text in zip(rows, texts):
+            if row[-1] != rule_version or row[-2] != IntentScoringService.fingerprint(text, row[5]):
+                stale_rows.append(row[:len(SCORING_COLUMNS)])
+                stale_texts.append(text)
+        return stale_rows, stale_texts
+    
+    def compact_legacy_signals(self, chunk_size: Optional[int] = None) -> Dict[str, int]:
+        """
+        Rewrite readable (legacy) signals in the compact keyword-id form.
+        
+        Matched keywords are mapped against the active rule set, falling
+        back to the built-in one; rows with a keyword neither knows are
+        left as they are (they are still readable and get superseded on the
+        next rescore). Each chunk is one bulk UPDATE.
+        
+        Args:
+            chunk_size: Scores read per chunk
+        
+        Returns:
+            Dictionary with ``scanned``, ``compacted`` and ``skipped`` counts
+        """
+        chunk_size = chunk_size or settings.intent_batch_chunk_size
+        candidates = [scoring_rules.current()]
+        if candidates[0].version != ScoringRules.defaults().version:
+            candidates.append(ScoringRules.defaults())
+        positions = [
+            (rules, {(tier, keyword): index for index, (tier, keyword) in enumerate(
+                (tier, keyword) for tier in TIERS for keyword in rules.keywords[tier]
+            )})
+            for rules in candidates
+        ]
+        
+        stats = {"scanned": 0, "compacted": 0, "skipped": 0}
+        last_id = 0
+        while True:
+            rows = self.db.query(IntentScore.id, IntentScore.signals).filter(
+                IntentScore.id > last_id
+            ).order_by(IntentScore.id).limit(chunk_size).all()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            stats["scanned"] += len(rows)
+            
+            compacted = []
+            for score_id, signals in rows:
+                if not signals or "matched_keywords" not in signals:
+                    continue
+                matched = [
+                    (tier, keyword)
+                    for tier in TIERS
+                    for keyword in (signals["matched_keywords"] or {}).get(tier, [])
+                ]
+                for rules, index_of in positions:
+                    if all(match in index_of for match in matched):
+                        compacted.append({
+                            "id": score_id,
+                            "signals": IntentScoringService.build_signals(
+                                sorted(index_of[match] for match in matched),
+                                bool(signals.get("recency_boost")),
+                                bool(signals.get("source_boost")),
+                                rules
+                            )
+                        })
+                        break
+                else:
+                    stats["skipped"] += 1
+            
+            if compacted:
+                self.db.execute(update(IntentScore), compacted)
+                self.db.commit()
+                stats["compacted"] += len(compacted)
+                logger.info(f"[IntentScorer] Compacted signals of {stats['compacted']} scores")
+        
+        return stats
+    
+    def materialize_current_scores(self) -> int:
+        """
+        Copy each contact's latest score onto ``contacts`` where it is missing.
+        
+        Only scores that store their base value can be materialized; contacts
+        with legacy scores only are left for the rescore to supersede.
+        
+        Returns:
+            Number of contacts updated
+        """
+        def latest(column):
+            return select(column).where(
+                IntentScore.contact_id == Contact.id,
+                IntentScore.base_score_value.is_not(None)
+            ).order_by(
+                IntentScore.calculated_at.desc(), IntentScore.id.desc()
+            ).limit(1).scalar_subquery()
+        
+        result = self.db.execute(
+            update(Contact).where(
+                Contact.intent_base_score.is_(None),
+                Contact.intent_scores.any(IntentScore.base_score_value.is_not(None))
+            ).values(
+                intent_base_score=latest(IntentScore.base_score_value),
+                intent_scored_at=latest(IntentScore.calculated_at)
+            ).execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        if result.rowcount:
+            logger.info(f"[IntentScorer] Materialized current scores for {result.rowcount} contacts")
+        return result.rowcount
+    
+    def _write(
+        self,
+        rows: Sequence[Sequence[Any]],
+        texts: List[str],
+        now: datetime,
+        rules: ScoringRules
+    ):
+        """
+        Bulk insert scores for a chunk and update the contacts' current
+        score, fingerprint and ContactKeyword index.
+        """
+        rule_version = IntentScoringService.compute_rule_version(rules)
+        scores = self.score_texts(rows, texts, now, rules)
+        ids = [row[0] for row in rows]
+        self.db.execute(insert(IntentScore), [{**score, "calculated_at": now} for score in scores])
+        self.db.query(ContactKeyword).filter(
+            ContactKeyword.contact_id.in_(ids)
+        ).delete(synchronize_session=False)
+        keyword_rows = [
+            {"contact_id": score["contact_id"], "keyword": keyword}
+            for score in scores
+            for keyword in rules.keywords_for(score["signals"]["keyword_ids"])
+        ]
+        if keyword_rows:
+            self.db.execute(insert(ContactKeyword), keyword_rows)
+        self.db.execute(update(Contact), [
+            {
+                "id": row[0],
+                "score_fingerprint": IntentScoringService.fingerprint(text, row[5]),
+                "score_rule_version": rule_version,
+                "intent_base_score": score["base_score_value"],
+                "intent_scored_at": now
+            }
+            for row, text, score in zip(rows, texts, scores)
+        ])
+    
+    @staticmethod
+    def searchable_texts(rows: Sequence[Sequence[Any]]) -> List[str]:
+        """Build the (not lowercased) searchable text of each row."""
+        return [
+            IntentScoringService.build_searchable_text(row[1], row[2], row[3])
+            for row in rows
+        ]
+    
+    @classmethod
+    def score_rows(
+        cls,
+        rows: Sequence[Sequence[Any]],
+        now: Optional[datetime] = None,
+        rules: Optional[ScoringRules] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Score a chunk of contacts.
+        
+        Args:
+            rows: Tuples of (id, company, industry, raw_data, created_at,
+                source), i.e. ``SCORING_COLUMNS``
+            now: Reference time for the recency boost (default: now)
+            rules: Rule set to score with (default: the active one)
+        
+        Returns:
+            IntentScore column dictionaries, one per row
+        """
+        return cls.score_texts(rows, cls.searchable_texts(rows), now, rules)
+    
+    @staticmethod
+    def score_texts(
+        rows: Sequence[Sequence[Any]],
+        texts: List[str],
+        now: Optional[datetime] = None,
+        rules: Optional[ScoringRules] = None
+    ) -> List[Dict[str, Any]]:
+        """Score a chunk of contacts whose searchable texts are already built."""
+        if not rows:
+            return []
+        now = now or datetime.now(timezone.utc)
+        rules = rules or scoring_rules.current()
+        ids = [row[0] for row in rows]
+        created_at = [row[4] for row in rows]
+        sources = [row[5] for row in rows]
+        
+        matcher = rules.matcher
+        keyword_ids = [matcher.find(text.lower()) for text in texts]
+        matches = [matcher.group(contact_keyword_ids) for contact_keyword_ids in keyword_ids]
+        
+        # Same addition order as calculate_intent: keywords, source, then
+        # recency. Adding 0.0 for a miss leaves a float unchanged.
+        base_score_values = np.array([matcher.score(contact_matches) for contact_matches in matches], dtype=float)
+        from_search = np.array([source == "serpapi" for source in sources], dtype=bool)
+        base_score_values = base_score_values + np.where(from_search, rules.source_boost, 0.0)
+        
+        recency_threshold = pd.Timestamp(IntentScoringService.recency_cutoff(now))
+        recent = (pd.to_datetime(pd.Series(created_at), utc=True) >= recency_threshold).to_numpy(dtype=bool)
+        score_values = base_score_values + np.where(recent, rules.recency_boost, 0.0)
+        
+        score_values = np.minimum(score_values, 1.0)
+        labels = np.where(
+            score_values >= settings.intent_high_threshold, "HIGH",
+            np.where(score_values >= settings.intent_medium_threshold, "MEDIUM", "LOW")
+        )
+        
+        scores = []
+        for index, contact_id in enumerate(ids):
+            scores.append({
+                "contact_id": contact_id,
+                "score": str(labels[index]),
+                "score_value": float(score_values[index]),
+                "base_score_value": float(base_score_values[index]),
+                "signals": IntentScoringService.build_signals(
+                    keyword_ids[index],
+                    bool(recent[index]),
+                    bool(from_search[index]),
+                    rules
+                )
+            })
+        return scores
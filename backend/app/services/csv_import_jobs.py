@@ -0,0 +1,296 @@
+"""Background CSV import jobs: queueing, claiming and resumable runs."""
+import hashlib
+import logging
+import os
+import time
+from datetime import datetime, timedelta, timezone
+import numpy as np
+import pandas as pd
+from sqlalchemy import and_, func, or_, update
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.csv_import_job import CSVImportJob
+from app.services.csv_service import CSVService, peak_memory_usage_mb
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Row errors kept on a job
+MAX_JOB_ERRORS = 10
+
+# Leading bytes hashed to find the earlier upload a file was appended to
+FINGERPRINT_HEAD_BYTES = 64 * 1024
+
+# Bytes hashed per read
+FINGERPRINT_READ_SIZE = 1024 * 1024
+
+
+def fingerprint_file(path: str) -> Tuple[int, str, str]:
+    """Size, SHA-256 and SHA-256 of the first FINGERPRINT_HEAD_BYTES of a file."""
+    with open(path, "rb") as f:
+        head = f.read(FINGERPRINT_HEAD_BYTES)
+        content = hashlib.sha256(head)
+        while block := f.read(FINGERPRINT_READ_SIZE):
+            content.update(block)
+        return f.tell(), content.hexdigest(), hashlib.sha256(head).hexdigest()
+
+
+def run_next_import(should_stop: Optional[Callable[[], bool]] = None) -> Optional[int]:
+    """Claim and run one queued import with a session of its own; returns its ID."""
+    db = SessionLocal()
+    try:
+        job_service = CSVImportJobService(db)
+        job = job_service.claim_next()
+        if job is None:
+            return None
+        job_service.run(job, should_stop)
+        return job.id
+    finally:
+        db.close()
+
+
+class CSVImportJobService:
+    """
+    Queue CSV imports and run them chunk by chunk.
+    
+    A job's checkpoint (``chunks_done`` and its counters) is written in the
+    same transaction as each chunk's contacts, so a job interrupted
+    mid-file resumes after its last committed chunk. Earlier chunks are
+    parsed again on resume but not written.
+    
+    Uploads are fingerprinted so the same file isn't imported twice: an
+    exact re-upload (same SHA-256) resolves to the job that already has
+    it, and a file with rows appended to an earlier upload gets that job
+    as its base. Each committed chunk records a fingerprint of its rows;
+    leading rows that match the base job's fingerprint for the same chunk
+    are counted as unchanged instead of being imported again, so only the
+    new tail is written.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def create(
+        self,
+        file_path: str,
+        filename: str,
+        chunk_size: Optional[int] = None,
+        force: bool = False
+    ) -> CSVImportJob:
+        """
+        Queue an import of a spooled upload, unless the same file is already queued or imported.
+        
+        Args:
+            file_path: Upload on disk; the job removes it once completed
+            filename: Name of uploaded file
+            chunk_size: Rows per chunk (default: CSV_IMPORT_CHUNK_SIZE, or
+                the base job's chunk size so its fingerprints line up)
+            force: Import every row, even if the file was uploaded before
+        
+        Returns:
+            Pending CSVImportJob, or the pending, running or completed job
+            of an identical earlier upload (whose spool file is then removed)
+        """
+        file_size, content_sha256, head_sha256 = fingerprint_file(file_path)
+        base_job = None
+        if not force:
+            duplicate = self.db.query(CSVImportJob).filter(
+                CSVImportJob.content_sha256 == content_sha256,
+                CSVImportJob.status != "failed"
+            ).order_by(CSVImportJob.id.desc()).first()
+            if duplicate:
+                self._remove_file(file_path)
+                logger.info(f"[CSV] {filename} is identical to import job {duplicate.id}, not importing it again")
+                return duplicate
+            
+            base_job = self.db.query(CSVImportJob).filter(
+                CSVImportJob.head_sha256 == head_sha256,
+                CSVImportJob.file_size < file_size,
+                CSVImportJob.status == "completed"
+            ).order_by(CSVImportJob.id.desc()).first()
+        
+        job = CSVImportJob(
+            filename=filename,
+            file_path=file_path,
+            file_size=file_size,
+            content_sha256=content_sha256,
+            head_sha256=head_sha256,
+            base_job_id=base_job.id if base_job else None,
+            status="pending",
+            chunk_size=chunk_size or (base_job.chunk_size if base_job else settings.csv_import_chunk_size),
+            chunks_done=0,
+            rows_processed=0,
+            contacts_imported=0,
+            rows_skipped=0,
+            contacts_scored=0,
+            rows_unchanged=0,
+            chunk_fingerprints=[],
+            errors=[]
+        )
+        self.db.add(job)
+        self.db.commit()
+        self.db.refresh(job)
+        if base_job:
+            logger.info(f"[CSV] Import job {job.id} ({filename}) extends job {base_job.id}")
+        return job
+    
+    def get(self, job_id: int) -> Optional[CSVImportJob]:
+        return self.db.get(CSVImportJob, job_id)
+    
+    def list_recent(self, limit: int = 20) -> List[CSVImportJob]:
+        return self.db.query(CSVImportJob).order_by(CSVImportJob.id.desc()).limit(limit).all()
+    
+    def retry(self, job_id: int) -> CSVImportJob:
+        """
+        Queue a failed job again; it resumes after its last committed chunk.
+        
+        Raises:
+            ValueError: If the job doesn't exist or hasn't failed
+        """
+        job = self.get(job_id)
+        if not job:
+            raise ValueError(f"Import job {job_id} not found")
+        if job.status != "failed":
+            raise ValueError(f"Import job {job_id} is {job.status}, only failed jobs can be retried")
+        job.status = "pending"
+        job.error = None
+        self.db.commit()
+        return job
+    
+    def claim_next(self) -> Optional[CSVImportJob]:
+        """
+        Atomically take the oldest pending job, or a running one whose worker died.
+        
+        A running job counts as abandoned once its heartbeat is older than
+        CSV_IMPORT_STALE_SECONDS, e.g. after a restart mid-import.
+        
+        Returns:
+            The claimed job (now running), or None if there is nothing to do
+        """
+        now = datetime.now(timezone.utc)
+        claimable = or_(
+            CSVImportJob.status == "pending",
+            and_(
+                CSVImportJob.status == "running",
+                CSVImportJob.heartbeat_at < now - timedelta(seconds=settings.csv_import_stale_seconds)
+            )
+        )
+        candidates = [
+            job_id for (job_id,) in self.db.query(CSVImportJob.id).filter(claimable).order_by(CSVImportJob.id).limit(5)
+        ]
+        for job_id in candidates:
+            # Only one worker's UPDATE can match while the job is still claimable
+            result = self.db.execute(
+                update(CSVImportJob).where(
+                    CSVImportJob.id == job_id, claimable
+                ).values(
+                    status="running",
+                    heartbeat_at=now,
+                    started_at=func.coalesce(CSVImportJob.started_at, now)
+                ).execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+            if result.rowcount:
+                job = self.get(job_id)
+                self.db.refresh(job)
+                return job
+        return None
+    
+    def run(self, job: CSVImportJob, should_stop: Optional[Callable[[], bool]] = None) -> CSVImportJob:
+        """
+        Import the chunks of a claimed job that aren't committed yet.
+        
+        Args:
+            job: Job from ``claim_next``
+            should_stop: Checked between chunks; when it returns True the
+                job goes back to pending and resumes on the next claim
+        
+        Returns:
+            The job, completed, failed (with ``error`` set) or pending again
+        """
+        if job.chunks_done:
+            logger.info(f"[CSV] Resuming import job {job.id} ({job.filename}) after chunk {job.chunks_done}")
+        base_job = self.get(job.base_job_id) if job.base_job_id else None
+        base_fingerprints = (base_job.chunk_fingerprints or []) if base_job else []
+        csv_service = CSVService(self.db)
+        started = time.perf_counter()
+        rows_this_run = 0
+        
+        try:
+            with csv_service.read_chunks(job.file_path, job.filename, job.chunk_size) as reader:
+                for chunk_index, df in enumerate(reader):
+                    if chunk_index < job.chunks_done:
+                        continue  # Committed by an earlier run
+                    if should_stop and should_stop():
+                        job.status = "pending"
+                        self.db.commit()
+                        logger.info(f"[CSV] Import job {job.id} paused after chunk {job.chunks_done}")
+                        return job
+                    
+                    row_hashes = pd.util.hash_pandas_object(df, index=True).to_numpy()
+                    unchanged = 0
+                    if chunk_index < len(base_fingerprints):
+                        base_rows, base_digest = base_fingerprints[chunk_index]
+                        if base_rows <= len(df) and self._fingerprint(df, row_hashes[:base_rows]) == base_digest:
+                            unchanged = base_rows
+                    fingerprint = [len(df), self._fingerprint(df, row_hashes)]
+                    
+                    def checkpoint(result: Dict[str, Any]):
+                        nonlocal rows_this_run
+                        rows_this_run += unchanged + result["rows"]
+                        job.chunks_done = chunk_index + 1
+                        job.chunk_fingerprints = (job.chunk_fingerprints or []) + [fingerprint]
+                        job.rows_processed += unchanged + result["rows"]
+                        job.rows_unchanged += unchanged
+                        job.contacts_imported += result["imported"]
+                        job.rows_skipped += result["skipped"]
+                        job.contacts_scored += result["scored"]
+                        job.errors = ((job.errors or []) + result["errors"])[:MAX_JOB_ERRORS]
+                        job.heartbeat_at = datetime.now(timezone.utc)
+                        job.rows_per_second = rows_this_run / (time.perf_counter() - started)
+                        job.peak_memory_mb = peak_memory_usage_mb()
+                    
+                    if unchanged == len(df):
+                        checkpoint({"rows": 0, "imported": 0, "skipped": 0, "scored": 0, "errors": []})
+                        self.db.commit()
+                    else:
+                        csv_service.import_chunk(df.iloc[unchanged:], job.filename, before_commit=checkpoint)
+                    logger.info(
+                        f"[CSV] Import job {job.id}: chunk {job.chunks_done} done, {job.rows_processed} rows, "
+                        f"{job.contacts_imported} imported, {job.rows_unchanged} unchanged "
+                        f"({job.rows_per_second:,.0f} rows/s)"
+                    )
+        except Exception as e:
+            self.db.rollback()
+            job.status = "failed"
+            job.error = str(e)
+            self.db.commit()
+            logger.error(f"[CSV] Import job {job.id} failed after chunk {job.chunks_done}: {type(e).__name__}: {e}")
+            return job
+        
+        job.status = "completed"
+        job.completed_at = datetime.now(timezone.utc)
+        self.db.commit()
+        self._remove_file(job.file_path)
+        unchanged = f", {job.rows_unchanged} unchanged since job {job.base_job_id}" if job.base_job_id else ""
+        logger.info(
+            f"[CSV] Import job {job.id} completed: {job.contacts_imported} of {job.rows_processed} rows imported"
+            f"{unchanged}"
+        )
+        return job
+    
+    @staticmethod
+    def _fingerprint(df: pd.DataFrame, row_hashes: np.ndarray) -> str:
+        """Digest of a chunk's header and leading rows, given their ``hash_pandas_object`` hashes."""
+        digest = hashlib.sha256("\x1f".join(map(str, df.columns)).encode())
+        digest.update(row_hashes.tobytes())
+        return digest.hexdigest()[:32]
+    
+    @staticmethod
+    def _remove_file(path: str):
+        try:
+            os.unlink(path)
+        except OSError as e:
+            logger.warning(f"[CSV] Could not remove {path}: {e}")
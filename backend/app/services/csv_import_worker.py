@@ -0,0 +1,9 @@
+"""In-process worker for background CSV import jobs."""
+from app.config import get_settings
+from app.services.csv_import_jobs import run_next_import
+from app.services.job_worker import JobWorker
+
+settings = get_settings()
+
+# A job in progress is paused after its current chunk when the worker stops
+csv_import_worker = JobWorker("[CSV] Import worker", run_next_import, poll_seconds=settings.csv_import_poll_seconds)
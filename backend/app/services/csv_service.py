@@ -1,10 +1,41 @@
 """CSV upload and processing service."""
+import logging
+import sys
+import time
+from functools import lru_cache
+import numpy as np
 import pandas as pd
-import io
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional, Tuple
+from app.config import get_settings
 from app.models.contact import Contact
+from app.services.batch_scorer import BatchIntentScorer
+from app.services.ingest_readers import IngestSource, open_reader
 from app.services.intent_scorer import IntentScoringService
+from app.services.scoring_rules import scoring_rules
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Skipped rows reported per chunk (and per import)
+MAX_ROW_ERRORS = 10
+
+
+def peak_memory_usage_mb() -> Optional[float]:
+    """
+    Peak resident memory of this process in MB, or None where unavailable.
+    
+    This is the high-water mark the container's memory limit applies to;
+    reading it costs nothing, unlike tracing allocations.
+    """
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Reported in bytes on macOS, kilobytes elsewhere
+    return round(peak / (2**20 if sys.platform == "darwin" else 2**10), 1)
 
 
 class CSVService:
@@ -40,121 +71,314 @@ class CSVService:
         "country": "country",
     }
     
+    # Contact fields a CSV can fill, in FIELD_MAPPING order
+    CONTACT_FIELDS = tuple(dict.fromkeys(FIELD_MAPPING.values()))
+    
     def upload_and_import(
         self,
-        file_content: bytes,
-        filename: str
+        file_content: IngestSource,
+        filename: str,
+        chunk_size: Optional[int] = None
     ) -> Dict[str, Any]:
         """
-        Upload and import contacts from CSV file.
+        Upload and import contacts from a CSV file (or another format in ``INGEST_READERS``).
+        
+        The file is parsed ``chunk_size`` rows at a time; each chunk is
+        mapped, deduplicated, inserted, scored and committed before the
+        next one is read (see ``import_chunk``), so memory use depends on
+        the chunk size, not the file size. Pass a path (e.g. an upload
+        spooled to disk) for large files.
         
         Args:
-            file_content: CSV file content as bytes
-            filename: Name of uploaded file
-            
+            file_content: File path, binary file object or content as bytes
+            filename: Name of uploaded file; its suffix picks the reader
+            chunk_size: Rows per chunk (default: CSV_IMPORT_CHUNK_SIZE)
+        
         Returns:
-            Dictionary with import statistics
+            Dictionary with import statistics, including ``chunks`` and the
+            process' ``peak_memory_mb`` (see ``peak_memory_usage_mb``)
         """
+        chunk_size = chunk_size or settings.csv_import_chunk_size
+        
         errors = []
+        total_rows = 0
         imported_count = 0
         skipped_count = 0
+        scored_count = 0
+        chunk_count = 0
+        started = time.perf_counter()
         
         try:
-            # Read CSV
-            df = pd.read_csv(io.BytesIO(file_content))
-            total_rows = len(df)
-            
-            # Normalize column names (lowercase, strip whitespace)
-            df.columns = df.columns.str.lower().str.strip()
-            
-            # Process each row
-            for index, row in df.iterrows():
-                try:
-                    contact_data = self._parse_row(row)
-                    
-                    # Skip if no meaningful data
-                    if not any([
-                        contact_data.get("email"),
-                        contact_data.get("phone"),
-                        contact_data.get("company")
-                    ]):
-                        skipped_count += 1
-                        continue
-                    
-                    # Check for duplicate email
-                    if contact_data.get("email"):
-                        existing = self.db.query(Contact).filter(
-                            Contact.email == contact_data["email"]
-                        ).first()
-                        if existing:
-                            skipped_count += 1
-                            continue
-                    
-                    # Create contact
-                    contact = Contact(
-                        **contact_data,
-                        source="csv",
-                        raw_data={"filename": filename, "row_index": index}
+            # Rows keep their position in the file as index across chunks
+            with self.read_chunks(file_content, filename, chunk_size) as reader:
+                for df in reader:
+                    result = self.import_chunk(df, filename)
+                    chunk_count += 1
+                    total_rows += result["rows"]
+                    imported_count += result["imported"]
+                    skipped_count += result["skipped"]
+                    scored_count += result["scored"]
+                    errors.extend(result["errors"][:MAX_ROW_ERRORS - len(errors)])
+                    logger.info(
+                        f"[CSV] {filename}: chunk {chunk_count} done, "
+                        f"{total_rows} rows read, {imported_count} imported"
                     )
-                    self.db.add(contact)
-                    imported_count += 1
-                    
-                except Exception as e:
-                    errors.append(f"Row {index + 2}: {str(e)}")
-                    skipped_count += 1
-            
-            # Commit all contacts
-            self.db.commit()
-            
-            # Calculate intent scores for imported contacts
-            # (will be done in bulk later)
             
+            peak_memory_mb = peak_memory_usage_mb()
+            elapsed = time.perf_counter() - started
+            logger.info(
+                f"[CSV] Imported {imported_count} of {total_rows} rows from {filename} in {elapsed:.1f}s "
+                f"({chunk_count} chunks, peak memory {peak_memory_mb} MB)"
+            )
             return {
                 "filename": filename,
                 "total_rows": total_rows,
                 "imported_contacts": imported_count,
                 "skipped_rows": skipped_count,
-                "errors": errors[:10]  # Limit to first 10 errors
+                "scored_contacts": scored_count,
+                "chunks": chunk_count,
+                "peak_memory_mb": peak_memory_mb,
+                "errors": errors
             }
-            
+        
         except Exception as e:
             self.db.rollback()
-            raise ValueError(f"Failed to process CSV: {str(e)}")
+            raise ValueError(
+                f"Failed to process CSV: {str(e)} "
+                f"({imported_count} contacts from earlier chunks were imported)"
+            )
     
-    def _parse_row(self, row: pd.Series) -> Dict[str, Any]:
-        """Parse a CSV row into contact data."""
-        contact_data = {}
-        
-        for csv_column, value in row.items():
-            # Skip NaN values
-            if pd.isna(value):
-                continue
-            
-            # Map CSV column to model field
-            csv_column_clean = csv_column.lower().strip()
-            if csv_column_clean in self.FIELD_MAPPING:
-                model_field = self.FIELD_MAPPING[csv_column_clean]
-                contact_data[model_field] = str(value).strip()
+    def read_chunks(self, file_content: IngestSource, filename: str, chunk_size: int):
+        """
+        Open an upload for reading ``chunk_size`` rows at a time.
+        
+        Only columns in ``FIELD_MAPPING`` are read, all as text, so phone
+        numbers and similar values keep their formatting and leading zeros.
+        Parquet and Arrow files skip the other columns on disk.
+        
+        Args:
+            file_content: File path, binary file object or content as bytes
+            filename: Name of uploaded file; its suffix picks the reader
+            chunk_size: Rows per chunk
+        
+        Returns:
+            Context manager yielding DataFrames (see ``open_reader``)
+        """
+        return open_reader(
+            file_content,
+            filename,
+            chunk_size,
+            usecols=lambda column: str(column).lower().strip() in self.FIELD_MAPPING
+        )
+    
+    def import_chunk(
+        self,
+        df: pd.DataFrame,
+        filename: str,
+        before_commit: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Import one chunk of CSV rows: map, dedupe, bulk insert, score and commit.
+        
+        Fields are mapped and cleaned with column operations (see
+        ``map_fields``). Rows without email, phone or company are skipped,
+        as are rows repeating an email seen earlier in the chunk. Emails
+        that already exist (including from earlier chunks of the same file)
+        are skipped by the insert itself, so the whole chunk is a single
+        statement. The new contacts are scored by ID in the same
+        transaction, so a committed chunk is never left unscored.
+        
+        Args:
+            df: Chunk as read from the CSV; its index is the row position
+            filename: Name of uploaded file
+            before_commit: Called with the chunk's result before the commit,
+                to record progress in the same transaction
+        
+        Returns:
+            Dictionary with ``rows``, ``imported``, ``skipped``, ``scored``
+            and ``errors`` (the first ``MAX_ROW_ERRORS`` skipped rows, as
+            "Row <line>: <reason>") for the chunk
+        """
+        data = self.map_fields(df)
+        # Taken before anything is written; see ``BatchIntentScorer.score_ids``
+        rules = scoring_rules.current()
         
-        return contact_data
+        # Skip rows without email, phone or company, and emails repeated within the chunk
+        meaningful = data[["email", "phone", "company"]].notna().any(axis=1)
+        repeated = data["email"].notna() & data["email"].duplicated()
+        skipped_rows = {
+            "no email, phone or company": data.index[~meaningful],
+            "email repeats an earlier row": data.index[repeated],
+        }
+        data = data[meaningful & ~repeated]
+        skipped_count = len(df) - len(data)
+        
+        records = data.where(data.notna(), None).assign(
+            source="csv",
+            raw_data=[{"filename": filename, "row_index": index} for index in data.index.tolist()]
+        ).to_dict(orient="records")
+        
+        inserted = self._insert_new_contacts(records) if records else []
+        contact_ids = [contact_id for contact_id, _ in inserted]
+        if len(inserted) < len(records):
+            inserted_emails = {email for _, email in inserted}
+            skipped_rows["email already exists"] = data.index[
+                data["email"].notna() & ~data["email"].isin(inserted_emails)
+            ]
+        
+        result = {
+            "rows": len(df),
+            "imported": len(contact_ids),
+            "skipped": skipped_count + len(records) - len(contact_ids),
+            "scored": BatchIntentScorer(self.db).score_ids(contact_ids, commit=False, rules=rules) if contact_ids else 0,
+            "errors": self._row_errors(skipped_rows)
+        }
+        if before_commit:
+            before_commit(result)
+        self.db.commit()
+        return result
+    
+    @staticmethod
+    def _row_errors(skipped_rows: Dict[str, pd.Index]) -> List[str]:
+        """The first ``MAX_ROW_ERRORS`` skipped rows in file order, numbered as lines of the CSV."""
+        first = sorted(
+            (index, reason)
+            for reason, indices in skipped_rows.items()
+            for index in indices[:MAX_ROW_ERRORS].tolist()
+        )
+        return [f"Row {index + 2}: {reason}" for index, reason in first[:MAX_ROW_ERRORS]]
+    
+    def _insert_new_contacts(self, records: List[Dict[str, Any]]) -> List[Tuple[int, Optional[str]]]:
+        """
+        Bulk insert contact records, skipping emails that already exist.
+        
+        On PostgreSQL and SQLite this is one multi-row
+        ``INSERT ... ON CONFLICT (email) DO NOTHING RETURNING id``; other
+        databases look up the chunk's existing emails in one query first.
+        
+        Returns:
+            ID and email of each inserted contact
+        """
+        dialect = self.db.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            # Core insert: one batched multi-row statement, no ORM bookkeeping
+            statement = dialect_insert(Contact.__table__).on_conflict_do_nothing(
+                index_elements=[Contact.email]
+            ).returning(Contact.id, Contact.email)
+            return [tuple(row) for row in self.db.execute(statement, records)]
+        
+        emails = {record["email"] for record in records if record["email"]}
+        existing = set()
+        if emails:
+            existing = {email for (email,) in self.db.query(Contact.email).filter(Contact.email.in_(emails))}
+        contacts = [Contact(**record) for record in records if record["email"] not in existing]
+        self.db.add_all(contacts)
+        self.db.flush()
+        inserted = [(contact.id, contact.email) for contact in contacts]
+        for contact in contacts:
+            self.db.expunge(contact)
+        return inserted
+    
+    @classmethod
+    @lru_cache(maxsize=64)
+    def resolve_columns(cls, columns: Tuple[str, ...]) -> Dict[str, List[str]]:
+        """
+        Map a file's columns to Contact fields, once per distinct header.
+        
+        Column names are matched case- and whitespace-insensitively against
+        ``FIELD_MAPPING``. Several columns can feed one field (e.g. ``email``
+        and ``email_address``); they are listed in file order.
+        
+        Args:
+            columns: Column names as they appear in the file
+        
+        Returns:
+            Dictionary of Contact field to source columns
+        """
+        mapping: Dict[str, List[str]] = {}
+        for column in columns:
+            field = cls.FIELD_MAPPING.get(str(column).lower().strip())
+            if field:
+                mapping.setdefault(field, []).append(column)
+        return mapping
+    
+    def map_fields(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Map and clean a chunk of CSV rows into Contact fields, column by column.
+        
+        Values are trimmed and blanks become missing; where several columns
+        feed a field, the last one with a value wins. Emails are lowercased,
+        phone numbers reduced to their digits (see ``normalize_phones``) and
+        values cut to the column length.
+        
+        Args:
+            df: Chunk as read from the CSV
+        
+        Returns:
+            DataFrame with one column per mapped field (NaN where missing)
+            and the chunk's index
+        """
+        fields = {}
+        for field, columns in self.resolve_columns(tuple(df.columns)).items():
+            values = None
+            for column in columns:
+                cleaned = self._clean_text(df[column])
+                values = cleaned if values is None else cleaned.fillna(values)
+            fields[field] = values
+        
+        data = pd.DataFrame(fields, index=df.index).reindex(columns=self.CONTACT_FIELDS).astype(object)
+        data["email"] = data["email"].str.lower()
+        data["phone"] = self.normalize_phones(data["phone"])
+        for field in self.CONTACT_FIELDS:
+            length = Contact.__table__.c[field].type.length
+            if length:
+                data[field] = data[field].str.slice(0, length)
+        return data
+    
+    @staticmethod
+    def normalize_phones(phones: pd.Series) -> pd.Series:
+        """
+        Reduce phone numbers to their digits, like ``normalize_phone``.
+        
+        A leading US country code is dropped; values with fewer than 7
+        digits are kept as written.
+        """
+        digits = phones.str.replace(r"\D", "", regex=True)
+        digits = digits.mask((digits.str.len() == 11) & digits.str.startswith("1"), digits.str.slice(1))
+        return digits.where(digits.str.len() >= 7, phones)
+    
+    @staticmethod
+    def _clean_text(values: pd.Series) -> pd.Series:
+        """Trim text values and turn blanks into NaN."""
+        if not pd.api.types.is_object_dtype(values):
+            values = values.astype("string").astype(object).where(values.notna(), np.nan)
+        values = values.str.strip()
+        return values.mask(values == "")
     
     def get_csv_preview(
         self,
-        file_content: bytes,
-        rows: int = 5
+        file_content: IngestSource,
+        rows: int = 5,
+        filename: str = "upload.csv"
     ) -> Dict[str, Any]:
         """
-        Get preview of CSV file.
+        Get preview of an upload.
+        
+        Only the first ``rows`` rows are read.
         
         Args:
-            file_content: CSV file content
+            file_content: File path, binary file object or content as bytes
             rows: Number of rows to preview
-            
+            filename: Name of uploaded file; its suffix picks the reader
+        
         Returns:
             Dictionary with preview data
         """
         try:
-            df = pd.read_csv(io.BytesIO(file_content), nrows=rows)
+            with open_reader(file_content, filename, rows) as reader:
+                df = next(iter(reader), pd.DataFrame())
+            df = df.astype(object).where(df.notna(), None)
             
             return {
                 "columns": df.columns.tolist(),
@@ -162,4 +386,4 @@ class CSVService:
                 "total_columns": len(df.columns)
             }
         except Exception as e:
-            raise ValueError(f"Failed to preview CSV: {str(e)}")
+            raise ValueError(f"Failed to preview file: {str(e)}")
@@ -98,9 +98,9 @@ class ExportService:
                 # Get field value
                 value = getattr(contact, field, None)
                 
-                # Handle intent score (latest)
-                if field == "intent_score" and contact.intent_scores:
-                    value = contact.intent_scores[0].score if contact.intent_scores else None
+                # Handle intent score (current label, materialized on the contact)
+                if field == "intent_score":
+                    value = contact.intent_level
                 
                 row[field] = value if value is not None else ""
             
@@ -156,8 +156,8 @@ class ExportService:
             row = {}
             for field in fields:
                 value = getattr(contact, field, None)
-                if field == "intent_score" and contact.intent_scores:
-                    value = contact.intent_scores[0].score if contact.intent_scores else None
+                if field == "intent_score":
+                    value = contact.intent_level
                 row[field] = value
             contact_data.append(row)
         
@@ -0,0 +1,144 @@
+"""Chunked readers for the contact file formats the import accepts."""
+import io
+import os
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, Union
+import numpy as np
+import pandas as pd
+
+# Anything a reader can read from: a path, an open binary file or raw bytes
+IngestSource = Union[str, os.PathLike, BinaryIO, bytes]
+
+# Decides from its name whether a column is read (None reads every column)
+ColumnFilter = Optional[Callable[[str], bool]]
+
+
+def read_csv(source: IngestSource, chunk_size: int, usecols: ColumnFilter, compression: Optional[str] = None):
+    """CSV, optionally compressed; every column is read as text."""
+    return pd.read_csv(source, chunksize=chunk_size, dtype=str, usecols=usecols, compression=compression)
+
+
+@contextmanager
+def read_jsonl(source: IngestSource, chunk_size: int, usecols: ColumnFilter, compression: Optional[str] = None):
+    """Newline-delimited JSON, one object per row."""
+    with pd.read_json(
+        source, lines=True, chunksize=chunk_size, dtype=False, convert_dates=False, compression=compression
+    ) as reader:
+        yield (_frame_as_text(df, usecols) for df in reader)
+
+
+@contextmanager
+def read_parquet(source: IngestSource, chunk_size: int, usecols: ColumnFilter):
+    """Parquet; only the selected columns are read from disk."""
+    import pyarrow.parquet as pq
+    
+    parquet = pq.ParquetFile(source)
+    try:
+        columns = [name for name in parquet.schema_arrow.names if usecols is None or usecols(name)]
+        yield _arrow_chunks(parquet.iter_batches(batch_size=chunk_size, columns=columns), chunk_size)
+    finally:
+        parquet.close()
+
+
+@contextmanager
+def read_arrow(source: IngestSource, chunk_size: int, usecols: ColumnFilter):
+    """Arrow IPC file (Feather v2); unselected columns are dropped per record batch."""
+    import pyarrow as pa
+    
+    file = pa.OSFile(os.fspath(source)) if isinstance(source, (str, os.PathLike)) else source
+    try:
+        reader = pa.ipc.open_file(file)
+        columns = [name for name in reader.schema.names if usecols is None or usecols(name)]
+        batches = (reader.get_batch(i).select(columns) for i in range(reader.num_record_batches))
+        yield _arrow_chunks(batches, chunk_size)
+    finally:
+        if file is not source:
+            file.close()
+
+
+# File name suffix -> reader(source, chunk_size, usecols); add an entry to accept another format
+INGEST_READERS: Dict[str, Callable[..., Any]] = {
+    ".csv": read_csv,
+    ".csv.gz": partial(read_csv, compression="gzip"),
+    ".jsonl": read_jsonl,
+    ".ndjson": read_jsonl,
+    ".jsonl.gz": partial(read_jsonl, compression="gzip"),
+    ".parquet": read_parquet,
+    ".arrow": read_arrow,
+    ".feather": read_arrow,
+}
+
+
+def ingest_format(filename: Optional[str]) -> Optional[str]:
+    """The ``INGEST_READERS`` suffix a file name ends with (the longest one), or None."""
+    name = (filename or "").lower()
+    matches = [suffix for suffix in INGEST_READERS if name.endswith(suffix)]
+    return max(matches, key=len) if matches else None
+
+
+def open_reader(source: IngestSource, filename: str, chunk_size: int, usecols: ColumnFilter = None):
+    """
+    Open a contact file for reading ``chunk_size`` rows at a time.
+    
+    Whatever the format, chunks are DataFrames of text columns (missing
+    values as NaN or None) indexed by row position in the file, so they
+    go through the same mapping, dedupe and insert steps as a CSV.
+    
+    Args:
+        source: File path, binary file object or content as bytes
+        filename: Name of the file; its suffix picks the reader
+        chunk_size: Rows per chunk
+        usecols: Columns to read, by name
+    
+    Returns:
+        Context manager yielding an iterator of DataFrames
+    
+    Raises:
+        ValueError: If the file type isn't supported
+    """
+    file_format = ingest_format(filename)
+    if file_format is None:
+        raise ValueError(f"Unsupported file type: {filename} (supported: {', '.join(INGEST_READERS)})")
+    if isinstance(source, bytes):
+        source = io.BytesIO(source)
+    return INGEST_READERS[file_format](source, chunk_size, usecols)
+
+
+def _arrow_chunks(batches, chunk_size: int) -> Iterator[pd.DataFrame]:
+    """Regroup Arrow record batches into ``chunk_size``-row text DataFrames."""
+    import pyarrow as pa
+    
+    buffered = None
+    offset = 0
+    for batch in batches:
+        table = pa.Table.from_batches([batch])
+        buffered = table if buffered is None else pa.concat_tables([buffered, table])
+        while buffered.num_rows >= chunk_size:
+            yield _arrow_frame(buffered.slice(0, chunk_size), offset)
+            offset += chunk_size
+            buffered = buffered.slice(chunk_size)
+    if buffered is not None and buffered.num_rows:
+        yield _arrow_frame(buffered, offset)
+
+
+def _arrow_frame(table, offset: int) -> pd.DataFrame:
+    # Text the same way as JSONL: an Arrow string cast would print 15559998888.0 as 1.5559998888e+10
+    df = _frame_as_text(table.to_pandas(), None)
+    df.index = pd.RangeIndex(offset, offset + len(df))
+    return df
+
+
+def _frame_as_text(df: pd.DataFrame, usecols: ColumnFilter) -> pd.DataFrame:
+    """Select columns and turn typed values into text, as the CSV reader parses them."""
+    if usecols is not None:
+        df = df[[column for column in df.columns if usecols(column)]]
+    text = {}
+    for column, values in df.items():
+        strings = values.astype(str)
+        if pd.api.types.is_float_dtype(values):
+            # Integers in a column with gaps come back as floats; keep them as 5551234, not 5551234.0
+            integral = values.notna() & (values == np.floor(values))
+            strings[integral] = values[integral].astype("int64").astype(str)
+        text[column] = strings.astype(object).where(values.notna(), None)
+    return pd.DataFrame(text, index=df.index)
@@ -1,10 +1,15 @@
 """Rule-based intent scoring engine."""
+import hashlib
+import json
+from sqlalchemy import and_, case, false
 from sqlalchemy.orm import Session
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta, timezone
 from app.models.contact import Contact
-from app.models.intent_score import IntentScore
+from app.models.intent_score import ContactKeyword, IntentScore
 from app.config import get_settings
+from app.services.scoring_rules import ScoringRules, scoring_rules
+from app.utils.keyword_matcher import TieredKeywordMatcher
 
 settings = get_settings()
 
@@ -12,47 +17,66 @@ settings = get_settings()
 class IntentScoringService:
     """Service for calculating rule-based intent scores."""
     
-    # Intent keywords - higher value = stronger intent signal
-    INTENT_KEYWORDS = {
-        "high": [
-            "looking for",
-            "need",
-            "urgent",
-            "quote",
-            "estimate",
-            "pricing",
-            "buy",
-            "purchase",
-            "hire",
-            "service",
-            "help",
-            "repair",
-            "install",
-            "replace"
-        ],
-        "medium": [
-            "compare",
-            "review",
-            "best",
-            "top",
-            "near me",
-            "local",
-            "contact",
-            "call",
-            "schedule"
-        ],
-        "low": [
-            "what is",
-            "how to",
-            "diy",
-            "tutorial",
-            "free",
-            "information"
-        ]
-    }
-    
     def __init__(self, db: Session):
         self.db = db
+        self._rules = None
+        self._rule_version = None
+    
+    @property
+    def rules(self) -> ScoringRules:
+        """Active rule set, fixed for the lifetime of this service instance."""
+        if self._rules is None:
+            self._rules = scoring_rules.current()
+        return self._rules
+    
+    @property
+    def keyword_matcher(self) -> TieredKeywordMatcher:
+        """Compiled single-pass matcher for the active keywords."""
+        return self.rules.matcher
+    
+    @property
+    def rule_version(self) -> str:
+        """Version of the scoring rules (see ``compute_rule_version``)."""
+        if self._rule_version is None:
+            self._rule_version = self.compute_rule_version(self.rules)
+        return self._rule_version
+    
+    @staticmethod
+    def compute_rule_version(
+        rules: Optional[ScoringRules] = None,
+        high_threshold: Optional[float] = None,
+        medium_threshold: Optional[float] = None
+    ) -> str:
+        """
+        Hash everything besides contact data that a score depends on.
+        
+        Changing a keyword, weight, boost or threshold gives a new version,
+        which marks every existing score as stale. The recency window isn't
+        part of it: the boost is applied on read, so stored scores don't
+        depend on it.
+        
+        Args:
+            rules: Rule set to version (default: the active one)
+            high_threshold: HIGH threshold (default: configured)
+            medium_threshold: MEDIUM threshold (default: configured)
+        """
+        rules = rules or scoring_rules.current()
+        versioned = {
+            "keywords": rules.keywords,
+            "weights": rules.weights,
+            "recency_boost": rules.recency_boost,
+            "source_boost": rules.source_boost,
+            "high_threshold": settings.intent_high_threshold if high_threshold is None else high_threshold,
+            "medium_threshold": settings.intent_medium_threshold if medium_threshold is None else medium_threshold,
+            "recency": "applied on read",
+            "keyword_index": True
+        }
+        return hashlib.sha256(json.dumps(versioned, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    
+    @staticmethod
+    def fingerprint(searchable_text: str, source: Optional[str]) -> str:
+        """Hash the contact inputs the rules read: searchable text and source."""
+        return hashlib.sha256(f"{source or ''}\x1f{searchable_text}".encode("utf-8")).hexdigest()
     
     def calculate_intent(self, contact: Contact) -> IntentScore:
         """
@@ -69,106 +93,288 @@ class IntentScoringService:
         
         logger.info(f"[IntentScorer] Calculating intent for contact {contact.id}")
         
-        score_value = 0.0
-        signals = {
-            "matched_keywords": [],
-            "recency_boost": False,
-            "source_boost": False,
-            "reasoning": []
-        }
-        
         # Extract text data for analysis
         searchable_text = self._get_searchable_text(contact)
         searchable_text_lower = searchable_text.lower()
         
-        # Keyword matching
-        high_matches = []
-        medium_matches = []
-        low_matches = []
-        
-        for keyword in self.INTENT_KEYWORDS["high"]:
-            if keyword in searchable_text_lower:
-                high_matches.append(keyword)
-                score_value += 0.3
-        
-        for keyword in self.INTENT_KEYWORDS["medium"]:
-            if keyword in searchable_text_lower:
-                medium_matches.append(keyword)
-                score_value += 0.15
-        
-        for keyword in self.INTENT_KEYWORDS["low"]:
-            if keyword in searchable_text_lower:
-                low_matches.append(keyword)
-                score_value += 0.05
-        
-        signals["matched_keywords"] = {
-            "high": high_matches,
-            "medium": medium_matches,
-            "low": low_matches
-        }
-        
-        if high_matches:
-            signals["reasoning"].append(f"Matched {len(high_matches)} high-intent keywords")
-        if medium_matches:
-            signals["reasoning"].append(f"Matched {len(medium_matches)} medium-intent keywords")
+        # Remember what this score was built from, for rescore_if_changed
+        contact.score_fingerprint = self.fingerprint(searchable_text, contact.source)
+        contact.score_rule_version = self.rule_version
+        calculated_at = datetime.now(timezone.utc)
+        contact.intent_scored_at = calculated_at
         
-        # Recency boost
-        logger.info(f"[IntentScorer] Contact created_at: {contact.created_at}, type: {type(contact.created_at)}")
-        recency_threshold = datetime.now(timezone.utc) - timedelta(days=settings.intent_recency_days)
-        logger.info(f"[IntentScorer] Recency threshold: {recency_threshold}, type: {type(recency_threshold)}")
-        
-        try:
-            if contact.created_at >= recency_threshold:
-                score_value += 0.2
-                signals["recency_boost"] = True
-                signals["reasoning"].append(f"Recent activity (within {settings.intent_recency_days} days)")
-            logger.info(f"[IntentScorer] Recency check passed")
-        except Exception as e:
-            logger.error(f"[IntentScorer] Error in recency check: {type(e).__name__}: {str(e)}")
-            raise
+        # Keyword matching (all tiers in one pass)
+        keyword_ids = self.keyword_matcher.find(searchable_text_lower)
+        matches = self.keyword_matcher.group(keyword_ids)
+        score_value = self.keyword_matcher.score(matches)
+        contact.keyword_matches = [
+            ContactKeyword(keyword=keyword) for keyword in self.matched_keywords(matches)
+        ]
         
         # Source-based boost (SerpAPI = actively searching)
-        if contact.source == "serpapi":
-            score_value += 0.1
-            signals["source_boost"] = True
-            signals["reasoning"].append("Contact from active search (SerpAPI)")
+        source_boost = contact.source == "serpapi"
+        if source_boost:
+            score_value += self.rules.source_boost
+        base_score_value = score_value
+        contact.intent_base_score = base_score_value
         
-        # Normalize score to 0-1 range
-        score_value = min(score_value, 1.0)
+        # Recency boost (stored scores re-apply it when read, see current_score_value)
+        logger.info(f"[IntentScorer] Contact created_at: {contact.created_at}, type: {type(contact.created_at)}")
+        recency_boost = self.is_recent(contact.created_at)
         
-        # Determine categorical score
-        if score_value >= settings.intent_high_threshold:
-            score_label = "HIGH"
-        elif score_value >= settings.intent_medium_threshold:
-            score_label = "MEDIUM"
-        else:
-            score_label = "LOW"
+        # Add recency and normalize score to 0-1 range
+        score_value = self.apply_recency(base_score_value, recency_boost, self.rules)
+        score_label = self.label_for(score_value)
         
         # Create intent score record
         intent_score = IntentScore(
             contact_id=contact.id,
             score=score_label,
             score_value=score_value,
-            signals=signals
+            base_score_value=base_score_value,
+            signals=self.build_signals(keyword_ids, recency_boost, source_boost, self.rules),
+            calculated_at=calculated_at
         )
         
         logger.info(f"[IntentScorer] Intent calculated: {score_label} ({score_value})")
         
         return intent_score
     
+    @staticmethod
+    def recency_cutoff(now: Optional[datetime] = None) -> datetime:
+        """Contacts created at or after this time get the recency boost."""
+        return (now or datetime.now(timezone.utc)) - timedelta(days=settings.intent_recency_days)
+    
+    @classmethod
+    def is_recent(cls, created_at: datetime, now: Optional[datetime] = None) -> bool:
+        """Check whether a contact is recent enough for the recency boost."""
+        if created_at.tzinfo is None:
+            created_at = created_at.replace(tzinfo=timezone.utc)
+        return created_at >= cls.recency_cutoff(now)
+    
+    @staticmethod
+    def apply_recency(base_score_value: float, recent: bool, rules: Optional[ScoringRules] = None) -> float:
+        """
+        Add the recency boost to a base score and cap it at 1.0.
+        
+        Args:
+            base_score_value: Keyword and source score
+            recent: Whether the contact gets the recency boost
+            rules: Rule set whose boost applies (default: the active one)
+        """
+        if recent:
+            base_score_value += (rules or scoring_rules.current()).recency_boost
+        return min(base_score_value, 1.0)
+    
+    @classmethod
+    def current_score_value(
+        cls,
+        base_score_value: Optional[float],
+        score_value: float,
+        created_at: datetime,
+        now: Optional[datetime] = None
+    ) -> float:
+        """
+        Evaluate a stored score as of now.
+        
+        Scores calculated before the base component was stored have no
+        ``base_score_value`` and keep their stored value.
+        """
+        if base_score_value is None:
+            return score_value
+        return cls.apply_recency(base_score_value, cls.is_recent(created_at, now))
+    
+    @classmethod
+    def current_score_expression(cls, now: Optional[datetime] = None):
+        """
+        SQL expression for a contact's current score value, for filters and sorts.
+        
+        Reads the score materialized on ``contacts`` (no join); NULL for
+        unscored contacts. Mirrors ``current_score_value`` (same addition
+        order, so same floats).
+        """
+        boosted = Contact.intent_base_score + case(
+            (Contact.created_at >= cls.recency_cutoff(now), scoring_rules.current().recency_boost),
+            else_=0.0
+        )
+        return case(
+            (boosted > 1.0, 1.0),
+            else_=boosted
+        )
+    
+    @classmethod
+    def intent_level_condition(cls, intent_level: str, now: Optional[datetime] = None):
+        """
+        SQL condition matching contacts whose current label is ``intent_level``.
+        
+        The exact check on the current value is paired with a range on
+        ``intent_base_score`` alone (the boost only ever adds at most
+        the recency boost), so the composite index narrows the scan.
+        
+        Args:
+            intent_level: "HIGH", "MEDIUM" or "LOW" (case-insensitive);
+                anything else matches nothing
+            now: Reference time for the recency boost (default: now)
+        """
+        value = cls.current_score_expression(now)
+        base = Contact.intent_base_score
+        # Slack so float rounding of base + boost can't drop a match
+        lowest_boosted = -scoring_rules.current().recency_boost - 1e-9
+        high = settings.intent_high_threshold
+        medium = settings.intent_medium_threshold
+        level = intent_level.upper()
+        if level == "HIGH":
+            return and_(base >= high + lowest_boosted, value >= high)
+        if level == "MEDIUM":
+            return and_(base >= medium + lowest_boosted, base < high, value >= medium, value < high)
+        if level == "LOW":
+            return and_(base < medium, value < medium)
+        return false()
+    
+    @staticmethod
+    def label_expression(
+        value,
+        high_threshold: Optional[float] = None,
+        medium_threshold: Optional[float] = None
+    ):
+        """
+        SQL expression mapping a score value expression to its label, like ``label_for``.
+        
+        Args:
+            value: Score value column or expression
+            high_threshold: HIGH threshold (default: configured)
+            medium_threshold: MEDIUM threshold (default: configured)
+        """
+        high = settings.intent_high_threshold if high_threshold is None else high_threshold
+        medium = settings.intent_medium_threshold if medium_threshold is None else medium_threshold
+        return case(
+            (value >= high, "HIGH"),
+            (value >= medium, "MEDIUM"),
+            else_="LOW"
+        )
+    
+    @staticmethod
+    def label_for(score_value: float) -> str:
+        """Map a 0-1 score to its categorical label."""
+        if score_value >= settings.intent_high_threshold:
+            return "HIGH"
+        elif score_value >= settings.intent_medium_threshold:
+            return "MEDIUM"
+        return "LOW"
+    
+    @staticmethod
+    def build_signals(
+        keyword_ids: List[int],
+        recency_boost: bool,
+        source_boost: bool,
+        rules: ScoringRules
+    ) -> Dict[str, Any]:
+        """
+        Build the compact signals payload stored with an intent score.
+        
+        Matched keywords are stored as indices into the rule set's keyword
+        list (``ScoringRules.keyword_list``) together with its version;
+        ``expand_signals`` turns them back into the readable form.
+        
+        Args:
+            keyword_ids: Sorted indices of the matched keywords
+            recency_boost: Whether the recency boost applied
+            source_boost: Whether the SerpAPI source boost applied
+            rules: Rule set the keywords were matched with
+            
+        Returns:
+            Signals dictionary
+        """
+        return {
+            "rules": rules.version,
+            "keyword_ids": list(keyword_ids),
+            "recency_boost": recency_boost,
+            "source_boost": source_boost
+        }
+    
+    @staticmethod
+    def describe_signals(
+        matches: Optional[Dict[str, List[str]]],
+        recency_boost: bool,
+        source_boost: bool
+    ) -> Dict[str, Any]:
+        """
+        Build the readable signals: matched keywords per tier and reasoning.
+        
+        Args:
+            matches: Matched keywords per tier ("high", "medium", "low"), or
+                None if the rule set they refer to is unknown
+            recency_boost: Whether the recency boost applied
+            source_boost: Whether the SerpAPI source boost applied
+            
+        Returns:
+            Signals dictionary
+        """
+        reasoning = []
+        if matches and matches["high"]:
+            reasoning.append(f"Matched {len(matches['high'])} high-intent keywords")
+        if matches and matches["medium"]:
+            reasoning.append(f"Matched {len(matches['medium'])} medium-intent keywords")
+        if recency_boost:
+            reasoning.append(f"Recent activity (within {settings.intent_recency_days} days)")
+        if source_boost:
+            reasoning.append("Contact from active search (SerpAPI)")
+        
+        return {
+            "matched_keywords": {
+                "high": matches["high"],
+                "medium": matches["medium"],
+                "low": matches["low"]
+            } if matches is not None else None,
+            "recency_boost": recency_boost,
+            "source_boost": source_boost,
+            "reasoning": reasoning
+        }
+    
+    @classmethod
+    def expand_signals(cls, signals: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Expand stored signals to the readable form (readable ones pass through).
+        
+        Args:
+            signals: Signals as stored on an IntentScore
+            
+        Returns:
+            Readable signals dictionary, or None
+        """
+        if not signals or "keyword_ids" not in signals:
+            return signals
+        rules = scoring_rules.for_version(signals["rules"])
+        matches = rules.matcher.group(signals["keyword_ids"]) if rules is not None else None
+        return cls.describe_signals(matches, signals["recency_boost"], signals["source_boost"])
+    
+    @staticmethod
+    def matched_keywords(matches: Dict[str, List[str]]) -> List[str]:
+        """Distinct keywords matched in any tier, for the ContactKeyword index."""
+        return sorted({keyword for tier_matches in matches.values() for keyword in tier_matches})
+    
     def _get_searchable_text(self, contact: Contact) -> str:
         """Extract all searchable text from contact."""
+        return self.build_searchable_text(contact.company, contact.industry, contact.raw_data)
+    
+    @staticmethod
+    def build_searchable_text(
+        company: Optional[str],
+        industry: Optional[str],
+        raw_data: Optional[Dict[str, Any]]
+    ) -> str:
+        """Join the contact fields that intent keywords are matched against."""
         text_parts = []
         
-        if contact.company:
-            text_parts.append(contact.company)
-        if contact.industry:
-            text_parts.append(contact.industry)
-        if contact.raw_data:
+        if company:
+            text_parts.append(company)
+        if industry:
+            text_parts.append(industry)
+        if raw_data:
             # Extract relevant fields from raw_data
             for key in ["title", "snippet", "description", "search_query"]:
-                if key in contact.raw_data and contact.raw_data[key]:
-                    text_parts.append(str(contact.raw_data[key]))
+                if key in raw_data and raw_data[key]:
+                    text_parts.append(str(raw_data[key]))
         
         return " ".join(text_parts)
     
@@ -176,29 +382,74 @@ class IntentScoringService:
         """
         Calculate intent scores for all contacts without scores.
         
+        Runs the chunked batch engine, which gives the same scores as
+        ``calculate_intent`` without loading full contacts.
+        
         Returns:
             Number of contacts scored
         """
-        # Find contacts without intent scores
-        contacts = self.db.query(Contact).filter(
-            ~Contact.intent_scores.any()
-        ).all()
+        from app.services.batch_scorer import BatchIntentScorer
+        return BatchIntentScorer(self.db).score_unscored()
+    
+    def score_contacts(self, contacts: List[Contact]) -> int:
+        """
+        Calculate intent scores for freshly inserted contacts.
+        
+        Contacts must already be flushed so they have IDs. Scores are
+        added to the session but not committed.
         
-        scored_count = 0
+        Args:
+            contacts: Contacts to score
+            
+        Returns:
+            Number of contacts scored
+        """
         for contact in contacts:
-            intent_score = self.calculate_intent(contact)
-            self.db.add(intent_score)
-            scored_count += 1
+            self.db.add(self.calculate_intent(contact))
+        return len(contacts)
+    
+    def is_stale(self, contact: Contact) -> bool:
+        """Check whether a contact's inputs or the rules changed since it was scored."""
+        return (
+            contact.score_rule_version != self.rule_version
+            or contact.score_fingerprint != self.fingerprint(self._get_searchable_text(contact), contact.source)
+        )
+    
+    def rescore_if_changed(self, contact: Contact) -> Optional[IntentScore]:
+        """
+        Recalculate a contact's intent score only if it is stale.
         
-        if scored_count > 0:
-            self.db.commit()
+        Edits to fields the rules don't read (phone, email, ...) keep the
+        existing score.
         
-        return scored_count
+        Args:
+            contact: Contact to check
+            
+        Returns:
+            New IntentScore, or None if the current score is still valid
+        """
+        # The materialized score, so checking doesn't load the score history
+        if contact.intent_base_score is not None and not self.is_stale(contact):
+            return None
+        return self.recalculate_score(contact.id)
+    
+    def rescore_stale_contacts(self) -> Dict[str, int]:
+        """
+        Rescore every contact whose inputs or rule version changed.
+        
+        Returns:
+            Dictionary with ``scanned`` and ``rescored`` counts
+        """
+        from app.services.batch_scorer import BatchIntentScorer
+        return BatchIntentScorer(self.db).rescore_stale()
     
     def recalculate_score(self, contact_id: int) -> IntentScore:
         """
         Recalculate intent score for a specific contact.
         
+        The new score becomes the current one; earlier scores are kept as
+        history until ``ScoreHistoryService.compact`` rolls them up.
+        
         Args:
             contact_id: ID of contact to rescore
             
@@ -209,11 +460,6 @@ class IntentScoringService:
         if not contact:
             raise ValueError(f"Contact {contact_id} not found")
         
-        # Delete existing scores
-        self.db.query(IntentScore).filter(
-            IntentScore.contact_id == contact_id
-        ).delete()
-        
         # Calculate new score
         new_score = self.calculate_intent(contact)
         self.db.add(new_score)
@@ -0,0 +1,77 @@
+"""In-process worker loop for queued background jobs."""
+import asyncio
+import logging
+import threading
+from typing import Callable, Optional
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+
+class JobWorker:
+    """
+    Background task that runs queued jobs one at a time.
+    
+    Jobs are blocking, so each one runs in the threadpool. The worker wakes
+    up when a job is queued in this process and otherwise polls, which also
+    picks up jobs queued elsewhere and jobs left running by a process that
+    died.
+    """
+    
+    def __init__(self, name: str, run_next: Callable[[Callable[[], bool]], Optional[int]], poll_seconds: int):
+        """
+        Args:
+            name: Log prefix, e.g. ``[CSV] Import worker``
+            run_next: Claims and runs one job, returning its ID (None when
+                the queue is empty); it's passed a callable that turns True
+                once the worker is stopping
+            poll_seconds: Seconds between checks when nothing is queued
+        """
+        self.name = name
+        self.run_next = run_next
+        self.poll_seconds = poll_seconds
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+        self._wakeup: Optional[asyncio.Event] = None
+        self._halt = threading.Event()  # Seen by the job's thread
+    
+    def start(self):
+        """Start the worker loop on the running event loop."""
+        if self._task is not None:
+            return
+        self._stopping = asyncio.Event()
+        self._wakeup = asyncio.Event()
+        self._halt.clear()
+        self._task = asyncio.create_task(self._run())
+    
+    def notify(self):
+        """Check for queued jobs now instead of at the next poll (call from the event loop)."""
+        if self._wakeup is not None:
+            self._wakeup.set()
+    
+    async def stop(self):
+        """Stop the loop, waiting for a job in progress to return."""
+        if self._task is None:
+            return
+        self._halt.set()
+        self._stopping.set()
+        self._wakeup.set()
+        await self._task
+        self._task = None
+    
+    async def _run(self):
+        logger.info(f"{self.name} started (polling every {self.poll_seconds}s)")
+        while not self._stopping.is_set():
+            self._wakeup.clear()
+            try:
+                job_id = await run_in_threadpool(self.run_next, self._halt.is_set)
+            except Exception as e:
+                job_id = None
+                logger.error(f"{self.name} tick failed: {type(e).__name__}: {str(e)}")
+            if job_id is not None:
+                continue  # Look for the next job right away
+            
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout=self.poll_seconds)
+            except asyncio.TimeoutError:
+                pass
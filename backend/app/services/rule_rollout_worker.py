@@ -0,0 +1,12 @@
+"""In-process worker that rescores contacts after a rule set is activated."""
+from app.config import get_settings
+from app.services.job_worker import JobWorker
+from app.services.rule_set_service import run_next_rollout
+
+settings = get_settings()
+
+rule_rollout_worker = JobWorker(
+    "[ScoringRules] Rollout worker",
+    run_next_rollout,
+    poll_seconds=settings.rule_rollout_poll_seconds
+)
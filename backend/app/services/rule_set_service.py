@@ -0,0 +1,310 @@
+"""Management of stored scoring rule sets."""
+import logging
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import and_, or_, update
+from sqlalchemy.orm import Session
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.contact import Contact
+from app.models.intent_score import ContactKeyword
+from app.models.scoring_rule_set import ScoringRuleSet
+from app.services.batch_scorer import BatchIntentScorer
+from app.services.intent_scorer import IntentScoringService
+from app.services.scoring_rules import TIERS, ScoringRules, scoring_rules
+from app.utils.keyword_matcher import KeywordMatcher
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def run_next_rollout(should_stop: Optional[Callable[[], bool]] = None) -> Optional[int]:
+    """
+    Claim and run one queued rescore with a session of its own; returns its rule set ID.
+    
+    A rollout isn't interrupted part way, so ``should_stop`` (passed by
+    the worker) is only checked before one is claimed.
+    """
+    if should_stop and should_stop():
+        return None
+    db = SessionLocal()
+    try:
+        service = RuleSetService(db)
+        rule_set = service.claim_next_rollout()
+        if rule_set is None:
+            return None
+        service.run_rollout(rule_set)
+        return rule_set.id
+    finally:
+        db.close()
+
+
+class RuleSetService:
+    """Service for storing, activating and rolling out scoring rule sets."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def create(
+        self,
+        keywords: Dict[str, Sequence[str]],
+        weights: Dict[str, float],
+        recency_boost: float,
+        source_boost: float,
+        description: Optional[str] = None
+    ) -> ScoringRuleSet:
+        """
+        Store a rule set (inactive). Identical rules return the existing version.
+        
+        Raises:
+            ValueError: If the tiers are not exactly ``TIERS``
+        """
+        rules = ScoringRules(keywords, weights, recency_boost, source_boost)
+        existing = self.db.query(ScoringRuleSet).filter(ScoringRuleSet.version == rules.version).first()
+        if existing:
+            return existing
+        
+        rule_set = ScoringRuleSet(version=rules.version, description=description, **rules.to_dict())
+        self.db.add(rule_set)
+        self.db.commit()
+        self.db.refresh(rule_set)
+        return rule_set
+    
+    def activate(self, rule_set_id: int) -> ScoringRuleSet:
+        """
+        Make a rule set the active one and queue a rescore of the contacts it affects.
+        
+        New scores use the rule set right away; existing scores are moved
+        over by the rollout worker (see ``run_rollout``). A rollout still
+        pending from an earlier activation is folded into this one.
+        
+        Args:
+            rule_set_id: Rule set to activate
+        
+        Returns:
+            The rule set, with ``rollout_status`` pending
+        
+        Raises:
+            ValueError: If the rule set doesn't exist
+        """
+        rule_set = self.db.get(ScoringRuleSet, rule_set_id)
+        if not rule_set:
+            raise ValueError(f"Rule set {rule_set_id} not found")
+        
+        scoring_rules.invalidate()
+        from_version = scoring_rules.current().version
+        rules = ScoringRules.from_model(rule_set)
+        
+        queued = self.db.query(ScoringRuleSet).filter(
+            ScoringRuleSet.rollout_status == "pending"
+        ).order_by(ScoringRuleSet.activated_at).all()
+        if queued:
+            # Contacts are still scored with the rules the oldest queued rollout starts from
+            from_version = queued[0].rollout_from_version
+            for superseded in queued:
+                superseded.rollout_status = "superseded"
+        
+        self.db.query(ScoringRuleSet).filter(
+            ScoringRuleSet.id != rule_set.id
+        ).update({ScoringRuleSet.is_active: False}, synchronize_session=False)
+        rule_set.is_active = True
+        rule_set.activated_at = datetime.now(timezone.utc)
+        rule_set.rollout_status = "pending"
+        rule_set.rollout_from_version = from_version
+        rule_set.rollout_stats = None
+        rule_set.rollout_error = None
+        rule_set.rollout_started_at = None
+        rule_set.rollout_completed_at = None
+        self.db.commit()
+        scoring_rules.set(rules)
+        logger.info(
+            f"[ScoringRules] Activated rule set {rule_set.id} (version {rule_set.version}), "
+            f"rescore from version {from_version} queued"
+        )
+        return rule_set
+    
+    def claim_next_rollout(self) -> Optional[ScoringRuleSet]:
+        """
+        Atomically take the queued rollout, or a running one whose worker died.
+        
+        Rollouts run one at a time, oldest activation first. A running one
+        counts as abandoned once it started more than
+        RULE_ROLLOUT_STALE_SECONDS ago.
+        
+        Returns:
+            The claimed rule set (rollout now running), or None
+        """
+        now = datetime.now(timezone.utc)
+        stale = now - timedelta(seconds=settings.rule_rollout_stale_seconds)
+        running = self.db.query(ScoringRuleSet.id).filter(
+            ScoringRuleSet.rollout_status == "running",
+            ScoringRuleSet.rollout_started_at >= stale
+        ).first()
+        if running:
+            return None
+        
+        claimable = or_(
+            ScoringRuleSet.rollout_status == "pending",
+            and_(ScoringRuleSet.rollout_status == "running", ScoringRuleSet.rollout_started_at < stale)
+        )
+        candidate = self.db.query(ScoringRuleSet.id).filter(claimable).order_by(ScoringRuleSet.activated_at).first()
+        if candidate is None:
+            return None
+        # Only one worker's UPDATE can match while the rollout is still claimable
+        result = self.db.execute(
+            update(ScoringRuleSet).where(
+                ScoringRuleSet.id == candidate.id, claimable
+            ).values(
+                rollout_status="running",
+                rollout_started_at=now
+            ).execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        if not result.rowcount:
+            return None
+        rule_set = self.db.get(ScoringRuleSet, candidate.id)
+        self.db.refresh(rule_set)
+        return rule_set
+    
+    def run_rollout(self, rule_set: ScoringRuleSet) -> ScoringRuleSet:
+        """
+        Rescore the contacts a claimed activation affects (see ``rescore_changed``).
+        
+        Args:
+            rule_set: Rule set from ``claim_next_rollout``
+        
+        Returns:
+            The rule set, its rollout completed (with ``rollout_stats``) or
+            failed (with ``rollout_error``)
+        """
+        try:
+            # The rules scored with before may have been activated in another process
+            scoring_rules.invalidate()
+            old = scoring_rules.for_version(rule_set.rollout_from_version)
+            stats = self.rescore_changed(old, ScoringRules.from_model(rule_set))
+        except Exception as e:
+            self.db.rollback()
+            rule_set.rollout_status = "failed"
+            rule_set.rollout_error = str(e)
+            self.db.commit()
+            logger.error(f"[ScoringRules] Rescore for rule set {rule_set.id} failed: {type(e).__name__}: {e}")
+            return rule_set
+        
+        rule_set.rollout_status = "completed"
+        rule_set.rollout_stats = stats
+        rule_set.rollout_completed_at = datetime.now(timezone.utc)
+        self.db.commit()
+        return rule_set
+    
+    @staticmethod
+    def changed_keywords(old: ScoringRules, new: ScoringRules) -> Set[str]:
+        """
+        Keywords whose contribution to a score differs between two rule sets.
+        
+        That is keywords added, removed, moved between tiers, or in a tier
+        whose weight changed.
+        """
+        old_tiers = old.keyword_tiers()
+        new_tiers = new.keyword_tiers()
+        reweighted = {tier for tier in TIERS if old.weights[tier] != new.weights[tier]}
+        return {
+            keyword
+            for keyword in old_tiers.keys() | new_tiers.keys()
+            if old_tiers.get(keyword, ()) != new_tiers.get(keyword, ())
+            or reweighted.intersection(old_tiers.get(keyword, ()))
+        }
+    
+    def rescore_changed(
+        self,
+        old: Optional[ScoringRules],
+        new: ScoringRules,
+        chunk_size: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Rescore only the contacts whose score differs under the new rules.
+        
+        Contacts that matched a changed keyword come from the ContactKeyword
+        index; contacts that may match an added keyword are found with a
+        read-only scan for just those keywords. Everyone else scored under
+        the old rules keeps their score and is moved to the new rule
+        version. A source boost change touches every SerpAPI contact, so it
+        falls back to a full stale rescore; the recency boost is applied on
+        read and needs no rescore.
+        
+        Args:
+            old: Rules the contacts were scored with, or None if they're no
+                longer on record (a full stale rescore)
+            new: Rules to move the contacts to
+            chunk_size: Contacts loaded per query
+        
+        Returns:
+            Dictionary with ``changed_keywords``, ``scanned``, ``rescored``,
+            ``version_bumped`` and ``full_rescore``
+        """
+        new_version = IntentScoringService.compute_rule_version(new)
+        old_version = IntentScoringService.compute_rule_version(old) if old else None
+        changed = self.changed_keywords(old, new) if old else set()
+        stats = {
+            "changed_keywords": len(changed),
+            "scanned": 0,
+            "rescored": 0,
+            "version_bumped": 0,
+            "full_rescore": False
+        }
+        if old_version == new_version:
+            return stats
+        
+        scorer = BatchIntentScorer(self.db)
+        if old is None or old.source_boost != new.source_boost:
+            result = scorer.rescore_stale(chunk_size)
+            stats.update(scanned=result["scanned"], rescored=result["rescored"], full_rescore=True)
+            return stats
+        
+        previously_matched = sorted(changed & old.keyword_tiers().keys())
+        added = sorted(changed - set(previously_matched))
+        contact_ids: Set[int] = set()
+        if previously_matched:
+            contact_ids.update(
+                contact_id for (contact_id,) in self.db.query(ContactKeyword.contact_id).filter(
+                    ContactKeyword.keyword.in_(previously_matched)
+                ).distinct()
+            )
+        if added:
+            matching, stats["scanned"] = self._contacts_matching(added, chunk_size)
+            contact_ids.update(matching)
+        
+        stats["rescored"] = scorer.score_ids(sorted(contact_ids), chunk_size, rules=new)
+        result = self.db.execute(
+            update(Contact).where(
+                Contact.score_rule_version == old_version
+            ).values(score_rule_version=new_version).execution_options(synchronize_session=False)
+        )
+        self.db.commit()
+        stats["version_bumped"] = result.rowcount
+        logger.info(
+            f"[ScoringRules] {len(changed)} keywords changed: rescored {stats['rescored']} contacts, "
+            f"moved {stats['version_bumped']} to rule version {new_version}"
+        )
+        return stats
+    
+    def _contacts_matching(self, keywords: List[str], chunk_size: Optional[int] = None):
+        """Find contacts whose searchable text contains any of the keywords."""
+        chunk_size = chunk_size or settings.intent_batch_chunk_size
+        matcher = KeywordMatcher(keywords)
+        matching = []
+        scanned = 0
+        last_id = 0
+        while True:
+            rows = self.db.query(
+                Contact.id, Contact.company, Contact.industry, Contact.raw_data
+            ).filter(
+                Contact.id > last_id
+            ).order_by(Contact.id).limit(chunk_size).all()
+            if not rows:
+                break
+            last_id = rows[-1][0]
+            scanned += len(rows)
+            for text, row in zip(BatchIntentScorer.searchable_texts(rows), rows):
+                if matcher.find(text.lower()):
+                    matching.append(row[0])
+        return matching, scanned
@@ -0,0 +1,231 @@
+"""Intent score history retention: daily rollups and compaction."""
+import logging
+import time
+from datetime import date, datetime, timedelta, timezone
+from itertools import groupby
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from app.config import get_settings
+from app.models.contact import Contact
+from app.models.intent_score import IntentScore, IntentScoreRollup
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class ScoreHistoryService:
+    """
+    Keep each contact's current intent score plus a daily rollup of the rest.
+    
+    Every rescore adds a score row that supersedes the previous one.
+    ``compact`` folds superseded rows into one ``IntentScoreRollup`` per
+    contact and UTC day (first and last label, label transitions, score
+    range) and deletes them, so ``intent_scores`` holds about one row per
+    contact while the trend stays available. Rollups older than
+    INTENT_HISTORY_RETENTION_DAYS are pruned.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def compact(
+        self,
+        retention_days: Optional[int] = None,
+        chunk_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Roll up and delete superseded scores, then prune old rollups.
+        
+        Contacts with more than one score are walked in contact ID order;
+        each chunk is rolled up, deleted and committed on its own, so an
+        interrupted run loses nothing and the next run carries on.
+        
+        Args:
+            retention_days: Keep rollups this many days (default:
+                INTENT_HISTORY_RETENTION_DAYS, 0 keeps them forever)
+            chunk_size: Contacts compacted per transaction
+        
+        Returns:
+            Dictionary with ``contacts``, ``scores_compacted``,
+            ``rollups_written`` and ``rollups_pruned`` counts
+        """
+        if retention_days is None:
+            retention_days = settings.intent_history_retention_days
+        chunk_size = chunk_size or settings.intent_batch_chunk_size
+        started = time.perf_counter()
+        stats = {"contacts": 0, "scores_compacted": 0, "rollups_written": 0, "rollups_pruned": 0}
+        
+        last_contact_id = 0
+        while True:
+            contact_ids = [
+                contact_id for (contact_id,) in self.db.query(IntentScore.contact_id).filter(
+                    IntentScore.contact_id > last_contact_id
+                ).group_by(IntentScore.contact_id).having(
+                    func.count(IntentScore.id) > 1
+                ).order_by(IntentScore.contact_id).limit(chunk_size)
+            ]
+            if not contact_ids:
+                break
+            last_contact_id = contact_ids[-1]
+            
+            rows = self.db.query(
+                IntentScore.id, IntentScore.contact_id, IntentScore.score,
+                IntentScore.score_value, IntentScore.calculated_at
+            ).filter(
+                IntentScore.contact_id.in_(contact_ids)
+            ).order_by(IntentScore.contact_id, IntentScore.calculated_at, IntentScore.id).all()
+            
+            # Everything but each contact's latest score
+            superseded = []
+            for _, scores in groupby(rows, key=lambda row: row.contact_id):
+                superseded.extend(list(scores)[:-1])
+            
+            stats["rollups_written"] += self._roll_up(superseded)
+            self.db.query(IntentScore).filter(
+                IntentScore.id.in_([row.id for row in superseded])
+            ).delete(synchronize_session=False)
+            self.db.commit()
+            
+            stats["contacts"] += len(contact_ids)
+            stats["scores_compacted"] += len(superseded)
+            logger.info(
+                f"[ScoreHistory] Compacted {stats['scores_compacted']} scores of {stats['contacts']} contacts"
+            )
+        
+        if retention_days:
+            cutoff = datetime.now(timezone.utc).date() - timedelta(days=retention_days)
+            stats["rollups_pruned"] = self.db.query(IntentScoreRollup).filter(
+                IntentScoreRollup.day < cutoff
+            ).delete(synchronize_session=False)
+            self.db.commit()
+        
+        elapsed = time.perf_counter() - started
+        logger.info(f"[ScoreHistory] Compaction finished in {elapsed:.2f}s: {stats}")
+        return stats
+    
+    def history(self, contact_id: int, days: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get a contact's current score and daily rollups, oldest day first.
+        
+        Scores not compacted yet are folded in on the fly, so the result
+        doesn't depend on when the compaction job last ran.
+        
+        Args:
+            contact_id: Contact to read
+            days: Only include the last ``days`` days
+        
+        Returns:
+            Dictionary with ``contact_id``, ``current`` (IntentScore or None)
+            and ``days`` (rollup dictionaries)
+        
+        Raises:
+            ValueError: If the contact doesn't exist
+        """
+        contact = self.db.get(Contact, contact_id)
+        if not contact:
+            raise ValueError(f"Contact {contact_id} not found")
+        
+        since = datetime.now(timezone.utc).date() - timedelta(days=days) if days else None
+        query = self.db.query(IntentScoreRollup).filter(IntentScoreRollup.contact_id == contact_id)
+        if since:
+            query = query.filter(IntentScoreRollup.day >= since)
+        rollups = {rollup.day: self._as_dict(rollup) for rollup in query}
+        
+        scores = list(reversed(contact.intent_scores))
+        for day, points in groupby(scores[:-1], key=lambda score: self._day(score.calculated_at)):
+            if since and day < since:
+                continue
+            rollups[day] = self._merge(rollups.get(day), list(points))
+        
+        return {
+            "contact_id": contact_id,
+            "current": scores[-1] if scores else None,
+            "days": [rollups[day] for day in sorted(rollups)]
+        }
+    
+    def _roll_up(self, scores: Sequence[Any]) -> int:
+        """
+        Merge superseded scores into their daily rollups.
+        
+        ``scores`` must be ordered by contact and calculation time. Returns
+        the number of rollups created or updated.
+        """
+        by_day: Dict[Tuple[int, date], List[Any]] = {}
+        for score in scores:
+            by_day.setdefault((score.contact_id, self._day(score.calculated_at)), []).append(score)
+        if not by_day:
+            return 0
+        
+        existing = {
+            (rollup.contact_id, rollup.day): rollup
+            for rollup in self.db.query(IntentScoreRollup).filter(
+                IntentScoreRollup.contact_id.in_({contact_id for contact_id, _ in by_day}),
+                IntentScoreRollup.day.in_({day for _, day in by_day})
+            )
+        }
+        for (contact_id, day), points in by_day.items():
+            rollup = existing.get((contact_id, day))
+            merged = self._merge(self._as_dict(rollup), points)
+            if rollup is None:
+                self.db.add(IntentScoreRollup(**merged))
+            else:
+                for key, value in merged.items():
+                    setattr(rollup, key, value)
+        return len(by_day)
+    
+    @classmethod
+    def _merge(cls, rollup: Optional[Dict[str, Any]], scores: Sequence[Any]) -> Dict[str, Any]:
+        """
+        Extend a rollup dictionary (or start one) with later scores of the same day.
+        
+        Compaction always rolls up scores newer than those already in a
+        rollup, since each contact's latest score is kept back.
+        """
+        labels = [score.score for score in scores]
+        values = [score.score_value for score in scores]
+        transitions = sum(1 for previous, label in zip(labels, labels[1:]) if previous != label)
+        if rollup is None:
+            return {
+                "contact_id": scores[0].contact_id,
+                "day": cls._day(scores[0].calculated_at),
+                "first_label": labels[0],
+                "last_label": labels[-1],
+                "transitions": transitions,
+                "min_score_value": min(values),
+                "max_score_value": max(values),
+                "last_score_value": values[-1],
+                "score_count": len(scores)
+            }
+        return {
+            **rollup,
+            "last_label": labels[-1],
+            "transitions": rollup["transitions"] + transitions + (rollup["last_label"] != labels[0]),
+            "min_score_value": min(rollup["min_score_value"], *values),
+            "max_score_value": max(rollup["max_score_value"], *values),
+            "last_score_value": values[-1],
+            "score_count": rollup["score_count"] + len(scores)
+        }
+    
+    @staticmethod
+    def _as_dict(rollup: Optional[IntentScoreRollup]) -> Optional[Dict[str, Any]]:
+        if rollup is None:
+            return None
+        return {
+            "contact_id": rollup.contact_id,
+            "day": rollup.day,
+            "first_label": rollup.first_label,
+            "last_label": rollup.last_label,
+            "transitions": rollup.transitions,
+            "min_score_value": rollup.min_score_value,
+            "max_score_value": rollup.max_score_value,
+            "last_score_value": rollup.last_score_value,
+            "score_count": rollup.score_count
+        }
+    
+    @staticmethod
+    def _day(calculated_at: datetime) -> date:
+        """UTC day of a score (naive timestamps are taken as UTC)."""
+        if calculated_at.tzinfo is not None:
+            calculated_at = calculated_at.astimezone(timezone.utc)
+        return calculated_at.date()
@@ -0,0 +1,166 @@
+"""Set-based intent relabeling for threshold changes."""
+import logging
+import time
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session
+from typing import Any, Dict, Optional
+from app.config import get_settings
+from app.models.contact import Contact
+from app.models.intent_score import IntentScore
+from app.services.intent_scorer import IntentScoringService
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class ScoreRelabelService:
+    """
+    Apply new intent thresholds without rescoring.
+    
+    Labels only depend on a score value and the thresholds, so a threshold
+    change needs no keyword matching: stored labels are rewritten with one
+    ``UPDATE ... SET score = CASE ...`` per ID range, and contacts scored
+    under the previous thresholds are moved to the new rule version so they
+    don't read as stale. Contact labels are derived on read and change as
+    soon as the new thresholds are configured.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    @staticmethod
+    def _check_thresholds(high_threshold: float, medium_threshold: float):
+        if not 0 <= medium_threshold <= high_threshold:
+            raise ValueError("Thresholds must satisfy 0 <= medium_threshold <= high_threshold")
+    
+    def preview(
+        self,
+        high_threshold: float,
+        medium_threshold: float,
+        from_high_threshold: Optional[float] = None,
+        from_medium_threshold: Optional[float] = None
+    ) -> Dict[str, Any]:
+        """
+        Count how many contacts would move between labels under new thresholds.
+        
+        Compares each scored contact's current label with the configured
+        (or given) thresholds against its label with the proposed ones, in
+        one grouped query.
+        
+        Args:
+            high_threshold: Proposed HIGH threshold
+            medium_threshold: Proposed MEDIUM threshold
+            from_high_threshold: HIGH threshold to compare with (default: configured)
+            from_medium_threshold: MEDIUM threshold to compare with (default: configured)
+        
+        Returns:
+            Dictionary with ``transitions`` (from, to, contacts), ``moved``
+            and ``total``
+        
+        Raises:
+            ValueError: If the thresholds are out of order
+        """
+        self._check_thresholds(high_threshold, medium_threshold)
+        value = IntentScoringService.current_score_expression()
+        labels = self.db.query(
+            IntentScoringService.label_expression(value, from_high_threshold, from_medium_threshold).label("current"),
+            IntentScoringService.label_expression(value, high_threshold, medium_threshold).label("proposed")
+        ).filter(
+            Contact.intent_base_score.is_not(None)
+        ).subquery()
+        
+        rows = self.db.query(
+            labels.c.current, labels.c.proposed, func.count()
+        ).group_by(labels.c.current, labels.c.proposed).all()
+        
+        transitions = [
+            {"from": current, "to": proposed, "contacts": count}
+            for current, proposed, count in sorted(rows)
+        ]
+        return {
+            "high_threshold": high_threshold,
+            "medium_threshold": medium_threshold,
+            "transitions": transitions,
+            "moved": sum(t["contacts"] for t in transitions if t["from"] != t["to"]),
+            "total": sum(t["contacts"] for t in transitions)
+        }
+    
+    def relabel(
+        self,
+        previous_high_threshold: float,
+        previous_medium_threshold: float,
+        batch_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Relabel stored scores with the configured thresholds.
+        
+        Run after changing INTENT_HIGH_THRESHOLD / INTENT_MEDIUM_THRESHOLD.
+        Each ID range is a single UPDATE, committed on its own; only rows
+        whose label actually changes are written.
+        
+        Args:
+            previous_high_threshold: HIGH threshold the scores were built with
+            previous_medium_threshold: MEDIUM threshold the scores were built with
+            batch_size: IDs per UPDATE (default: INTENT_BATCH_CHUNK_SIZE)
+        
+        Returns:
+            Dictionary with ``relabeled`` scores and ``version_bumped`` contacts
+        
+        Raises:
+            ValueError: If the thresholds are out of order
+        """
+        self._check_thresholds(previous_high_threshold, previous_medium_threshold)
+        batch_size = batch_size or settings.intent_batch_chunk_size
+        started = time.perf_counter()
+        
+        label = IntentScoringService.label_expression(IntentScore.score_value)
+        relabeled = self._update_in_ranges(
+            IntentScore,
+            lambda low, high: update(IntentScore).where(
+                IntentScore.id > low,
+                IntentScore.id <= high,
+                IntentScore.score != label
+            ).values(score=label),
+            batch_size
+        )
+        
+        previous_version = IntentScoringService.compute_rule_version(
+            high_threshold=previous_high_threshold,
+            medium_threshold=previous_medium_threshold
+        )
+        current_version = IntentScoringService.compute_rule_version()
+        version_bumped = 0
+        if previous_version != current_version:
+            version_bumped = self._update_in_ranges(
+                Contact,
+                lambda low, high: update(Contact).where(
+                    Contact.id > low,
+                    Contact.id <= high,
+                    Contact.score_rule_version == previous_version
+                ).values(score_rule_version=current_version),
+                batch_size
+            )
+        
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"[IntentScorer] Relabeled {relabeled} scores and moved {version_bumped} contacts "
+            f"to rule version {current_version} in {elapsed:.2f}s"
+        )
+        return {"relabeled": relabeled, "version_bumped": version_bumped}
+    
+    def _update_in_ranges(self, model, statement_for_range, batch_size: int) -> int:
+        """Run an UPDATE over consecutive primary key ranges of ``batch_size`` IDs."""
+        max_id = self.db.query(func.max(model.id)).scalar()
+        if max_id is None:
+            return 0
+        
+        updated = 0
+        low = (self.db.query(func.min(model.id)).scalar() or 1) - 1
+        while low < max_id:
+            result = self.db.execute(
+                statement_for_range(low, low + batch_size).execution_options(synchronize_session=False)
+            )
+            self.db.commit()
+            updated += result.rowcount
+            low += batch_size
+        return updated
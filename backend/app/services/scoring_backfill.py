@@ -0,0 +1,193 @@
+"""Resumable multi-process intent scoring backfill."""
+import logging
+import os
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import datetime, timezone
+from sqlalchemy.orm import Session
+from typing import Dict, Optional, Tuple
+from app.config import get_settings
+from app.database import SessionLocal, engine
+from app.models import audience  # noqa: F401 -- registers Contact relationship targets in workers
+from app.models.contact import Contact
+from app.models.scoring_backfill import ScoringBackfill
+from app.services.batch_scorer import BatchIntentScorer
+from app.services.intent_scorer import IntentScoringService
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+BACKFILL_MODES = ("all", "stale", "unscored")
+
+
+def _init_worker():
+    """Drop connections inherited from the parent; each worker opens its own."""
+    engine.dispose(close=False)
+
+
+def _score_range(
+    first_id: int,
+    last_id: int,
+    mode: str,
+    now: datetime
+) -> Dict[str, int]:
+    """Worker entry point: score one ID range in its own session."""
+    db = SessionLocal()
+    try:
+        return BatchIntentScorer(db).score_range(first_id, last_id, mode, now)
+    finally:
+        db.close()
+
+
+class ScoringBackfillService:
+    """
+    Rescore contacts in parallel, in keyset-paginated ID ranges.
+    
+    The parent process only walks the contacts primary key to cut ranges
+    of ``chunk_size`` IDs; worker processes load, score and bulk write
+    each range in their own transaction. Progress is checkpointed in
+    ``scoring_backfills`` as the highest ID below which every range is
+    done, so an interrupted backfill resumes from there (ranges finished
+    out of order past the checkpoint are simply redone).
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def start_or_resume(self, mode: str = "all") -> ScoringBackfill:
+        """
+        Get the unfinished backfill for ``mode`` and the current rules, or start one.
+        
+        Args:
+            mode: "all", "stale" or "unscored" (see ``BatchIntentScorer.score_range``)
+        
+        Returns:
+            ScoringBackfill to run
+        """
+        if mode not in BACKFILL_MODES:
+            raise ValueError(f"Unknown backfill mode: {mode}")
+        rule_version = IntentScoringService.compute_rule_version()
+        backfill = self.db.query(ScoringBackfill).filter(
+            ScoringBackfill.mode == mode,
+            ScoringBackfill.rule_version == rule_version,
+            ScoringBackfill.status != "completed"
+        ).order_by(ScoringBackfill.id.desc()).first()
+        if backfill:
+            logger.info(f"[Backfill] Resuming backfill {backfill.id} after contact {backfill.last_contact_id}")
+            backfill.status = "running"
+            backfill.error = None
+        else:
+            backfill = ScoringBackfill(
+                mode=mode,
+                rule_version=rule_version,
+                status="running",
+                last_contact_id=0,
+                contacts_scanned=0,
+                contacts_scored=0
+            )
+            self.db.add(backfill)
+        self.db.commit()
+        return backfill
+    
+    def run(
+        self,
+        backfill: ScoringBackfill,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None
+    ) -> ScoringBackfill:
+        """
+        Score every remaining range of a backfill.
+        
+        Args:
+            backfill: Backfill from ``start_or_resume``
+            workers: Worker processes (default: INTENT_BACKFILL_WORKERS, or one per CPU)
+            chunk_size: Contacts per range (default: INTENT_BATCH_CHUNK_SIZE)
+        
+        Returns:
+            The backfill, completed (or failed, with the worker error re-raised)
+        """
+        workers = workers or settings.intent_backfill_workers or os.cpu_count() or 1
+        chunk_size = chunk_size or settings.intent_batch_chunk_size
+        now = datetime.now(timezone.utc)
+        started = time.perf_counter()
+        scanned = 0
+        
+        # Ranges in ID order; the checkpoint only advances over a finished prefix
+        submitted: deque = deque()
+        finished: Dict[Tuple[int, int], Dict[str, int]] = {}
+        pending = {}
+        next_after = backfill.last_contact_id
+        
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+            try:
+                while True:
+                    while len(pending) < workers * 2:
+                        bounds = self._next_range(next_after, chunk_size)
+                        if bounds is None:
+                            break
+                        future = pool.submit(_score_range, *bounds, backfill.mode, now)
+                        pending[future] = bounds
+                        submitted.append(bounds)
+                        next_after = bounds[1]
+                    if not pending:
+                        break
+                    
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        finished[pending.pop(future)] = future.result()
+                    
+                    if not (submitted and submitted[0] in finished):
+                        continue
+                    while submitted and submitted[0] in finished:
+                        bounds = submitted.popleft()
+                        result = finished.pop(bounds)
+                        backfill.last_contact_id = bounds[1]
+                        backfill.contacts_scanned += result["scanned"]
+                        backfill.contacts_scored += result["scored"]
+                        scanned += result["scanned"]
+                    self.db.commit()
+                    
+                    elapsed = time.perf_counter() - started
+                    logger.info(
+                        f"[Backfill] {backfill.contacts_scanned} scanned, {backfill.contacts_scored} scored, "
+                        f"checkpoint at contact {backfill.last_contact_id} ({scanned / elapsed:,.0f} rows/s)"
+                    )
+            except Exception as e:
+                for future in pending:
+                    future.cancel()
+                self.db.rollback()
+                backfill.status = "failed"
+                backfill.error = str(e)
+                self.db.commit()
+                logger.error(f"[Backfill] Backfill {backfill.id} failed at contact {backfill.last_contact_id}: {e}")
+                raise
+        
+        backfill.status = "completed"
+        backfill.completed_at = datetime.now(timezone.utc)
+        self.db.commit()
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"[Backfill] Backfill {backfill.id} completed: {scanned} contacts in {elapsed:.1f}s "
+            f"({scanned / elapsed if elapsed else 0:,.0f} rows/s, {workers} workers)"
+        )
+        return backfill
+    
+    def _next_range(self, after_id: int, chunk_size: int) -> Optional[Tuple[int, int]]:
+        """
+        Cut the next range of up to ``chunk_size`` contacts after ``after_id``.
+        
+        Uses the primary key index only: the first ID after ``after_id`` and
+        the ID ``chunk_size - 1`` rows further (or the last ID).
+        """
+        first_id = self.db.query(Contact.id).filter(
+            Contact.id > after_id
+        ).order_by(Contact.id).limit(1).scalar()
+        if first_id is None:
+            return None
+        last_id = self.db.query(Contact.id).filter(
+            Contact.id >= first_id
+        ).order_by(Contact.id).offset(chunk_size - 1).limit(1).scalar()
+        if last_id is None:
+            last_id = self.db.query(Contact.id).order_by(Contact.id.desc()).limit(1).scalar()
+        return first_id, last_id
@@ -0,0 +1,232 @@
+"""Intent scoring rule sets: defaults, compilation and the in-process cache."""
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Sequence
+from sqlalchemy.exc import SQLAlchemyError
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.scoring_rule_set import ScoringRuleSet
+from app.utils.keyword_matcher import TieredKeywordMatcher, compile_tiers
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# Keyword tiers, in the order their weights are added up
+TIERS = ("high", "medium", "low")
+
+# Rules in effect until a rule set is stored and activated
+DEFAULT_KEYWORDS = {
+    "high": [
+        "looking for",
+        "need",
+        "urgent",
+        "quote",
+        "estimate",
+        "pricing",
+        "buy",
+        "purchase",
+        "hire",
+        "service",
+        "help",
+        "repair",
+        "install",
+        "replace"
+    ],
+    "medium": [
+        "compare",
+        "review",
+        "best",
+        "top",
+        "near me",
+        "local",
+        "contact",
+        "call",
+        "schedule"
+    ],
+    "low": [
+        "what is",
+        "how to",
+        "diy",
+        "tutorial",
+        "free",
+        "information"
+    ]
+}
+DEFAULT_WEIGHTS = {"high": 0.3, "medium": 0.15, "low": 0.05}
+DEFAULT_RECENCY_BOOST = 0.2
+DEFAULT_SOURCE_BOOST = 0.1
+
+
+class ScoringRules:
+    """
+    An immutable intent rule set with its compiled keyword matcher.
+    
+    Keywords are lowercased (texts are matched lowercased) and
+    de-duplicated within a tier; tiers are always ``TIERS``.
+    """
+    
+    def __init__(
+        self,
+        keywords: Dict[str, Sequence[str]],
+        weights: Dict[str, float],
+        recency_boost: float,
+        source_boost: float,
+        rule_set_id: Optional[int] = None
+    ):
+        if set(keywords) != set(TIERS) or set(weights) != set(TIERS):
+            raise ValueError(f"Rule sets need keywords and weights for exactly these tiers: {', '.join(TIERS)}")
+        self.keywords = {
+            tier: list(dict.fromkeys(keyword.strip().lower() for keyword in keywords[tier] if keyword.strip()))
+            for tier in TIERS
+        }
+        self.weights = {tier: float(weights[tier]) for tier in TIERS}
+        self.recency_boost = float(recency_boost)
+        self.source_boost = float(source_boost)
+        self.rule_set_id = rule_set_id
+        self.version = hashlib.sha256(json.dumps(self.to_dict(), sort_keys=True).encode("utf-8")).hexdigest()[:16]
+        self._matcher: Optional[TieredKeywordMatcher] = None
+    
+    @classmethod
+    def defaults(cls) -> "ScoringRules":
+        """The built-in rules."""
+        return cls(DEFAULT_KEYWORDS, DEFAULT_WEIGHTS, DEFAULT_RECENCY_BOOST, DEFAULT_SOURCE_BOOST)
+    
+    @classmethod
+    def from_model(cls, rule_set: ScoringRuleSet) -> "ScoringRules":
+        """Build the rules stored in a ScoringRuleSet row."""
+        return cls(
+            rule_set.keywords,
+            rule_set.weights,
+            rule_set.recency_boost,
+            rule_set.source_boost,
+            rule_set_id=rule_set.id
+        )
+    
+    @property
+    def matcher(self) -> TieredKeywordMatcher:
+        """Single-pass matcher for the keyword tiers, compiled on first use."""
+        if self._matcher is None:
+            self._matcher = compile_tiers(self.keywords, self.weights)
+        return self._matcher
+    
+    @property
+    def keyword_list(self) -> List[str]:
+        """All keywords, tier by tier; compact signals store indices into this list."""
+        return self.matcher.matcher.keywords
+    
+    def keywords_for(self, keyword_ids: Sequence[int]) -> List[str]:
+        """Distinct keywords behind a list of keyword indices, sorted."""
+        keywords = self.keyword_list
+        return sorted({keywords[index] for index in keyword_ids})
+    
+    def keyword_tiers(self) -> Dict[str, tuple]:
+        """Map each keyword to the tiers it appears in."""
+        tiers: Dict[str, tuple] = {}
+        for tier in TIERS:
+            for keyword in self.keywords[tier]:
+                tiers[keyword] = tiers.get(keyword, ()) + (tier,)
+        return tiers
+    
+    def to_dict(self) -> Dict:
+        """Plain-data form, as stored on ScoringRuleSet."""
+        return {
+            "keywords": self.keywords,
+            "weights": self.weights,
+            "recency_boost": self.recency_boost,
+            "source_boost": self.source_boost
+        }
+
+
+class RuleSetCache:
+    """
+    Process-wide cache of the active rule set.
+    
+    The active version is re-checked at most every
+    ``intent_rules_refresh_seconds``; the full rule set is only loaded and
+    compiled when that version changed. Activating a rule set swaps it in
+    immediately in the activating process and within the refresh interval
+    everywhere else, without a restart.
+    """
+    
+    def __init__(self, refresh_seconds: int):
+        self.refresh_seconds = refresh_seconds
+        self._rules: Optional[ScoringRules] = None
+        self._by_version: Dict[str, ScoringRules] = {}
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+    
+    def current(self) -> ScoringRules:
+        """Get the active rules, reloading them if the check interval passed."""
+        if self._rules is None or time.monotonic() - self._checked_at >= self.refresh_seconds:
+            with self._lock:
+                if self._rules is None or time.monotonic() - self._checked_at >= self.refresh_seconds:
+                    self._reload()
+        return self._rules
+    
+    def for_version(self, version: str) -> Optional[ScoringRules]:
+        """
+        Get the rules with a given version (active, default or stored), or None.
+        
+        Compiled rule sets are kept, so expanding many signals only loads
+        each version once.
+        """
+        current = self.current()
+        if current.version == version:
+            return current
+        if version not in self._by_version:
+            defaults = ScoringRules.defaults()
+            if defaults.version == version:
+                rules = defaults
+            else:
+                db = SessionLocal()
+                try:
+                    rule_set = db.query(ScoringRuleSet).filter(ScoringRuleSet.version == version).first()
+                    rules = ScoringRules.from_model(rule_set) if rule_set else None
+                except SQLAlchemyError as e:
+                    logger.warning(f"[ScoringRules] Could not load rule set {version}: {e}")
+                    return None
+                finally:
+                    db.close()
+                if rules is None:
+                    return None
+            self._by_version[version] = rules
+        return self._by_version[version]
+    
+    def set(self, rules: ScoringRules):
+        """Swap in rules that were just activated."""
+        with self._lock:
+            self._rules = rules
+            self._checked_at = time.monotonic()
+    
+    def invalidate(self):
+        """Force a reload on the next ``current`` call."""
+        self._checked_at = 0.0
+    
+    def _reload(self):
+        db = SessionLocal()
+        try:
+            active = db.query(ScoringRuleSet.id, ScoringRuleSet.version).filter(
+                ScoringRuleSet.is_active.is_(True)
+            ).order_by(ScoringRuleSet.activated_at.desc()).first()
+            if active is None:
+                rules = ScoringRules.defaults()
+            elif self._rules is not None and self._rules.version == active.version:
+                rules = self._rules
+            else:
+                rules = ScoringRules.from_model(db.get(ScoringRuleSet, active.id))
+                logger.info(f"[ScoringRules] Loaded rule set {active.id} (version {active.version})")
+        except SQLAlchemyError as e:
+            # No rule set table yet (or the database is unreachable): keep what we have
+            logger.warning(f"[ScoringRules] Could not load the active rule set: {e}")
+            rules = self._rules or ScoringRules.defaults()
+        finally:
+            db.close()
+        self._rules = rules
+        self._checked_at = time.monotonic()
+
+
+# Shared by every request, batch job and worker process
+scoring_rules = RuleSetCache(settings.intent_rules_refresh_seconds)
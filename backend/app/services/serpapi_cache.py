@@ -0,0 +1,139 @@
+"""Response cache for SerpAPI searches."""
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+from typing import Dict, Any, Optional
+from app.config import get_settings
+from app.models.serpapi_search import SerpAPISearch
+from app.services.serpapi_payload_store import SerpAPIPayloadStore
+
+settings = get_settings()
+
+
+class _LRUCache:
+    """Small thread-safe LRU map of cache key -> (search_id, results, stored_at)."""
+    
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+    
+    def put(self, key: str, entry: tuple):
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+    
+    def discard(self, key: str):
+        with self._lock:
+            self._entries.pop(key, None)
+    
+    def __len__(self):
+        return len(self._entries)
+
+
+_memory = _LRUCache(settings.serpapi_cache_memory_size)
+_stats = {"memory_hits": 0, "db_hits": 0, "misses": 0}
+_stats_lock = threading.Lock()
+
+
+def _count(counter: str):
+    with _stats_lock:
+        _stats[counter] += 1
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """Get hit/miss counters for the SerpAPI response cache."""
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats["memory_hits"] + stats["db_hits"] + stats["misses"]
+    hits = stats["memory_hits"] + stats["db_hits"]
+    return {
+        **stats,
+        "hit_rate": round(hits / lookups, 4) if lookups else 0.0,
+        "memory_entries": len(_memory),
+        "ttl_seconds": settings.serpapi_cache_ttl_seconds
+    }
+
+
+class SerpAPICache:
+    """
+    Two-tier cache for SerpAPI responses.
+    
+    Responses are already stored with each ``serpapi_searches`` row; this
+    looks them up by a hash of the normalized search parameters, with an
+    in-process LRU tier in front of the database. Searches whose raw
+    response was pruned never count as hits. The in-process tier is only
+    filled from database hits, i.e. committed searches, so it never
+    points at a search whose import was rolled back.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    @staticmethod
+    def make_key(query: str, location: Optional[str], num_results: int, start: int = 0) -> str:
+        """Build a cache key from normalized search parameters."""
+        normalized = [
+            " ".join((query or "").lower().split()),
+            " ".join((location or "").lower().split()),
+            int(num_results),
+            int(start or 0)
+        ]
+        return hashlib.sha256(json.dumps(normalized).encode("utf-8")).hexdigest()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a fresh-enough cached response.
+        
+        Args:
+            key: Cache key from ``make_key``
+        
+        Returns:
+            Dictionary with ``search_id`` and ``results``, or None on a miss
+        """
+        ttl = settings.serpapi_cache_ttl_seconds
+        if ttl <= 0:
+            return None
+        
+        entry = _memory.get(key)
+        if entry is not None:
+            search_id, results, stored_at = entry
+            if time.time() - stored_at < ttl:
+                _count("memory_hits")
+                return {"search_id": search_id, "results": results}
+            _memory.discard(key)
+        
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=ttl)
+        record = self.db.query(SerpAPISearch).filter(
+            SerpAPISearch.cache_key == key,
+            SerpAPISearch.searched_at >= cutoff,
+            or_(SerpAPISearch.payload_id.isnot(None), SerpAPISearch.raw_response.isnot(None))
+        ).order_by(SerpAPISearch.searched_at.desc()).first()
+        
+        results = SerpAPIPayloadStore(self.db).get_response(record) if record is not None else None
+        if results is None:
+            _count("misses")
+            return None
+        
+        _count("db_hits")
+        searched_at = record.searched_at
+        if searched_at.tzinfo is None:
+            searched_at = searched_at.replace(tzinfo=timezone.utc)
+        _memory.put(key, (record.id, results, searched_at.timestamp()))
+        return {"search_id": record.id, "results": results}
@@ -0,0 +1,93 @@
+"""Async SerpAPI HTTP client."""
+import httpx
+from typing import Dict, Any, Optional
+from app.config import get_settings
+
+settings = get_settings()
+
+
+class SerpAPIClient:
+    """
+    Async client for the SerpAPI search endpoint.
+    
+    Wraps a single pooled ``httpx.AsyncClient`` so connections are kept
+    alive and reused across requests. Use ``get_serpapi_client()`` to get
+    the process-wide instance instead of creating one per request.
+    """
+    
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None
+    ):
+        self._client = httpx.AsyncClient(
+            base_url=base_url or settings.serpapi_base_url,
+            timeout=httpx.Timeout(
+                settings.serpapi_timeout_seconds,
+                connect=settings.serpapi_connect_timeout_seconds
+            ),
+            limits=httpx.Limits(
+                max_connections=settings.serpapi_max_connections,
+                max_keepalive_connections=settings.serpapi_max_keepalive_connections,
+                keepalive_expiry=settings.serpapi_keepalive_expiry_seconds
+            ),
+            transport=transport
+        )
+    
+    async def search(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run a search against SerpAPI.
+        
+        Args:
+            params: SerpAPI query parameters, including ``api_key``
+        
+        Returns:
+            Parsed JSON response
+        """
+        try:
+            response = await self._client.get(
+                "/search",
+                params={**params, "output": "json"}
+            )
+        except httpx.TimeoutException:
+            raise ValueError("SerpAPI request timed out")
+        except httpx.HTTPError as e:
+            raise ValueError(f"SerpAPI request failed: {type(e).__name__}: {str(e)}")
+        
+        try:
+            results = response.json()
+        except ValueError:
+            raise ValueError(f"SerpAPI returned a non-JSON response (HTTP {response.status_code})")
+        
+        # SerpAPI reports errors as {"error": "..."} with a 4xx/5xx status
+        if isinstance(results, dict) and "error" in results:
+            raise ValueError(f"SerpAPI error: {results['error']}")
+        if response.status_code != 200:
+            raise ValueError(f"SerpAPI returned HTTP {response.status_code}")
+        if not isinstance(results, dict):
+            raise ValueError(f"SerpAPI returned error: {results}")
+        
+        return results
+    
+    async def aclose(self):
+        """Close pooled connections."""
+        await self._client.aclose()
+
+
+_client: Optional[SerpAPIClient] = None
+
+
+def get_serpapi_client() -> SerpAPIClient:
+    """Get the shared SerpAPI client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = SerpAPIClient()
+    return _client
+
+
+async def close_serpapi_client():
+    """Close the shared SerpAPI client (called on app shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
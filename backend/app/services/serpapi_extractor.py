@@ -0,0 +1,152 @@
+"""Precompiled industry and location extraction for SerpAPI results."""
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Query keyword -> industry, in priority order (earlier entries win)
+INDUSTRY_KEYWORDS: List[Tuple[str, str]] = [
+    ("plumber", "Plumbing"),
+    ("plumbing", "Plumbing"),
+    ("lawyer", "Legal Services"),
+    ("attorney", "Legal Services"),
+    ("roofer", "Roofing"),
+    ("roofing", "Roofing"),
+    ("contractor", "Construction"),
+    ("electrician", "Electrical Services"),
+    ("hvac", "HVAC Services"),
+    ("dentist", "Dental"),
+    ("doctor", "Medical"),
+    ("restaurant", "Restaurant"),
+    ("mechanic", "Auto Repair"),
+    ("auto repair", "Auto Repair"),
+    ("real estate", "Real Estate"),
+    ("insurance", "Insurance"),
+    ("accountant", "Accounting"),
+    ("marketing", "Marketing"),
+    ("cleaning", "Cleaning Services"),
+    ("landscaping", "Landscaping"),
+    ("painter", "Painting"),
+    ("painting", "Painting"),
+]
+
+US_STATES: Dict[str, str] = {
+    "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas",
+    "CA": "California", "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware",
+    "DC": "District of Columbia", "FL": "Florida", "GA": "Georgia", "HI": "Hawaii",
+    "ID": "Idaho", "IL": "Illinois", "IN": "Indiana", "IA": "Iowa",
+    "KS": "Kansas", "KY": "Kentucky", "LA": "Louisiana", "ME": "Maine",
+    "MD": "Maryland", "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota",
+    "MS": "Mississippi", "MO": "Missouri", "MT": "Montana", "NE": "Nebraska",
+    "NV": "Nevada", "NH": "New Hampshire", "NJ": "New Jersey", "NM": "New Mexico",
+    "NY": "New York", "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio",
+    "OK": "Oklahoma", "OR": "Oregon", "PA": "Pennsylvania", "PR": "Puerto Rico",
+    "RI": "Rhode Island", "SC": "South Carolina", "SD": "South Dakota", "TN": "Tennessee",
+    "TX": "Texas", "UT": "Utah", "VT": "Vermont", "VA": "Virginia",
+    "WA": "Washington", "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming",
+}
+
+
+class KeywordExtractor:
+    """
+    Find the highest-priority keyword contained in a text in one pass.
+    
+    All keywords are compiled into a single alternation, longest first,
+    inside a lookahead, so the regex engine reports the longest keyword
+    starting at every position, overlaps included. Any keyword occurring
+    in the text is either such a hit or a substring of one, so each hit
+    is credited with the best priority among the keywords it contains.
+    The result is the same as checking each keyword with ``in`` in list
+    order, even when keywords overlap ("need" / "need help").
+    """
+    
+    def __init__(self, keywords: Sequence[Tuple[str, str]]):
+        priority = {}
+        for index, (keyword, _) in enumerate(keywords):
+            priority.setdefault(keyword, index)
+        self._labels = [label for _, label in keywords]
+        # Best priority among the keywords each keyword contains (itself included)
+        self._priority = {
+            keyword: min(index for other, index in priority.items() if other in keyword)
+            for keyword in priority
+        }
+        # Longest first, so the alternation takes the longest keyword at each position
+        ordered = sorted(priority, key=len, reverse=True)
+        self._pattern = re.compile("(?=(" + "|".join(re.escape(k) for k in ordered) + "))")
+    
+    def first(self, text: str) -> Optional[str]:
+        """Return the label of the highest-priority keyword in lowercased text."""
+        hits = self._pattern.findall(text)
+        if not hits:
+            return None
+        return self._labels[min(self._priority[hit] for hit in hits)]
+
+
+class LocationExtractor:
+    """
+    Match "City, ST" or "City, State Name" and check it against a US state gazetteer.
+    
+    The pattern is a lookahead so candidates overlap: in "Smith Plumbing,
+    Austin, TX" the rejected "Smith Plumbing, Austin" doesn't consume
+    "Austin", and "Austin, TX" is still tried.
+    """
+    
+    _PATTERN = re.compile(
+        r"(?=\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2}|[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*)\b)"
+    )
+    
+    def __init__(self, states: Dict[str, str]):
+        # The pattern only yields capitalized words, so keys keep their case
+        self._abbreviations = {name: abbr for abbr, name in states.items()}
+        self._abbreviations.update({abbr: abbr for abbr in states})
+        self._max_words = max(len(name.split()) for name in states.values())
+    
+    def find(self, text: str) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Find the first city/state pair in text whose state is a real one.
+        
+        Returns:
+            Tuple of (city, two-letter state), or (None, None)
+        """
+        for match in self._PATTERN.finditer(text):
+            state = self._abbreviations.get(match.group(2))
+            if state:
+                return match.group(1), state
+            words = match.group(2).split()
+            # "Austin, Texas Hill Country" -> try "Texas Hill Country", "Texas Hill", "Texas"
+            for size in range(min(len(words) - 1, self._max_words), 0, -1):
+                state = self._abbreviations.get(" ".join(words[:size]))
+                if state:
+                    return match.group(1), state
+        return None, None
+
+
+INDUSTRY_EXTRACTOR = KeywordExtractor(INDUSTRY_KEYWORDS)
+LOCATION_EXTRACTOR = LocationExtractor(US_STATES)
+
+
+@lru_cache(maxsize=4096)
+def extract_industry(query: str) -> Optional[str]:
+    """Infer an industry from a search query (cached; every result of a search shares it)."""
+    return INDUSTRY_EXTRACTOR.first(query.lower())
+
+
+def extract_location(text: str) -> Tuple[Optional[str], Optional[str]]:
+    """Find a "City, ST" location in free text."""
+    return LOCATION_EXTRACTOR.find(text)
+
+
+def parse_address(address: str) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Split a "street, city, ST 12345" address into city and state.
+    
+    Returns:
+        Tuple of (city, state), or (None, None)
+    """
+    if not address:
+        return None, None
+    parts = address.split(",")
+    if len(parts) < 2:
+        return None, None
+    city = parts[-2].strip()
+    state_zip = parts[-1].strip().split()
+    return city, state_zip[0] if state_zip else None
@@ -0,0 +1,226 @@
+"""Compressed, content-addressed storage for raw SerpAPI responses."""
+import hashlib
+import json
+import logging
+import os
+import threading
+import zlib
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import delete, exists, null
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+from typing import Dict, Any, Optional
+from app.config import get_settings
+from app.models.serpapi_payload import SerpAPIPayload
+from app.models.serpapi_search import SerpAPISearch
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+class SerpAPIPayloadStore:
+    """
+    Store raw SerpAPI responses once per distinct content.
+    
+    Responses are serialized to canonical JSON, hashed with sha256 and
+    zlib-compressed. The compressed bytes go inline in ``serpapi_payloads``
+    unless ``serpapi_blob_dir`` is set, in which case they are written to
+    ``<blob_dir>/<hash[:2]>/<hash>.json.z`` and the row keeps the path.
+    """
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    @staticmethod
+    def canonical_json(results: Dict[str, Any]) -> bytes:
+        """Serialize a response so equal content always gives equal bytes."""
+        return json.dumps(results, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    
+    def put(self, results: Dict[str, Any]) -> int:
+        """
+        Store a response, reusing the existing row if the content is known.
+        
+        Args:
+            results: Raw SerpAPI response
+        
+        Returns:
+            ID of the payload row
+        """
+        raw = self.canonical_json(results)
+        content_hash = hashlib.sha256(raw).hexdigest()
+        
+        existing = self._find(content_hash)
+        if existing is not None:
+            return existing
+        
+        compressed = zlib.compress(raw, settings.serpapi_payload_compression_level)
+        payload = SerpAPIPayload(
+            content_hash=content_hash,
+            encoding="zlib",
+            raw_size=len(raw),
+            stored_size=len(compressed)
+        )
+        if settings.serpapi_blob_dir:
+            payload.blob_path = self._write_blob(content_hash, compressed)
+        else:
+            payload.data = compressed
+        
+        # Another session may store the same content concurrently
+        try:
+            with self.db.begin_nested():
+                self.db.add(payload)
+        except IntegrityError:
+            return self._find(content_hash)
+        return payload.id
+    
+    def get(self, payload_id: int) -> Optional[Dict[str, Any]]:
+        """Load and decompress a stored response by payload ID."""
+        payload = self.db.get(SerpAPIPayload, payload_id)
+        if payload is None:
+            return None
+        return self.load(payload)
+    
+    def load(self, payload: SerpAPIPayload) -> Dict[str, Any]:
+        """Decompress a payload row back into the response dictionary."""
+        if payload.blob_path:
+            with open(os.path.join(settings.serpapi_blob_dir, payload.blob_path), "rb") as f:
+                compressed = f.read()
+        else:
+            compressed = payload.data
+        return json.loads(zlib.decompress(compressed))
+    
+    def get_response(self, search: SerpAPISearch) -> Optional[Dict[str, Any]]:
+        """Get the raw response of a search, whether compacted or legacy inline."""
+        if search.payload_id is not None:
+            return self.get(search.payload_id)
+        return search.raw_response
+    
+    def compact(self, retention_days: Optional[int] = None, batch_size: int = 500) -> Dict[str, int]:
+        """
+        Move legacy inline responses into the store and prune old payloads.
+        
+        Search rows are always kept; searches older than the retention
+        period only lose their raw response. Payloads no search points to
+        any more are deleted along with their blob files. Each batch of
+        orphans is locked (``FOR UPDATE SKIP LOCKED``) and rechecked by the
+        delete itself, so a payload that ``put`` is reusing concurrently
+        (it holds a share lock, see ``_find``) is left alone.
+        
+        Args:
+            retention_days: Keep raw responses this many days (0 keeps them
+                forever; defaults to ``serpapi_raw_retention_days``)
+            batch_size: Rows migrated per transaction
+        
+        Returns:
+            Dictionary with compaction stats
+        """
+        if retention_days is None:
+            retention_days = settings.serpapi_raw_retention_days
+        
+        stats = {"migrated": 0, "pruned": 0, "payloads_deleted": 0, "bytes_freed": 0}
+        cutoff = None
+        if retention_days > 0:
+            cutoff = datetime.now(timezone.utc) - timedelta(days=retention_days)
+        
+        # Legacy rows: inline JSON -> payload store (or straight to pruned)
+        last_id = 0
+        while True:
+            searches = self.db.query(SerpAPISearch).filter(
+                SerpAPISearch.id > last_id,
+                SerpAPISearch.raw_response.isnot(None)
+            ).order_by(SerpAPISearch.id).limit(batch_size).all()
+            if not searches:
+                break
+            for search in searches:
+                if search.raw_response and not self._expired(search, cutoff):
+                    search.payload_id = self.put(search.raw_response)
+                    stats["migrated"] += 1
+                else:
+                    stats["pruned"] += 1
+                # null() writes SQL NULL rather than a JSON 'null'
+                search.raw_response = null()
+            last_id = searches[-1].id
+            self.db.commit()
+        
+        if cutoff is not None:
+            stats["pruned"] += self.db.query(SerpAPISearch).filter(
+                SerpAPISearch.searched_at < cutoff,
+                SerpAPISearch.payload_id.isnot(None)
+            ).update({SerpAPISearch.payload_id: None}, synchronize_session=False)
+            self.db.commit()
+        
+        # Payloads no longer referenced by any search
+        unreferenced = ~exists().where(SerpAPISearch.payload_id == SerpAPIPayload.id)
+        last_id = 0
+        while True:
+            orphans = self.db.query(
+                SerpAPIPayload.id, SerpAPIPayload.stored_size, SerpAPIPayload.blob_path
+            ).filter(
+                SerpAPIPayload.id > last_id,
+                unreferenced
+            ).order_by(SerpAPIPayload.id).limit(batch_size).with_for_update(skip_locked=True).all()
+            if not orphans:
+                break
+            last_id = orphans[-1].id
+            orphan_ids = [payload.id for payload in orphans]
+            # Recheck in the delete: without row locks (SQLite) a search may reference one by now
+            self.db.execute(
+                delete(SerpAPIPayload).where(
+                    SerpAPIPayload.id.in_(orphan_ids),
+                    unreferenced
+                ).execution_options(synchronize_session=False)
+            )
+            kept = {
+                payload_id for (payload_id,) in
+                self.db.query(SerpAPIPayload.id).filter(SerpAPIPayload.id.in_(orphan_ids))
+            }
+            self.db.commit()
+            # Files go only once the rows are gone, so a failed commit loses nothing
+            for payload in orphans:
+                if payload.id in kept:
+                    continue
+                stats["bytes_freed"] += payload.stored_size
+                stats["payloads_deleted"] += 1
+                if payload.blob_path:
+                    self._remove_blob(payload.blob_path)
+        
+        logger.info(f"[SerpAPI] Payload compaction: {stats}")
+        return stats
+    
+    def _find(self, content_hash: str) -> Optional[int]:
+        """
+        Look up a payload by content hash.
+        
+        The row is share-locked until the caller commits, so ``compact``
+        can't delete it before the search reusing it is written.
+        """
+        row = self.db.query(SerpAPIPayload.id).filter(
+            SerpAPIPayload.content_hash == content_hash
+        ).with_for_update(read=True).first()
+        return row[0] if row else None
+    
+    def _expired(self, search: SerpAPISearch, cutoff: Optional[datetime]) -> bool:
+        if cutoff is None:
+            return False
+        searched_at = search.searched_at
+        if searched_at.tzinfo is None:
+            searched_at = searched_at.replace(tzinfo=timezone.utc)
+        return searched_at < cutoff
+    
+    def _write_blob(self, content_hash: str, compressed: bytes) -> str:
+        """Write compressed bytes to the blob directory; returns the relative path."""
+        relative_path = os.path.join(content_hash[:2], f"{content_hash}.json.z")
+        path = os.path.join(settings.serpapi_blob_dir, relative_path)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(compressed)
+            os.replace(tmp_path, path)
+        return relative_path
+    
+    def _remove_blob(self, relative_path: str):
+        try:
+            os.remove(os.path.join(settings.serpapi_blob_dir, relative_path))
+        except FileNotFoundError:
+            pass
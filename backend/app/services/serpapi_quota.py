@@ -0,0 +1,181 @@
+"""Rate limiting and credit budgets for SerpAPI requests."""
+import asyncio
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from typing import Dict, Any, Optional
+from app.config import get_settings
+from app.models.serpapi_usage import SerpAPIUsage
+
+settings = get_settings()
+
+
+class SerpAPIQuotaExceeded(Exception):
+    """Raised when a SerpAPI request is rejected by the rate limiter or a budget."""
+    
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = max(int(retry_after), 1)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket.
+    
+    Callers reserve a token up front; when the bucket is empty the token
+    is borrowed against future refills and the caller waits its turn, so
+    waiting callers are served in arrival order.
+    """
+    
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = max(capacity, 1)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def reserve(self, max_wait: Optional[float]) -> float:
+        """
+        Take one token.
+        
+        Args:
+            max_wait: Longest acceptable wait in seconds (None waits forever)
+        
+        Returns:
+            Seconds the caller must wait before proceeding
+        """
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+            if max_wait is not None and wait > max_wait:
+                raise SerpAPIQuotaExceeded(
+                    "SerpAPI rate limit reached, try again shortly",
+                    retry_after=wait
+                )
+            self._tokens -= 1
+            return wait
+    
+    def acquire(self, max_wait: Optional[float] = None):
+        """Take one token, sleeping if the caller has to queue."""
+        wait = self.reserve(max_wait)
+        if wait > 0:
+            time.sleep(wait)
+    
+    async def acquire_async(self, max_wait: Optional[float] = None):
+        """Take one token without blocking the event loop."""
+        wait = self.reserve(max_wait)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+rate_limiter = TokenBucket(settings.serpapi_rate_limit_per_second, settings.serpapi_rate_limit_burst)
+
+
+def _normalize_query(query: str) -> str:
+    return " ".join((query or "").lower().split())[:500]
+
+
+class SerpAPIQuotaService:
+    """Service for tracking SerpAPI credit usage against daily/monthly budgets."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def record_usage(self, query: str, credits: int = 1):
+        """Add a billed request to the usage ledger (flushed, not committed)."""
+        self.db.add(SerpAPIUsage(query=_normalize_query(query), credits=credits))
+    
+    def remaining_credits(self) -> Optional[int]:
+        """
+        Get credits left before the tighter of the daily/monthly budgets.
+        
+        Returns:
+            Remaining credits, or None when no budget is configured
+        """
+        remaining = None
+        for _, budget, since, _ in self._windows():
+            if budget > 0:
+                left = max(budget - self._used_since(since), 0)
+                remaining = left if remaining is None else min(remaining, left)
+        return remaining
+    
+    def check_budget(self, credits: int = 1):
+        """
+        Reject the request if it would exceed a budget.
+        
+        Raises:
+            SerpAPIQuotaExceeded: If the daily or monthly budget is spent
+        """
+        for period, budget, since, resets_at in self._windows():
+            if budget > 0 and self._used_since(since) + credits > budget:
+                raise SerpAPIQuotaExceeded(
+                    f"SerpAPI {period} credit budget of {budget} exhausted",
+                    retry_after=(resets_at - datetime.now(timezone.utc)).total_seconds()
+                )
+    
+    def get_usage(self, prefix_words: int = 1) -> Dict[str, Any]:
+        """
+        Summarize usage for the current day and month.
+        
+        Args:
+            prefix_words: Number of leading query words to group usage by
+        
+        Returns:
+            Dictionary with budget status and month-to-date usage by query prefix
+        """
+        (_, daily_budget, day_start, _), (_, monthly_budget, month_start, _) = self._windows()
+        daily_used = self._used_since(day_start)
+        monthly_used = self._used_since(month_start)
+        
+        rows = self.db.query(
+            SerpAPIUsage.query,
+            func.count(SerpAPIUsage.id),
+            func.sum(SerpAPIUsage.credits)
+        ).filter(
+            SerpAPIUsage.used_at >= month_start
+        ).group_by(SerpAPIUsage.query).all()
+        
+        by_prefix = defaultdict(lambda: {"searches": 0, "credits": 0})
+        for query, searches, credits in rows:
+            prefix = " ".join(query.split()[:max(prefix_words, 1)])
+            by_prefix[prefix]["searches"] += searches
+            by_prefix[prefix]["credits"] += credits or 0
+        
+        return {
+            "daily_used": daily_used,
+            "daily_budget": daily_budget or None,
+            "daily_remaining": max(daily_budget - daily_used, 0) if daily_budget else None,
+            "monthly_used": monthly_used,
+            "monthly_budget": monthly_budget or None,
+            "monthly_remaining": max(monthly_budget - monthly_used, 0) if monthly_budget else None,
+            "by_prefix": sorted(
+                ({"prefix": prefix, **stats} for prefix, stats in by_prefix.items()),
+                key=lambda row: row["credits"],
+                reverse=True
+            )
+        }
+    
+    def _used_since(self, since: datetime) -> int:
+        used = self.db.query(func.sum(SerpAPIUsage.credits)).filter(
+            SerpAPIUsage.used_at >= since
+        ).scalar()
+        return int(used or 0)
+    
+    def _windows(self):
+        """(name, budget, window start, window reset) for each budget window (UTC)."""
+        now = datetime.now(timezone.utc)
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        month_start = day_start.replace(day=1)
+        next_month = (month_start + timedelta(days=32)).replace(day=1)
+        return (
+            ("daily", settings.serpapi_daily_credit_budget, day_start, day_start + timedelta(days=1)),
+            ("monthly", settings.serpapi_monthly_credit_budget, month_start, next_month),
+        )
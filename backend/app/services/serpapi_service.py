@@ -1,18 +1,33 @@
 """SerpAPI integration service."""
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from serpapi import GoogleSearch
 from sqlalchemy.orm import Session
-from typing import List, Dict, Any
+from starlette.concurrency import run_in_threadpool
+from typing import List, Dict, Any, AsyncIterator, Iterable, Iterator, Optional, Set, Tuple
 from app.config import get_settings
 from app.models.contact import Contact
 from app.models.serpapi_search import SerpAPISearch
 from app.services.intent_scorer import IntentScoringService
+from app.services.serpapi_cache import SerpAPICache
+from app.services.serpapi_client import get_serpapi_client
+from app.services.serpapi_payload_store import SerpAPIPayloadStore
+from app.services.serpapi_extractor import extract_industry, extract_location, parse_address
+from app.services.serpapi_quota import SerpAPIQuotaService, rate_limiter
+from app.utils.identity import contact_identity_key
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 class SerpAPIService:
     """Service for integrating with SerpAPI."""
     
+    # Contact fields refreshed when a re-imported result matches an existing contact
+    UPSERT_FIELDS = ("company", "email", "phone", "industry", "location", "city", "state")
+    
     def __init__(self, db: Session):
         self.db = db
         self.intent_scorer = IntentScoringService(db)
@@ -21,23 +36,182 @@ class SerpAPIService:
         self,
         query: str,
         location: str = None,
-        num_results: int = 10
+        num_results: int = 10,
+        force_refresh: bool = False
     ) -> Dict[str, Any]:
         """
         Execute SerpAPI search and import results as contacts.
         
+        A stored response for the same normalized parameters is reused
+        if it is younger than ``SERPAPI_CACHE_TTL_SECONDS``.
+        
         Args:
             query: Search query
             location: Optional location filter
             num_results: Number of results to fetch
+            force_refresh: Bypass the response cache
             
         Returns:
             Dictionary with search results and import stats
+            
+        Raises:
+            SerpAPIQuotaExceeded: If the rate limit or a credit budget is hit
         """
+        cached = None if force_refresh else self.get_cached_results(query, location, num_results)
+        if cached:
+            return self.import_results(
+                query, cached["results"], location, num_results,
+                cached_search_id=cached["search_id"]
+            )
+        
+        SerpAPIQuotaService(self.db).check_budget()
+        results = self.fetch_results(query, location, num_results)
+        self.record_usage(query)
+        return self.import_results(query, results, location, num_results)
+    
+    async def search_and_import_async(
+        self,
+        query: str,
+        location: str = None,
+        num_results: int = 10,
+        force_refresh: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Async variant of ``search_and_import``.
+        
+        The upstream request goes through the shared async client, so no
+        worker thread is held while waiting on SerpAPI. Database work runs
+        in the threadpool.
+        
+        Args:
+            query: Search query
+            location: Optional location filter
+            num_results: Number of results to fetch
+            force_refresh: Bypass the response cache
+            
+        Returns:
+            Dictionary with search results and import stats
+            
+        Raises:
+            SerpAPIQuotaExceeded: If the rate limit or a credit budget is hit
+        """
+        if not force_refresh:
+            cached = await run_in_threadpool(self.get_cached_results, query, location, num_results)
+            if cached:
+                return await run_in_threadpool(
+                    self.import_results, query, cached["results"], location, num_results,
+                    cached_search_id=cached["search_id"]
+                )
+        
+        await run_in_threadpool(SerpAPIQuotaService(self.db).check_budget)
+        results = await self.fetch_results_async(query, location, num_results)
+        await run_in_threadpool(self.record_usage, query)
+        return await run_in_threadpool(self.import_results, query, results, location, num_results)
+    
+    def get_cached_results(
+        self,
+        query: str,
+        location: str = None,
+        num_results: int = 10,
+        start: int = 0
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Look up a fresh-enough stored response for these search params.
+        
+        Returns:
+            Dictionary with ``search_id`` and ``results``, or None
+        """
+        cache = SerpAPICache(self.db)
+        return cache.get(SerpAPICache.make_key(query, location, num_results, start))
+    
+    def fetch_results(
+        self,
+        query: str,
+        location: str = None,
+        num_results: int = 10,
+        wait_for_rate_limit: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Execute a SerpAPI search without touching the database.
+        
+        This is safe to call from worker threads, which is what the
+        batch search relies on. Credit budgets are checked by the caller;
+        the request rate limit is enforced here.
+        
+        Args:
+            query: Search query
+            location: Optional location filter
+            num_results: Number of results to fetch
+            wait_for_rate_limit: Queue for as long as the rate limiter
+                needs instead of rejecting after the configured max wait
+            
+        Returns:
+            Raw SerpAPI response dictionary
+        """
+        params = self._build_params(query, location, num_results)
+        rate_limiter.acquire(None if wait_for_rate_limit else settings.serpapi_rate_limit_max_wait_seconds)
+        
+        try:
+            search = GoogleSearch(params)
+            results = search.get_dict()
+            self._check_response(results)
+        except Exception as e:
+            raise ValueError(f"SerpAPI search failed: {str(e)}")
+        
+        return results
+    
+    async def fetch_results_async(
+        self,
+        query: str,
+        location: str = None,
+        num_results: int = 10,
+        start: int = 0
+    ) -> Dict[str, Any]:
+        """
+        Execute a SerpAPI search through the shared async client.
+        
+        Args:
+            query: Search query
+            location: Optional location filter
+            num_results: Number of results to fetch
+            start: Result offset (for paging)
+            
+        Returns:
+            Raw SerpAPI response dictionary
+        """
+        params = self._build_params(query, location, num_results, start)
+        await rate_limiter.acquire_async(settings.serpapi_rate_limit_max_wait_seconds)
+        
+        try:
+            results = await get_serpapi_client().search(params)
+            self._check_response(results)
+        except Exception as e:
+            raise ValueError(f"SerpAPI search failed: {str(e)}")
+        
+        return results
+    
+    def record_usage(self, query: str):
+        """
+        Commit a billed search to the usage ledger.
+        
+        Call this as soon as a search comes back from SerpAPI, before its
+        results are imported: the credit is spent even if the import
+        fails and rolls back.
+        """
+        SerpAPIQuotaService(self.db).record_usage(query)
+        self.db.commit()
+    
+    def _build_params(
+        self,
+        query: str,
+        location: str = None,
+        num_results: int = 10,
+        start: int = 0
+    ) -> Dict[str, Any]:
+        """Build SerpAPI query parameters."""
         if not settings.serpapi_api_key:
             raise ValueError("SERPAPI_API_KEY not configured")
         
-        # Execute search
         params = {
             "q": query,
             "api_key": settings.serpapi_api_key,
@@ -48,78 +222,519 @@ class SerpAPIService:
         if location:
             params["location"] = location
         
-        import logging
-        import json
-        logger = logging.getLogger(__name__)
+        if start:
+            params["start"] = start
         
-        try:
-            search = GoogleSearch(params)
-            results = search.get_dict()
+        return params
+    
+    def _check_response(self, results: Any):
+        """Log a raw SerpAPI response and raise if it is an error."""
+        # Log the raw SerpAPI response
+        logger.info("="*80)
+        logger.info("[SerpAPI] RAW RESPONSE:")
+        logger.info(json.dumps(results, indent=2, default=str))
+        logger.info("="*80)
+        
+        # Check if results is actually a dictionary (API can return error strings)
+        if not isinstance(results, dict):
+            raise ValueError(f"SerpAPI returned error: {results}")
+        
+        # Check for error in results
+        if "error" in results:
+            raise ValueError(f"SerpAPI error: {results['error']}")
+    
+    def import_results(
+        self,
+        query: str,
+        results: Dict[str, Any],
+        location: str = None,
+        num_results: int = None,
+        commit: bool = True,
+        cached_search_id: int = None
+    ) -> Dict[str, Any]:
+        """
+        Record a SerpAPI response and import its results as contacts.
+        
+        Args:
+            query: Search query the response belongs to
+            results: Raw SerpAPI response
+            location: Optional location filter used for the search
+            num_results: Number of results requested (part of the cache key)
+            commit: Commit the session when done (batch imports flush only)
+            cached_search_id: Search the response was served from; no new
+                search record is written when set
             
-            # Log the raw SerpAPI response
-            logger.info("="*80)
-            logger.info("[SerpAPI] RAW RESPONSE:")
-            logger.info(json.dumps(results, indent=2, default=str))
-            logger.info("="*80)
+        Returns:
+            Dictionary with search results and import stats
+        """
+        if cached_search_id is None:
+            search_id = self._record_search(query, results, location, num_results)
+        else:
+            search_id = cached_search_id
+        
+        # Parse and import contacts
+        created, updated = self._upsert_contacts(list(self._parse_results(results, query, location)))
+        
+        if commit:
+            self.db.commit()
+        else:
+            self.db.flush()
+        
+        # Calculate intent scores for new contacts
+        # (will be done automatically via IntentScoringService)
+        
+        return {
+            "search_id": search_id,
+            "query": query,
+            "results_count": self._count_results(results),
+            "contacts_created": len(created),
+            "contacts_updated": len(updated),
+            "cached": cached_search_id is not None
+        }
+    
+    async def search_and_import_pages(
+        self,
+        query: str,
+        location: str = None,
+        max_results: int = 100,
+        page_size: int = 10,
+        force_refresh: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Walk result pages and import each one as it arrives.
+        
+        Pages are requested at increasing ``start`` offsets until
+        ``max_results`` is reached or SerpAPI runs out of results. Every
+        page goes through parse -> dedupe -> insert -> score and is
+        committed before the next page is fetched, so memory stays flat
+        and pages already imported survive a later upstream failure.
+        
+        Args:
+            query: Search query
+            location: Optional location filter
+            max_results: Maximum number of organic results to walk
+            page_size: Results requested per page
+            force_refresh: Bypass the response cache
+            
+        Yields:
+            Import stats for each page
+        """
+        seen = set()
+        page = 0
+        async for start, results, cached_search_id in self._fetch_pages(
+            query, location, max_results, page_size, force_refresh
+        ):
+            page += 1
+            stats = await run_in_threadpool(
+                self.import_page, query, results, location, page_size, start, seen,
+                cached_search_id=cached_search_id
+            )
+            yield {"page": page, "start": start, **stats}
+    
+    async def _fetch_pages(
+        self,
+        query: str,
+        location: str,
+        max_results: int,
+        page_size: int,
+        force_refresh: bool
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any], Optional[int]]]:
+        """Yield (start, response, cached_search_id) for each result page."""
+        start = 0
+        while start < max_results:
+            num = min(page_size, max_results - start)
+            cached = None
+            if not force_refresh:
+                cached = await run_in_threadpool(self.get_cached_results, query, location, num, start)
+            
+            if cached:
+                results, cached_search_id = cached["results"], cached["search_id"]
+            else:
+                await run_in_threadpool(SerpAPIQuotaService(self.db).check_budget)
+                results = await self.fetch_results_async(query, location, num, start)
+                await run_in_threadpool(self.record_usage, query)
+                cached_search_id = None
+            
+            yield start, results, cached_search_id
             
-            # Check if results is actually a dictionary (API can return error strings)
-            if not isinstance(results, dict):
-                raise ValueError(f"SerpAPI returned error: {results}")
+            # Stop once SerpAPI has no further page
+            pagination = results.get("serpapi_pagination")
+            if not results.get("organic_results") or (pagination is not None and "next" not in pagination):
+                break
+            start += num
+    
+    def import_page(
+        self,
+        query: str,
+        results: Dict[str, Any],
+        location: str,
+        num_results: int,
+        start: int,
+        seen: Set[str],
+        cached_search_id: int = None
+    ) -> Dict[str, Any]:
+        """
+        Import and score one result page in its own transaction.
+        
+        Args:
+            query: Search query the page belongs to
+            results: Raw SerpAPI response for the page
+            location: Optional location filter used for the search
+            num_results: Number of results requested for the page
+            start: Result offset of the page
+            seen: Identity keys already imported during this run (updated)
+            cached_search_id: Search the page was served from, if cached
             
-            # Check for error in results
-            if "error" in results:
-                raise ValueError(f"SerpAPI error: {results['error']}")
+        Returns:
+            Dictionary with page import stats
+        """
+        if cached_search_id is None:
+            search_id = self._record_search(query, results, location, num_results, start)
+        else:
+            search_id = cached_search_id
         
-        except Exception as e:
-            raise ValueError(f"SerpAPI search failed: {str(e)}")
+        contacts = list(self._dedupe_contacts(self._parse_results(results, query, location), seen))
+        created, updated = self._upsert_contacts(contacts)
+        contacts_scored = self.intent_scorer.score_contacts(created)
+        self.db.commit()
         
-        # Save search record
+        return {
+            "search_id": search_id,
+            "results_count": self._count_results(results),
+            "contacts_created": len(created),
+            "contacts_updated": len(updated),
+            "contacts_scored": contacts_scored,
+            "cached": cached_search_id is not None
+        }
+    
+    def import_new_results(
+        self,
+        query: str,
+        results: Dict[str, Any],
+        location: str,
+        num_results: int,
+        watchlist_id: int,
+        seen: Set[str]
+    ) -> Dict[str, Any]:
+        """
+        Import only the results a watchlist has not returned before.
+        
+        The identity keys of every result are stored on the search record
+        so the next run can diff against them. Results without an identity
+        key can't be diffed and are always imported. Nothing is committed.
+        
+        Args:
+            query: Search query of the watchlist
+            results: Raw SerpAPI response for this run
+            location: Optional location filter used for the search
+            num_results: Number of results requested
+            watchlist_id: Watchlist the run belongs to
+            seen: Identity keys returned by earlier runs (updated)
+            
+        Returns:
+            Dictionary with run import stats
+        """
+        contacts = list(self._parse_results(results, query, location))
+        result_keys = sorted({contact.dedupe_key for contact in contacts if contact.dedupe_key})
+        search_id = self._record_search(
+            query, results, location, num_results,
+            watchlist_id=watchlist_id,
+            result_keys=result_keys
+        )
+        
+        new_contacts = list(self._dedupe_contacts(contacts, seen))
+        created, updated = self._upsert_contacts(new_contacts)
+        contacts_scored = self.intent_scorer.score_contacts(created)
+        
+        return {
+            "search_id": search_id,
+            "results_count": self._count_results(results),
+            "new_results": len(new_contacts),
+            "contacts_created": len(created),
+            "contacts_updated": len(updated),
+            "contacts_scored": contacts_scored
+        }
+    
+    def _record_search(
+        self,
+        query: str,
+        results: Dict[str, Any],
+        location: str = None,
+        num_results: int = None,
+        start: int = 0,
+        watchlist_id: int = None,
+        result_keys: List[str] = None
+    ) -> int:
+        """Save a search record for a fetched response (it serves as the cache entry)."""
+        cache_key = None
+        if num_results is not None:
+            cache_key = SerpAPICache.make_key(query, location, num_results, start)
         search_record = SerpAPISearch(
             query=query,
+            location=location,
+            num_results=num_results,
+            start=start,
+            cache_key=cache_key,
             results_count=len(results.get("organic_results", [])),
-            raw_response=results
+            payload_id=SerpAPIPayloadStore(self.db).put(results),
+            watchlist_id=watchlist_id,
+            result_keys=result_keys
         )
         self.db.add(search_record)
-        self.db.commit()
-        
-        # Parse and import contacts
-        contacts_created = 0
-        organic_results = results.get("organic_results", [])
-        local_results = results.get("local_results", [])
-        
+        self.db.flush()
+        # The in-process cache tier is filled on the first database hit, once this is committed
+        return search_record.id
+    
+    def _count_results(self, results: Dict[str, Any]) -> int:
+        """Count organic and local results in a response."""
+        return len(results.get("organic_results", [])) + len(results.get("local_results", []))
+    
+    def _parse_results(
+        self,
+        results: Dict[str, Any],
+        query: str,
+        location: str = None
+    ) -> Iterator[Contact]:
+        """Parse organic and local results of a response into contacts."""
         # Process organic results
-        for result in organic_results:
+        for result in results.get("organic_results", []):
             # Skip if result is not a dictionary
             if not isinstance(result, dict):
                 continue
-                
+            
             contact = self._parse_organic_result(result, query)
             if contact:
-                self.db.add(contact)
-                contacts_created += 1
+                yield contact
         
         # Process local results (if available)
-        for result in local_results:
+        for result in results.get("local_results", []):
             # Skip if result is not a dictionary
             if not isinstance(result, dict):
                 continue
-                
+            
             contact = self._parse_local_result(result, query, location)
             if contact:
-                self.db.add(contact)
-                contacts_created += 1
+                yield contact
+    
+    def _dedupe_contacts(self, contacts: Iterable[Contact], seen: Set[str]) -> Iterator[Contact]:
+        """Drop contacts whose identity was already imported in this run."""
+        for contact in contacts:
+            if contact.dedupe_key:
+                if contact.dedupe_key in seen:
+                    continue
+                seen.add(contact.dedupe_key)
+            yield contact
+    
+    def _upsert_contacts(self, contacts: List[Contact]) -> Tuple[List[Contact], List[Contact]]:
+        """
+        Insert new contacts and merge the rest into existing rows.
         
-        self.db.commit()
+        Identity keys for the whole batch are resolved with a single
+        indexed lookup. Contacts sharing a key within the batch are
+        merged before anything is written.
         
-        # Calculate intent scores for new contacts
-        # (will be done automatically via IntentScoringService)
+        Args:
+            contacts: Parsed, not yet added contacts
+            
+        Returns:
+            Tuple of (created contacts, updated existing contacts);
+            created contacts are flushed and have IDs
+        """
+        keys = {contact.dedupe_key for contact in contacts if contact.dedupe_key}
+        existing = {}
+        if keys:
+            for match in self.db.query(Contact).filter(Contact.dedupe_key.in_(keys)):
+                existing.setdefault(match.dedupe_key, match)
         
-        return {
-            "search_id": search_record.id,
-            "query": query,
-            "results_count": len(organic_results) + len(local_results),
-            "contacts_created": contacts_created
+        # Emails are unique; track who owns each so a merge never copies one onto a second contact
+        emails = {contact.email for contact in contacts if contact.email}
+        owners = {}
+        if emails:
+            owners = {owner.email: owner for owner in self.db.query(Contact).filter(Contact.email.in_(emails))}
+        
+        created = []
+        updated = {}
+        batch = {}
+        for contact in contacts:
+            key = contact.dedupe_key
+            if key and key in existing:
+                self._merge_contact(existing[key], contact, owners)
+                updated[key] = existing[key]
+            elif key and key in batch:
+                self._merge_contact(batch[key], contact, owners)
+            else:
+                if key:
+                    batch[key] = contact
+                if contact.email:
+                    if contact.email in owners:
+                        contact.email = None
+                    else:
+                        owners[contact.email] = contact
+                created.append(contact)
+        
+        self.db.add_all(created)
+        self.db.flush()
+        return created, list(updated.values())
+    
+    def _merge_contact(self, target: Contact, source: Contact, owners: Dict[str, Contact]):
+        """
+        Copy non-empty fields of a freshly parsed contact onto a matching one.
+        
+        An email another contact already has is left out.
+        
+        Args:
+            target: Contact being updated
+            source: Freshly parsed contact
+            owners: Contact holding each email, updated as emails move
+        """
+        for field in self.UPSERT_FIELDS:
+            value = getattr(source, field)
+            if not value:
+                continue
+            if field == "email":
+                if owners.get(value, target) is not target:
+                    continue
+                if target.email and owners.get(target.email) is target:
+                    del owners[target.email]
+                owners[value] = target
+            setattr(target, field, value)
+        target.raw_data = {**(target.raw_data or {}), **(source.raw_data or {})}
+    
+    def batch_search_and_import(
+        self,
+        searches: List[Tuple[str, Optional[str]]],
+        num_results: int = 10,
+        concurrency: int = None,
+        import_batch_size: int = None,
+        force_refresh: bool = False
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Run many searches concurrently and import them in batches.
+        
+        SerpAPI requests run in a bounded thread pool; all database work
+        stays on the calling thread. Fetched responses are imported and
+        committed in groups of ``import_batch_size``. A failed search is
+        reported and skipped without aborting the rest of the batch.
+        
+        Args:
+            searches: (query, location) pairs to run
+            num_results: Number of results to fetch per search
+            concurrency: Maximum number of searches in flight
+            import_batch_size: Number of responses imported per commit
+            force_refresh: Bypass the response cache
+            
+        Yields:
+            One progress event per search, then a final summary event
+        """
+        concurrency = concurrency or settings.serpapi_batch_concurrency
+        import_batch_size = import_batch_size or settings.serpapi_batch_import_size
+        started = time.monotonic()
+        
+        summary = {
+            "type": "summary",
+            "total": len(searches),
+            "succeeded": 0,
+            "failed": 0,
+            "results_count": 0,
+            "contacts_created": 0,
+            "contacts_updated": 0,
+            "contacts_scored": 0,
         }
+        completed = 0
+        pending = []
+        
+        def progress(query, location, stats, error):
+            nonlocal completed
+            completed += 1
+            event = {
+                "type": "progress",
+                "query": query,
+                "location": location,
+                "completed": completed,
+                "total": len(searches),
+            }
+            if error:
+                summary["failed"] += 1
+                event.update(status="error", error=error)
+            else:
+                summary["succeeded"] += 1
+                summary["results_count"] += stats["results_count"]
+                summary["contacts_created"] += stats["contacts_created"]
+                summary["contacts_updated"] += stats["contacts_updated"]
+                event.update(status="ok", **stats)
+            return event
+        
+        def flush():
+            """Import pending responses in one transaction."""
+            outcomes = []
+            for query, location, results, cached_search_id in pending:
+                try:
+                    with self.db.begin_nested():
+                        stats = self.import_results(
+                            query, results, location, num_results,
+                            commit=False, cached_search_id=cached_search_id
+                        )
+                    outcomes.append((query, location, stats, None))
+                except Exception as e:
+                    logger.error(f"[SerpAPI] Import failed for {query!r}: {type(e).__name__}: {str(e)}")
+                    outcomes.append((query, location, None, f"Import failed: {str(e)}"))
+            self.db.commit()
+            pending.clear()
+            
+            summary["contacts_scored"] += self.intent_scorer.score_all_unscored_contacts()
+            return outcomes
+        
+        # Cache hits are imported without going upstream
+        to_fetch = []
+        for query, location in searches:
+            cached = None if force_refresh else self.get_cached_results(query, location, num_results)
+            if cached:
+                pending.append((query, location, cached["results"], cached["search_id"]))
+                if len(pending) >= import_batch_size:
+                    for outcome in flush():
+                        yield progress(*outcome)
+            else:
+                to_fetch.append((query, location))
+        
+        # Only go upstream for as many searches as the credit budget allows
+        remaining = SerpAPIQuotaService(self.db).remaining_credits()
+        if remaining is not None and len(to_fetch) > remaining:
+            for query, location in to_fetch[remaining:]:
+                yield progress(query, location, None, "SerpAPI credit budget exhausted")
+            to_fetch = to_fetch[:remaining]
+        
+        executor = ThreadPoolExecutor(max_workers=concurrency)
+        try:
+            futures = {
+                executor.submit(
+                    self.fetch_results, query, location, num_results, wait_for_rate_limit=True
+                ): (query, location)
+                for query, location in to_fetch
+            }
+            
+            for future in as_completed(futures):
+                query, location = futures[future]
+                try:
+                    results = future.result()
+                except Exception as e:
+                    yield progress(query, location, None, str(e))
+                else:
+                    self.record_usage(query)
+                    pending.append((query, location, results, None))
+                
+                if len(pending) >= import_batch_size:
+                    for outcome in flush():
+                        yield progress(*outcome)
+        finally:
+            # Don't keep spending credits if the client went away mid-batch
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        if pending:
+            for outcome in flush():
+                yield progress(*outcome)
+        
+        summary["elapsed_seconds"] = round(time.monotonic() - started, 3)
+        yield summary
     
     def _parse_organic_result(self, result: Dict, query: str) -> Contact:
         """Parse organic search result into Contact."""
@@ -132,36 +747,12 @@ class SerpAPIService:
         
         # Infer industry from the search query
         # Common patterns: "plumbers in Austin", "lawyers near me", "roofing companies"
-        industry = None
-        query_lower = query.lower()
-        
-        # Extract potential industry keywords
-        industry_keywords = [
-            "plumber", "plumbing", "lawyer", "attorney", "roofer", "roofing",
-            "contractor", "electrician", "hvac", "dentist", "doctor", "restaurant",
-            "mechanic", "auto repair", "real estate", "agent", "broker", "insurance",
-            "accountant", "marketing", "cleaning", "landscaping", "painter", "painting"
-        ]
-        
-        for keyword in industry_keywords:
-            if keyword in query_lower:
-                industry = keyword.capitalize()
-                if industry.endswith("er"):
-                    industry = industry[:-2] + "ing"  # plumber -> plumbing
-                break
+        industry = extract_industry(query)
         
         # Try to extract location from snippet or title
         location = None
-        city = None
-        state = None
-        
-        # Look for location patterns in snippet
-        import re
-        location_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})\b'
-        location_match = re.search(location_pattern, snippet + " " + title)
-        if location_match:
-            city = location_match.group(1)
-            state = location_match.group(2)
+        city, state = extract_location(snippet + " " + title)
+        if city:
             location = f"{city}, {state}"
         
         # Create contact
@@ -172,6 +763,7 @@ class SerpAPIService:
             city=city,
             state=state,
             source="serpapi",
+            dedupe_key=contact_identity_key(website=link, company=company, city=city, page=True),
             raw_data={
                 "title": title,
                 "snippet": snippet,
@@ -193,47 +785,14 @@ class SerpAPIService:
         website = result.get("website", "")
         
         # Infer industry from query or type field
-        industry = None
-        query_lower = query.lower()
-        
         # First try to get from the type field
         if type_info:
             industry = type_info.split(",")[0].strip() if "," in type_info else type_info
         else:
-            # Extract from query
-            industry_keywords = {
-                "plumber": "Plumbing", "plumbing": "Plumbing",
-                "lawyer": "Legal Services", "attorney": "Legal Services",
-                "roofer": "Roofing", "roofing": "Roofing",
-                "contractor": "Construction",
-                "electrician": "Electrical Services",
-                "hvac": "HVAC Services",
-                "dentist": "Dental", "doctor": "Medical",
-                "restaurant": "Restaurant",
-                "mechanic": "Auto Repair", "auto repair": "Auto Repair",
-                "real estate": "Real Estate",
-                "insurance": "Insurance",
-                "accountant": "Accounting",
-                "marketing": "Marketing",
-                "cleaning": "Cleaning Services",
-                "landscaping": "Landscaping",
-                "painter": "Painting", "painting": "Painting"
-            }
-            
-            for keyword, industry_name in industry_keywords.items():
-                if keyword in query_lower:
-                    industry = industry_name
-                    break
+            industry = extract_industry(query)
         
         # Parse address components
-        city = None
-        state = None
-        if address:
-            parts = address.split(",")
-            if len(parts) >= 2:
-                city = parts[-2].strip()
-                state_zip = parts[-1].strip().split()
-                state = state_zip[0] if state_zip else None
+        city, state = parse_address(address)
         
         # Try to extract email from website or other fields
         email = result.get("email")
@@ -247,6 +806,7 @@ class SerpAPIService:
             city=city,
             state=state,
             source="serpapi",
+            dedupe_key=contact_identity_key(website=website, phone=phone, company=title, city=city),
             raw_data={
                 "title": title,
                 "address": address,
@@ -262,5 +822,3 @@ class SerpAPIService:
         )
         
         return contact
-        
-        return contact
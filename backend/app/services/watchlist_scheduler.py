@@ -0,0 +1,69 @@
+"""In-process scheduler for search watchlists."""
+import asyncio
+import logging
+from typing import Optional
+from starlette.concurrency import run_in_threadpool
+from app.config import get_settings
+from app.database import SessionLocal
+from app.services.watchlist_service import WatchlistService
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def run_due_watchlists(limit: int) -> int:
+    """Run due watchlists with a session of their own."""
+    db = SessionLocal()
+    try:
+        return WatchlistService(db).run_due(limit)
+    finally:
+        db.close()
+
+
+class WatchlistScheduler:
+    """
+    Background task that checks for due watchlists on a fixed interval.
+    
+    Searches are blocking calls, so each tick runs in the threadpool and
+    the event loop stays free to serve requests.
+    """
+    
+    def __init__(self, interval_seconds: int, batch_size: int):
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+    
+    def start(self):
+        """Start the scheduler loop on the running event loop."""
+        if self._task is not None:
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+    
+    async def stop(self):
+        """Stop the loop, letting a tick in progress finish."""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+    
+    async def _run(self):
+        logger.info(f"[Watchlist] Scheduler started (every {self.interval_seconds}s)")
+        while not self._stopping.is_set():
+            try:
+                await run_in_threadpool(run_due_watchlists, self.batch_size)
+            except Exception as e:
+                logger.error(f"[Watchlist] Scheduler tick failed: {type(e).__name__}: {str(e)}")
+            
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.interval_seconds)
+            except asyncio.TimeoutError:
+                pass
+
+
+watchlist_scheduler = WatchlistScheduler(
+    interval_seconds=settings.watchlist_scheduler_interval_seconds,
+    batch_size=settings.watchlist_scheduler_batch_size
+)
@@ -0,0 +1,142 @@
+"""Saved search watchlists and their scheduled runs."""
+import logging
+from datetime import datetime, timedelta, timezone
+from sqlalchemy.orm import Session
+from typing import Dict, Any, List, Set
+from app.models.search_watchlist import SearchWatchlist
+from app.models.serpapi_search import SerpAPISearch
+from app.services.serpapi_quota import SerpAPIQuotaService, SerpAPIQuotaExceeded
+from app.services.serpapi_service import SerpAPIService
+
+logger = logging.getLogger(__name__)
+
+
+class WatchlistService:
+    """Service for running saved searches and importing only new results."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+        self.serpapi = SerpAPIService(db)
+    
+    def seen_result_keys(self, watchlist_id: int) -> Set[str]:
+        """
+        Collect the identity keys returned by all earlier runs of a watchlist.
+        
+        Args:
+            watchlist_id: Watchlist to look up
+        
+        Returns:
+            Set of contact identity keys
+        """
+        seen = set()
+        rows = self.db.query(SerpAPISearch.result_keys).filter(
+            SerpAPISearch.watchlist_id == watchlist_id
+        )
+        for (keys,) in rows:
+            if keys:
+                seen.update(keys)
+        return seen
+    
+    def run_watchlist(self, watchlist: SearchWatchlist) -> Dict[str, Any]:
+        """
+        Run a watchlist search now and import the results it hasn't seen.
+        
+        The watchlist's next run is scheduled one cadence from now. A
+        failed search is recorded on the watchlist and re-raised.
+        
+        Args:
+            watchlist: Watchlist to run
+        
+        Returns:
+            Dictionary with run stats
+        """
+        SerpAPIQuotaService(self.db).check_budget()
+        
+        try:
+            results = self.serpapi.fetch_results(
+                watchlist.query,
+                watchlist.location,
+                watchlist.num_results,
+                wait_for_rate_limit=True
+            )
+        except ValueError as e:
+            watchlist.last_error = str(e)
+            self.db.commit()
+            raise
+        
+        self.serpapi.record_usage(watchlist.query)
+        seen = self.seen_result_keys(watchlist.id)
+        stats = self.serpapi.import_new_results(
+            query=watchlist.query,
+            results=results,
+            location=watchlist.location,
+            num_results=watchlist.num_results,
+            watchlist_id=watchlist.id,
+            seen=seen
+        )
+        
+        now = datetime.now(timezone.utc)
+        watchlist.last_run_at = now
+        watchlist.next_run_at = now + timedelta(hours=watchlist.cadence_hours)
+        watchlist.last_error = None
+        self.db.commit()
+        
+        return {"watchlist_id": watchlist.id, **stats}
+    
+    def run_due(self, limit: int = 10) -> int:
+        """
+        Run the active watchlists whose next run is due.
+        
+        Due watchlists are claimed up front by pushing their next run one
+        cadence ahead, so another scheduler process won't pick them up
+        too (rows being claimed are locked with SKIP LOCKED on Postgres).
+        When the credit budget runs out, the unprocessed watchlists are
+        queued again for when the budget resets.
+        
+        Args:
+            limit: Maximum number of watchlists to run
+        
+        Returns:
+            Number of watchlists run successfully
+        """
+        watchlists = self._claim_due(limit)
+        
+        completed = 0
+        for index, watchlist in enumerate(watchlists):
+            try:
+                stats = self.run_watchlist(watchlist)
+                logger.info(f"[Watchlist] Ran watchlist {watchlist.id}: {stats}")
+                completed += 1
+            except SerpAPIQuotaExceeded as e:
+                self.db.rollback()
+                logger.warning(f"[Watchlist] {str(e)}; queueing {len(watchlists) - index} watchlists")
+                self._requeue(watchlists[index:], e.retry_after)
+                break
+            except Exception as e:
+                self.db.rollback()
+                logger.error(f"[Watchlist] Watchlist {watchlist.id} failed: {type(e).__name__}: {str(e)}")
+        
+        return completed
+    
+    def _claim_due(self, limit: int) -> List[SearchWatchlist]:
+        """Lock and claim up to ``limit`` due watchlists."""
+        now = datetime.now(timezone.utc)
+        watchlists = self.db.query(SearchWatchlist).filter(
+            SearchWatchlist.is_active.is_(True),
+            SearchWatchlist.next_run_at <= now
+        ).order_by(
+            SearchWatchlist.next_run_at
+        ).limit(limit).with_for_update(skip_locked=True).all()
+        
+        for watchlist in watchlists:
+            watchlist.next_run_at = now + timedelta(hours=watchlist.cadence_hours)
+        self.db.commit()
+        
+        return watchlists
+    
+    def _requeue(self, watchlists: List[SearchWatchlist], retry_after: int):
+        """Make watchlists due again after ``retry_after`` seconds."""
+        next_run_at = datetime.now(timezone.utc) + timedelta(seconds=retry_after)
+        for watchlist in watchlists:
+            watchlist.next_run_at = next_run_at
+        self.db.commit()
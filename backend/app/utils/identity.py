@@ -0,0 +1,121 @@
+"""Stable identity keys for deduplicating imported contacts."""
+import re
+from typing import Optional
+from urllib.parse import urlparse
+
+# Sites that list many businesses; their domain alone doesn't identify one
+DIRECTORY_DOMAINS = frozenset({
+    "yelp.com",
+    "yellowpages.com",
+    "facebook.com",
+    "linkedin.com",
+    "instagram.com",
+    "bbb.org",
+    "angi.com",
+    "angieslist.com",
+    "homeadvisor.com",
+    "thumbtack.com",
+    "houzz.com",
+    "nextdoor.com",
+    "mapquest.com",
+    "google.com",
+    "manta.com",
+    "porch.com",
+})
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_domain(url: Optional[str]) -> Optional[str]:
+    """
+    Normalize a URL or bare host to its registrable-looking domain.
+    
+    Args:
+        url: Website URL (scheme optional)
+    
+    Returns:
+        Lowercased host without ``www.`` or port, or None
+    """
+    if not url:
+        return None
+    url = url.strip()
+    if "//" not in url:
+        url = f"//{url}"
+    host = (urlparse(url).hostname or "").lower().rstrip(".")
+    if host.startswith("www."):
+        host = host[4:]
+    return host or None
+
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    """
+    Normalize a phone number to its digits.
+    
+    A leading US country code is dropped so ``+1 (512) 555-1234`` and
+    ``512-555-1234`` normalize the same way.
+    
+    Args:
+        phone: Phone number in any format
+    
+    Returns:
+        Digit string, or None if too short to be a phone number
+    """
+    if not phone:
+        return None
+    digits = "".join(filter(str.isdigit, phone))
+    if len(digits) == 11 and digits.startswith("1"):
+        digits = digits[1:]
+    return digits if len(digits) >= 7 else None
+
+
+def normalize_name(text: Optional[str]) -> Optional[str]:
+    """Lowercase a name and collapse punctuation and whitespace."""
+    if not text:
+        return None
+    normalized = _NON_ALNUM.sub(" ", text.lower()).strip()
+    return normalized or None
+
+
+def contact_identity_key(
+    website: Optional[str] = None,
+    phone: Optional[str] = None,
+    company: Optional[str] = None,
+    city: Optional[str] = None,
+    page: bool = False
+) -> Optional[str]:
+    """
+    Work out a stable identity key for a business contact.
+    
+    The strongest available signal wins: website domain, then phone
+    number, then company name plus city. Directory sites (Yelp, BBB, ...)
+    are keyed on the full listing path instead of the domain.
+    
+    Args:
+        website: The business's site, or with ``page`` a page about it
+        phone: Phone number
+        company: Company name
+        city: City, paired with the company name
+        page: ``website`` is a search result page, which may be a news
+            article or blog post on a site that isn't the business's own;
+            anything but a home page is keyed on its full path
+    
+    Returns:
+        Key such as ``domain:acmeplumbing.com``, or None if nothing usable
+    """
+    domain = normalize_domain(website)
+    if domain:
+        path = urlparse(website if "//" in website else f"//{website}").path.rstrip("/").lower()
+        if domain not in DIRECTORY_DOMAINS and not (page and path):
+            return f"domain:{domain}"[:255]
+        if path:
+            return f"url:{domain}{path}"[:255]
+    
+    digits = normalize_phone(phone)
+    if digits:
+        return f"phone:{digits}"
+    
+    name = normalize_name(company)
+    if name:
+        return f"name:{name}|{normalize_name(city) or ''}"[:255]
+    
+    return None
@@ -0,0 +1,179 @@
+"""Single-pass multi-keyword matching (Aho-Corasick)."""
+from collections import deque
+from functools import lru_cache
+from typing import Dict, List, Sequence, Tuple
+
+
+class KeywordMatcher:
+    """
+    Find which of a fixed set of keywords occur anywhere in a text.
+    
+    Matching has the same semantics as ``keyword in text`` for every
+    keyword: plain, case-sensitive substrings, overlaps allowed. The
+    keywords are compiled once into an Aho-Corasick automaton, flattened
+    into a DFA (one transition dict per state, failure links resolved at
+    build time), so a search is a single pass over the text whatever the
+    number of keywords.
+    
+    For small keyword sets CPython's C-level ``in`` is faster than a
+    Python-level pass, so below ``SCAN_THRESHOLD`` keywords the matcher
+    uses plain scans unless ``strategy="automaton"`` is forced. Both
+    strategies return identical results.
+    """
+    
+    SCAN_THRESHOLD = 64
+    
+    def __init__(self, keywords: Sequence[str], strategy: str = "auto"):
+        if strategy not in ("auto", "scan", "automaton"):
+            raise ValueError(f"Unknown keyword matcher strategy: {strategy}")
+        self.keywords = list(keywords)
+        if strategy == "auto":
+            strategy = "scan" if len(self.keywords) < self.SCAN_THRESHOLD else "automaton"
+        self.strategy = strategy
+        if strategy == "automaton":
+            self._delta, self._outputs = self._build(self.keywords)
+    
+    def find(self, text: str) -> List[int]:
+        """
+        Find the keywords contained in text.
+        
+        Args:
+            text: Text to search (callers lowercase it if matching should
+                be case-insensitive)
+        
+        Returns:
+            Sorted indices (into ``keywords``) of every keyword found
+        """
+        if self.strategy == "scan":
+            return [index for index, keyword in enumerate(self.keywords) if keyword in text]
+        
+        delta = self._delta
+        outputs = self._outputs
+        found = set()
+        state = 0
+        for char in text:
+            state = delta[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return sorted(found)
+    
+    @staticmethod
+    def _build(keywords: Sequence[str]) -> Tuple[List[Dict[str, int]], List[Tuple[int, ...]]]:
+        """Build the trie, failure links and the flattened transition table."""
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+        for index, keyword in enumerate(keywords):
+            if not keyword:
+                # "" in text is always True
+                outputs[0].append(index)
+                continue
+            state = 0
+            for char in keyword:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    goto.append({})
+                    outputs.append([])
+                    next_state = goto[state][char] = len(goto) - 1
+                state = next_state
+            outputs[state].append(index)
+        
+        # Breadth-first: a state's failure target is always shallower, so its
+        # transitions and outputs are final by the time the state is visited
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [None] * (len(goto) - 1)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            fallback = fail[state]
+            delta[state] = {**delta[fallback], **goto[state]}
+            outputs[state] = outputs[state] + outputs[fallback]
+            for char, child in goto[state].items():
+                fail[child] = delta[fallback].get(char, 0)
+                queue.append(child)
+        
+        return delta, [tuple(output) for output in outputs]
+
+
+class TieredKeywordMatcher:
+    """
+    Match keyword tiers (e.g. high/medium/low intent) in one pass and score them.
+    
+    Every keyword in a tier adds the tier weight. ``score`` reproduces
+    adding the weights one match at a time in tier order, so the float
+    result is exactly what a sequential ``+=`` loop gives; since that only
+    depends on how many keywords of each tier matched, results are
+    memoized per count combination.
+    """
+    
+    def __init__(self, tiers: Dict[str, Sequence[str]], weights: Dict[str, float], strategy: str = "auto"):
+        self.tiers = list(tiers)
+        self.weights = [weights[tier] for tier in self.tiers]
+        keywords = []
+        self._tier_of = []
+        for position, tier in enumerate(self.tiers):
+            keywords.extend(tiers[tier])
+            self._tier_of.extend([position] * len(tiers[tier]))
+        self.matcher = KeywordMatcher(keywords, strategy)
+        self._scores: Dict[Tuple[int, ...], float] = {}
+    
+    def find(self, text: str) -> List[int]:
+        """
+        Find matched keywords as sorted indices into the tiers' concatenated keywords.
+        
+        Args:
+            text: Lowercased text to search
+        """
+        return self.matcher.find(text)
+    
+    def group(self, indices: Sequence[int]) -> Dict[str, List[str]]:
+        """Turn keyword indices (from ``find``) into matched keywords per tier."""
+        matches = {tier: [] for tier in self.tiers}
+        keywords = self.matcher.keywords
+        for index in indices:
+            matches[self.tiers[self._tier_of[index]]].append(keywords[index])
+        return matches
+    
+    def match(self, text: str) -> Dict[str, List[str]]:
+        """
+        Find matched keywords per tier, in each tier's keyword order.
+        
+        Args:
+            text: Lowercased text to search
+        
+        Returns:
+            Dictionary of tier -> matched keywords
+        """
+        return self.group(self.find(text))
+    
+    def score(self, matches: Dict[str, List[str]]) -> float:
+        """Sum the tier weights of matched keywords, starting from 0.0."""
+        counts = tuple(len(matches[tier]) for tier in self.tiers)
+        total = self._scores.get(counts)
+        if total is None:
+            total = 0.0
+            for weight, count in zip(self.weights, counts):
+                for _ in range(count):
+                    total += weight
+            self._scores[counts] = total
+        return total
+
+
+@lru_cache(maxsize=16)
+def _compile_tiers(
+    tiers: Tuple[Tuple[str, Tuple[str, ...]], ...],
+    weights: Tuple[Tuple[str, float], ...]
+) -> TieredKeywordMatcher:
+    return TieredKeywordMatcher(dict(tiers), dict(weights))
+
+
+def compile_tiers(tiers: Dict[str, Sequence[str]], weights: Dict[str, float]) -> TieredKeywordMatcher:
+    """
+    Get a compiled matcher for a rule set, building it only once.
+    
+    Matchers are cached by the content of the rule set, so changing the
+    keyword lists yields a freshly compiled matcher on the next call.
+    """
+    return _compile_tiers(
+        tuple((tier, tuple(keywords)) for tier, keywords in tiers.items()),
+        tuple((tier, weights[tier]) for tier in tiers)
+    )
@@ -0,0 +1,150 @@
+"""
+Benchmark the CSV import: per-row lookups vs. set-based bulk insert.
+
+Generates a synthetic lead file (duplicate emails within the file, rows
+without email, empty rows, emails that already exist in the database),
+imports it into two fresh databases, once with the previous row-by-row
+import (one email lookup and ORM add per row, then
+``score_all_unscored_contacts``) and once with ``CSVService``, and checks
+that both end up with the same contacts.
+
+Usage (from backend/):
+    python -m benchmarks.bench_csv_import --rows 100000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pandas as pd
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import audience  # noqa: F401 -- registers relationship targets
+from app.models.contact import Contact
+from app.services.csv_service import CSVService
+from app.services.intent_scorer import IntentScoringService
+from app.utils.identity import normalize_phone
+
+COMPANIES = ["need plumbing repair", "Acme Roofing", "best hvac near me", "Smith & Sons LLC", "diy tutorial co"]
+
+
+def make_csv(path: str, rows: int, existing: int, seed: int = 7):
+    """Write a lead file; the first ``existing`` emails are also pre-loaded into the database."""
+    rng = random.Random(seed)
+    with open(path, "w") as f:
+        f.write("First Name,Last Name,Email,Phone,Company,City,State,notes\n")
+        for i in range(rows):
+            roll = rng.random()
+            if roll < 0.02:
+                f.write(",,,,,,,\n")
+                continue
+            if roll < 0.07:
+                email = f"lead{rng.randrange(max(i, 1))}@example.com"  # Repeats an earlier row
+            elif roll < 0.17:
+                email = ""
+            else:
+                email = f"lead{i}@example.com"
+            f.write(
+                f"First{i},Last{i},{email},555-{i:07d},{rng.choice(COMPANIES)} {i},"
+                f"Austin,TX,{'x' * rng.randint(0, 40)}\n"
+            )
+
+
+def make_session(database_url: str, existing: int):
+    engine = create_engine(database_url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = sessionmaker(bind=engine)()
+    for offset in range(0, existing, 5000):
+        db.add_all(
+            Contact(email=f"lead{i}@example.com", source="manual")
+            for i in range(offset, min(offset + 5000, existing))
+        )
+        db.commit()
+    return db
+
+
+def legacy_parse_row(row) -> dict:
+    """The per-row field mapping: every cell checked, mapped and stripped on its own."""
+    contact_data = {}
+    for csv_column, value in row.items():
+        if pd.isna(value):
+            continue
+        csv_column_clean = csv_column.lower().strip()
+        if csv_column_clean in CSVService.FIELD_MAPPING:
+            contact_data[CSVService.FIELD_MAPPING[csv_column_clean]] = str(value).strip()
+    return contact_data
+
+
+def legacy_import(db, path: str, filename: str, chunk_size: int) -> int:
+    """The row-by-row import: one email lookup and ORM add per row."""
+    imported = 0
+    with pd.read_csv(path, chunksize=chunk_size) as reader:
+        for df in reader:
+            df.columns = df.columns.str.lower().str.strip()
+            for index, row in df.iterrows():
+                contact_data = legacy_parse_row(row)
+                if not any([contact_data.get("email"), contact_data.get("phone"), contact_data.get("company")]):
+                    continue
+                if contact_data.get("email"):
+                    existing = db.query(Contact).filter(Contact.email == contact_data["email"]).first()
+                    if existing:
+                        continue
+                db.add(Contact(**contact_data, source="csv", raw_data={"filename": filename, "row_index": index}))
+                imported += 1
+            db.commit()
+            db.expunge_all()
+    IntentScoringService(db).score_all_unscored_contacts()
+    return imported
+
+
+def snapshot(db):
+    """Imported contacts as comparable tuples (phones as digits, as the bulk import stores them)."""
+    return sorted(
+        (c.email or "", normalize_phone(c.phone) or "", c.company or "", c.intent_base_score)
+        for c in db.query(Contact.email, Contact.phone, Contact.company, Contact.intent_base_score).filter(
+            Contact.source == "csv"
+        )
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--existing", type=int, default=10_000, help="Emails already in the database")
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--database-dir", default=tempfile.gettempdir(),
+                        help="Directory for the two scratch SQLite databases")
+    args = parser.parse_args()
+    
+    path = os.path.join(args.database_dir, "bench_csv_import.csv")
+    make_csv(path, args.rows, args.existing)
+    print(f"Importing {args.rows} rows ({os.path.getsize(path) / 2**20:.1f} MB), {args.existing} emails pre-loaded")
+    
+    legacy_db = make_session(f"sqlite:///{os.path.join(args.database_dir, 'bench_csv_legacy.db')}", args.existing)
+    started = time.perf_counter()
+    legacy_imported = legacy_import(legacy_db, path, "bench.csv", args.chunk_size)
+    legacy = time.perf_counter() - started
+    
+    bulk_db = make_session(f"sqlite:///{os.path.join(args.database_dir, 'bench_csv_bulk.db')}", args.existing)
+    started = time.perf_counter()
+    result = CSVService(bulk_db).upload_and_import(path, "bench.csv", args.chunk_size)
+    bulk = time.perf_counter() - started
+    
+    print(f"{'row-by-row import + scoring':<30} {legacy:8.2f} s  {args.rows / legacy:10,.0f} rows/s  {legacy_imported} imported")
+    print(f"{'bulk import (CSVService)':<30} {bulk:8.2f} s  {args.rows / bulk:10,.0f} rows/s  "
+          f"{result['imported_contacts']} imported, peak {result['peak_memory_mb']} MB")
+    print(f"Speedup: {legacy / bulk:.1f}x")
+    
+    if snapshot(legacy_db) != snapshot(bulk_db):
+        print("FAILED: imported contacts differ")
+        sys.exit(1)
+    print("OK: both imports produced the same contacts and scores")
+
+
+if __name__ == "__main__":
+    main()
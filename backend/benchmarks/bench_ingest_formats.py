@@ -0,0 +1,111 @@
+"""
+Benchmark the ingest readers: the same lead file as CSV, gzip CSV, JSONL, Parquet and Arrow.
+
+Generates the synthetic lead file from ``bench_csv_import``, converts it
+to every format, and times reading plus field mapping (``read_chunks``
+and ``map_fields``, the part that differs between formats) for each,
+reading and mapping separately.
+Checks that all formats map to the same fields. With ``--import`` each
+format is also fully imported into a fresh SQLite database.
+
+Usage (from backend/):
+    python -m benchmarks.bench_ingest_formats --rows 1000000
+"""
+import argparse
+import gzip
+import hashlib
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from benchmarks.bench_csv_import import make_csv, make_session
+from app.services.csv_service import CSVService
+
+FORMATS = [".csv", ".csv.gz", ".jsonl", ".parquet", ".arrow"]
+
+
+def convert(csv_path: str, base: str, chunk_size: int):
+    """Write the CSV in every other format, a chunk at a time."""
+    with open(csv_path, "rb") as src, gzip.open(base + ".csv.gz", "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    
+    parquet = arrow = None
+    with open(base + ".jsonl", "w") as jsonl:
+        for df in pd.read_csv(csv_path, chunksize=chunk_size, dtype=str):
+            df.to_json(jsonl, orient="records", lines=True)
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if parquet is None:
+                parquet = pq.ParquetWriter(base + ".parquet", table.schema)
+                arrow = pa.ipc.new_file(base + ".arrow", table.schema)
+            parquet.write_table(table)
+            arrow.write_table(table)
+    parquet.close()
+    arrow.close()
+
+
+def read_and_map(path: str, filename: str, chunk_size: int):
+    """Read and map a file; returns rows, seconds reading, seconds mapping and a digest of the mapped fields."""
+    csv_service = CSVService(None)
+    digest = hashlib.sha256()
+    rows = 0
+    reading = mapping = 0.0
+    started = time.perf_counter()
+    with csv_service.read_chunks(path, filename, chunk_size) as reader:
+        for df in reader:
+            mapping_started = time.perf_counter()
+            reading += mapping_started - started
+            mapped = csv_service.map_fields(df)
+            digest.update(pd.util.hash_pandas_object(mapped, index=True).to_numpy().tobytes())
+            rows += len(df)
+            started = time.perf_counter()
+            mapping += started - mapping_started
+    reading += time.perf_counter() - started
+    return rows, reading, mapping, digest.hexdigest()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    parser.add_argument("--import", dest="full_import", action="store_true",
+                        help="Also import each format into a fresh SQLite database")
+    parser.add_argument("--data-dir", default=tempfile.gettempdir(),
+                        help="Directory for the generated files and scratch databases")
+    args = parser.parse_args()
+    
+    base = os.path.join(args.data_dir, "bench_ingest")
+    make_csv(base + ".csv", args.rows, existing=0)
+    convert(base + ".csv", base, args.chunk_size)
+    print(f"{args.rows} rows per file")
+    
+    digests = {}
+    for file_format in FORMATS:
+        path = base + file_format
+        rows, reading, mapping, digests[file_format] = read_and_map(path, "bench" + file_format, args.chunk_size)
+        line = (
+            f"{file_format:<9} {os.path.getsize(path) / 2**20:8.1f} MB  read {reading:6.2f} s "
+            f"({rows / reading:10,.0f} rows/s)  map {mapping:6.2f} s"
+        )
+        if args.full_import:
+            db = make_session(f"sqlite:///{os.path.join(args.data_dir, 'bench_ingest.db')}", existing=0)
+            started = time.perf_counter()
+            result = CSVService(db).upload_and_import(path, "bench" + file_format, args.chunk_size)
+            elapsed = time.perf_counter() - started
+            line += f"  import {elapsed:6.2f} s ({result['imported_contacts']} contacts)"
+            db.close()
+        print(line)
+    
+    if len(set(digests.values())) != 1:
+        print(f"FAILED: formats mapped to different fields: {digests}")
+        sys.exit(1)
+    print("OK: every format mapped to the same fields")
+
+
+if __name__ == "__main__":
+    main()
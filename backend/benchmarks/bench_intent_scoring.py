@@ -0,0 +1,95 @@
+"""
+Benchmark batch intent scoring against the per-contact scorer.
+
+Generates synthetic contacts (company, industry and SerpAPI-style
+raw_data mixing intent keywords with filler text, spread over created_at
+and source) and times scoring them with the per-contact
+``calculate_intent`` and with ``BatchIntentScorer.score_rows``. That
+both give the same scores is covered by tests/test_intent_scoring.py.
+
+Usage (from backend/):
+    python -m benchmarks.bench_intent_scoring --contacts 100000
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.models import audience  # noqa: F401 -- registers relationship targets
+from app.models.contact import Contact
+from app.services.batch_scorer import BatchIntentScorer
+from app.services.intent_scorer import IntentScoringService
+from app.services.scoring_rules import DEFAULT_KEYWORDS
+
+FILLER = [
+    "family owned", "since 1998", "licensed and insured", "Austin, TX",
+    "residential", "commercial", "call today", "open 24/7", "BBB accredited",
+    "serving the metro area", "plumbing", "roofing", "LLC", "& Sons",
+]
+
+
+def make_contacts(count: int, seed: int = 7):
+    """Build transient contacts covering keyword, recency and source combinations."""
+    rng = random.Random(seed)
+    keywords = [kw for tier in DEFAULT_KEYWORDS.values() for kw in tier]
+    now = datetime.now(timezone.utc)
+    contacts = []
+    for contact_id in range(1, count + 1):
+        def phrase():
+            words = rng.sample(FILLER, 2) + rng.sample(keywords, rng.choice([0, 0, 0, 1, 1, 2]))
+            rng.shuffle(words)
+            text = " ".join(words)
+            return text.upper() if rng.random() < 0.1 else text.capitalize()
+        
+        raw_data = {}
+        for key in ("title", "snippet", "description", "search_query", "link"):
+            if rng.random() < 0.6:
+                raw_data[key] = phrase()
+        contacts.append(Contact(
+            id=contact_id,
+            company=phrase() if rng.random() < 0.9 else None,
+            industry=rng.choice([None, "Plumbing", "Legal Services", "HVAC Services"]),
+            raw_data=raw_data or None,
+            source=rng.choice(["serpapi", "csv", None]),
+            created_at=now - timedelta(days=rng.randint(0, 180), seconds=rng.randint(0, 86399))
+        ))
+    return contacts
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--contacts", type=int, default=100_000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+    
+    contacts = make_contacts(args.contacts)
+    print(f"Scoring {len(contacts)} synthetic contacts")
+    
+    scorer = IntentScoringService(None)
+    started = time.perf_counter()
+    for contact in contacts:
+        scorer.calculate_intent(contact)
+    per_contact = time.perf_counter() - started
+    
+    rows = [
+        (c.id, c.company, c.industry, c.raw_data, c.created_at, c.source)
+        for c in contacts
+    ]
+    now = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    scores = []
+    for offset in range(0, len(rows), args.chunk_size):
+        scores.extend(BatchIntentScorer.score_rows(rows[offset:offset + args.chunk_size], now))
+    batch = time.perf_counter() - started
+    
+    print(f"{'calculate_intent (per contact)':<32} {per_contact:8.3f} s  {per_contact / len(rows) * 1e6:8.2f} us/contact")
+    print(f"{'BatchIntentScorer.score_rows':<32} {batch:8.3f} s  {batch / len(rows) * 1e6:8.2f} us/contact")
+    
+    labels = {}
+    for score in scores:
+        labels[score["score"]] = labels.get(score["score"], 0) + 1
+    print(f"Labels: {labels}")
+
+
+if __name__ == "__main__":
+    main()
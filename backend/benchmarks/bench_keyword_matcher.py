@@ -0,0 +1,90 @@
+"""
+Benchmark for the multi-keyword matcher used by intent scoring.
+
+Times per-keyword ``in`` scans against the compiled Aho-Corasick
+automaton for rule sets of 30, 300 and 3,000 keywords (the 30-keyword
+set is the default intent keywords plus one), over synthetic
+lowercased contact texts, and checks both give identical matches.
+
+Usage (from backend/):
+    python -m benchmarks.bench_keyword_matcher --texts 5000
+"""
+import argparse
+import random
+import string
+import sys
+import time
+
+from app.services.scoring_rules import DEFAULT_KEYWORDS
+from app.utils.keyword_matcher import KeywordMatcher
+
+SIZES = (30, 300, 3000)
+
+
+def make_keywords(count: int, vocabulary, rng):
+    """Real intent keywords first, padded with synthetic one- and two-word phrases."""
+    keywords = [kw for tier in DEFAULT_KEYWORDS.values() for kw in tier]
+    seen = set(keywords)
+    while len(keywords) < count:
+        phrase = " ".join(rng.sample(vocabulary, rng.choice([1, 1, 2])))
+        if phrase not in seen:
+            seen.add(phrase)
+            keywords.append(phrase)
+    return keywords[:count]
+
+
+def make_texts(count: int, keywords, vocabulary, rng):
+    """Roughly 300-character texts with a few keywords mixed in."""
+    texts = []
+    for _ in range(count):
+        words = rng.sample(vocabulary, 35) + rng.sample(keywords, rng.choice([0, 1, 2, 3]))
+        rng.shuffle(words)
+        texts.append(" ".join(words))
+    return texts
+
+
+def time_matcher(matcher: KeywordMatcher, texts):
+    started = time.perf_counter()
+    found = [matcher.find(text) for text in texts]
+    return time.perf_counter() - started, found
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--texts", type=int, default=5000)
+    args = parser.parse_args()
+    
+    rng = random.Random(11)
+    vocabulary = [
+        "".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 9)))
+        for _ in range(5000)
+    ]
+    
+    failed = False
+    print(f"{'keywords':>8}  {'scan us/text':>12}  {'automaton us/text':>17}  {'build ms':>8}  identical")
+    for size in SIZES:
+        keywords = make_keywords(size, vocabulary, rng)
+        texts = make_texts(args.texts, keywords, vocabulary, rng)
+        
+        scan = KeywordMatcher(keywords, strategy="scan")
+        started = time.perf_counter()
+        automaton = KeywordMatcher(keywords, strategy="automaton")
+        build = time.perf_counter() - started
+        
+        scan_time, expected = time_matcher(scan, texts)
+        automaton_time, actual = time_matcher(automaton, texts)
+        identical = expected == actual
+        failed = failed or not identical
+        
+        print(
+            f"{size:>8}  {scan_time / len(texts) * 1e6:>12.2f}  "
+            f"{automaton_time / len(texts) * 1e6:>17.2f}  {build * 1e3:>8.1f}  {identical}"
+        )
+    
+    print(f"(auto strategy switches to the automaton at {KeywordMatcher.SCAN_THRESHOLD} keywords)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Micro-benchmark for SerpAPI result parsing.
+
+Replays organic and local results recorded in ``serpapi_searches`` (or a
+small built-in sample when the table is empty) until ``--results`` have
+been parsed, and reports the per-result cost of the full parsers and of
+the industry/location extraction alone, next to the old per-call
+keyword-list and regex approach.
+
+Usage (from backend/):
+    python -m benchmarks.bench_serpapi_parsing --results 100000
+"""
+import argparse
+import itertools
+import re
+import time
+
+from sqlalchemy import or_
+
+from app.database import SessionLocal
+from app.models import audience  # noqa: F401 -- registers relationship targets
+from app.models.serpapi_search import SerpAPISearch
+from app.services.serpapi_payload_store import SerpAPIPayloadStore
+from app.services.serpapi_extractor import extract_industry, extract_location
+from app.services.serpapi_service import SerpAPIService
+
+SAMPLE_RESULTS = [
+    ("organic", {
+        "title": "Austin Plumbing Pros - Emergency Plumber",
+        "snippet": "Licensed plumbers serving Austin, TX. Need a repair? Call for a free quote.",
+        "link": "https://www.austinplumbingpros.com/",
+    }, "plumbers in austin tx"),
+    ("organic", {
+        "title": "Best Roofing Contractors | Denver Roof Co",
+        "snippet": "Top rated roofing company in Denver, Colorado since 1998.",
+        "link": "https://denverroof.co/services",
+    }, "roofing contractors denver"),
+    ("local", {
+        "title": "Smith & Sons Electric",
+        "address": "1200 Main St, Dallas, TX 75201",
+        "phone": "(214) 555-0199",
+        "type": "Electrician",
+        "website": "https://smithelectric.example",
+    }, "electrician dallas"),
+    ("local", {
+        "title": "Green Leaf Landscaping",
+        "address": "88 Oak Ave, Portland, OR 97201",
+        "phone": "503-555-0142",
+    }, "landscaping near me"),
+]
+
+LEGACY_INDUSTRY_KEYWORDS = [
+    "plumber", "plumbing", "lawyer", "attorney", "roofer", "roofing",
+    "contractor", "electrician", "hvac", "dentist", "doctor", "restaurant",
+    "mechanic", "auto repair", "real estate", "agent", "broker", "insurance",
+    "accountant", "marketing", "cleaning", "landscaping", "painter", "painting"
+]
+
+
+def legacy_extract(query: str, text: str):
+    """Industry/location extraction as it was done before the shared extractor."""
+    industry = None
+    query_lower = query.lower()
+    industry_keywords = list(LEGACY_INDUSTRY_KEYWORDS)
+    for keyword in industry_keywords:
+        if keyword in query_lower:
+            industry = keyword
+            break
+    location_pattern = r'\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)*),\s*([A-Z]{2})\b'
+    match = re.search(location_pattern, text)
+    return industry, match.groups() if match else None
+
+
+def load_recorded_results(limit: int):
+    """Load (kind, result, query) tuples from stored SerpAPI responses."""
+    db = SessionLocal()
+    try:
+        records = []
+        payload_store = SerpAPIPayloadStore(db)
+        searches = db.query(SerpAPISearch).filter(
+            or_(SerpAPISearch.payload_id.isnot(None), SerpAPISearch.raw_response.isnot(None))
+        ).yield_per(500)
+        for search in searches:
+            query, response = search.query, payload_store.get_response(search) or {}
+            for kind in ("organic", "local"):
+                for result in response.get(f"{kind}_results", []):
+                    if isinstance(result, dict):
+                        records.append((kind, result, query))
+            if len(records) >= limit:
+                break
+        return records
+    except Exception as e:
+        print(f"Could not load recorded results ({type(e).__name__}); using built-in sample")
+        return []
+    finally:
+        db.close()
+
+
+def time_per_result(label: str, records, fn):
+    started = time.perf_counter()
+    for record in records:
+        fn(record)
+    elapsed = time.perf_counter() - started
+    print(f"{label:<32} {elapsed:8.3f} s  {elapsed / len(records) * 1e6:8.2f} us/result")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--results", type=int, default=100_000)
+    args = parser.parse_args()
+    
+    recorded = load_recorded_results(args.results) or SAMPLE_RESULTS
+    records = list(itertools.islice(itertools.cycle(recorded), args.results))
+    print(f"Parsing {len(records)} results ({len(recorded)} distinct)")
+    
+    service = SerpAPIService(None)
+    
+    def parse(record):
+        kind, result, query = record
+        if kind == "organic":
+            service._parse_organic_result(result, query)
+        else:
+            service._parse_local_result(result, query)
+    
+    def text_of(result):
+        return f"{result.get('snippet', '')} {result.get('title', '')}"
+    
+    time_per_result("full parse", records, parse)
+    time_per_result(
+        "extraction (precompiled)", records,
+        lambda r: (extract_industry(r[2]), extract_location(text_of(r[1])))
+    )
+    time_per_result(
+        "extraction (legacy)", records,
+        lambda r: legacy_extract(r[2], text_of(r[1]))
+    )
+
+
+if __name__ == "__main__":
+    main()
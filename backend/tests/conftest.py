@@ -0,0 +1,20 @@
+"""Shared test setup: settings for an isolated SQLite database."""
+import os
+import tempfile
+
+# Settings are read when app modules are imported, so set them first
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='intent-tests-'), 'test.db')}"
+os.environ.setdefault("SERPAPI_API_KEY", "test-key")
+
+import pytest  # noqa: E402
+
+from app.database import Base, engine  # noqa: E402
+from app.models import audience, contact, csv_import_job, intent_score, scoring_rule_set  # noqa: E402,F401 -- registers tables
+
+
+@pytest.fixture(scope="session", autouse=True)
+def database():
+    """Create the schema once; tests that need rows add and clean up their own."""
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
@@ -0,0 +1,227 @@
+"""Importing contact files a chunk at a time."""
+from datetime import datetime, timedelta, timezone
+
+import pandas as pd
+import pytest
+
+from app.config import get_settings
+from app.database import SessionLocal
+from app.models.contact import Contact
+from app.models.csv_import_job import CSVImportJob
+from app.models.intent_score import IntentScore
+from app.services.csv_import_jobs import CSVImportJobService
+from app.services.csv_service import MAX_ROW_ERRORS, CSVService
+
+settings = get_settings()
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.rollback()
+    session.query(CSVImportJob).delete()
+    session.query(IntentScore).delete()
+    session.query(Contact).delete()
+    session.commit()
+    session.close()
+
+
+def chunk(rows, start=0):
+    return pd.DataFrame(rows, columns=["email", "phone", "company"], index=range(start, start + len(rows)))
+
+
+def write_leads(path, rows):
+    """A lead file of ``rows`` distinct contacts, long enough to have a fingerprinted head."""
+    with open(path, "w") as f:
+        f.write("first_name,email,phone,company\n")
+        for i in range(rows):
+            f.write(f"Lead {i},lead{i}@example.com,512555{i:04d},Lead Number {i} Plumbing and Heating Company\n")
+    return str(path)
+
+
+def run_job(db, job):
+    service = CSVImportJobService(db)
+    claimed = service.claim_next()
+    assert claimed.id == job.id
+    return service.run(claimed)
+
+
+def test_skipped_rows_are_reported_with_reason(db):
+    db.add(Contact(email="taken@x.com", source="csv"))
+    db.commit()
+    
+    result = CSVService(db).import_chunk(chunk([
+        ["a@x.com", None, "Acme"],
+        [None, None, None],
+        ["A@x.com", "5551234567", None],
+        ["taken@x.com", None, "Other"],
+        [None, "5559876543", None],
+    ], start=10), "leads.csv")
+    
+    assert result["imported"] == 2
+    assert result["skipped"] == 3
+    assert result["errors"] == [
+        "Row 13: no email, phone or company",
+        "Row 14: email repeats an earlier row",
+        "Row 15: email already exists",
+    ]
+
+
+def test_row_errors_are_capped(db):
+    result = CSVService(db).import_chunk(chunk([[None, None, None]] * (MAX_ROW_ERRORS + 5)), "leads.csv")
+    assert result["skipped"] == MAX_ROW_ERRORS + 5
+    assert len(result["errors"]) == MAX_ROW_ERRORS
+    assert result["errors"][0] == "Row 2: no email, phone or company"
+
+
+def test_contacts_are_scored_in_the_import_transaction(db):
+    committed = []
+    
+    def before_commit(result):
+        # The scores are already written when progress is recorded
+        committed.append((result["scored"], db.query(IntentScore).count()))
+    
+    result = CSVService(db).import_chunk(
+        chunk([["a@x.com", None, "Need urgent repair"], ["b@x.com", None, "Acme"]]),
+        "leads.csv",
+        before_commit=before_commit
+    )
+    
+    assert result["scored"] == 2
+    assert committed == [(2, 2)]
+    assert db.query(Contact).filter(Contact.intent_base_score.is_(None)).count() == 0
+
+
+def test_parquet_phone_column_with_gaps_keeps_its_digits(db, tmp_path):
+    # pandas stores an integer column with missing values as float64
+    path = tmp_path / "leads.parquet"
+    pd.DataFrame({
+        "email": ["a@x.com", "b@x.com", "c@x.com"],
+        "phone": [15559998888, None, 5125551234],
+    }).to_parquet(path)
+    
+    result = CSVService(db).upload_and_import(str(path), "leads.parquet")
+    
+    assert result["imported_contacts"] == 3
+    phones = dict(db.query(Contact.email, Contact.phone))
+    assert phones == {"a@x.com": "5559998888", "b@x.com": None, "c@x.com": "5125551234"}
+    preview = CSVService(db).get_csv_preview(str(path), filename="leads.parquet")
+    assert [row["phone"] for row in preview["rows"]] == ["15559998888", None, "5125551234"]
+
+
+def test_identical_upload_returns_the_earlier_job(db, tmp_path):
+    service = CSVImportJobService(db)
+    first = service.create(write_leads(tmp_path / "a.csv", 1500), "leads.csv", chunk_size=1000)
+    run_job(db, first)
+    
+    again = service.create(write_leads(tmp_path / "b.csv", 1500), "leads.csv")
+    
+    assert again.id == first.id
+    assert not (tmp_path / "b.csv").exists()
+    assert db.query(CSVImportJob).count() == 1
+
+
+def test_appended_upload_imports_only_its_tail(db, tmp_path):
+    service = CSVImportJobService(db)
+    # The base's last chunk is partial: 1000 + 500 rows
+    base = run_job(db, service.create(write_leads(tmp_path / "a.csv", 1500), "leads.csv", chunk_size=1000))
+    assert base.status == "completed"
+    
+    job = service.create(write_leads(tmp_path / "b.csv", 2100), "leads.csv")
+    assert job.base_job_id == base.id
+    assert job.chunk_size == 1000
+    job = run_job(db, job)
+    
+    assert job.status == "completed"
+    assert job.rows_processed == 2100
+    assert job.rows_unchanged == 1500
+    assert job.contacts_imported == 600
+    assert job.rows_skipped == 0
+    assert db.query(Contact).count() == 2100
+
+
+def test_force_skips_the_earlier_upload_lookup(db, tmp_path):
+    service = CSVImportJobService(db)
+    base = run_job(db, service.create(write_leads(tmp_path / "a.csv", 1500), "leads.csv", chunk_size=1000))
+    
+    again = service.create(write_leads(tmp_path / "b.csv", 1500), "leads.csv", force=True)
+    appended = service.create(write_leads(tmp_path / "c.csv", 2100), "leads.csv", force=True)
+    
+    assert again.id != base.id
+    assert again.base_job_id is None and appended.base_job_id is None
+    again = run_job(db, again)
+    # Every row is read again; the existing emails are skipped by the insert
+    assert again.rows_processed == 1500
+    assert again.rows_unchanged == 0
+    assert again.rows_skipped == 1500
+
+
+def test_paused_job_resumes_after_its_last_committed_chunk(db, tmp_path):
+    service = CSVImportJobService(db)
+    job = service.create(write_leads(tmp_path / "a.csv", 2500), "leads.csv", chunk_size=1000)
+    checks = iter([False, True])
+    
+    # Stop once the first chunk is in
+    job = service.run(service.claim_next(), should_stop=lambda: next(checks))
+    assert job.status == "pending"
+    assert job.chunks_done == 1
+    assert job.rows_processed == 1000
+    assert db.query(Contact).count() == 1000
+    
+    job = service.run(service.claim_next())
+    assert job.status == "completed"
+    assert job.chunks_done == 3
+    assert job.rows_processed == 2500
+    assert job.contacts_imported == 2500
+    assert job.contacts_scored == 2500
+    assert db.query(Contact).count() == 2500
+    assert db.query(Contact.email).distinct().count() == 2500
+
+
+def test_running_job_is_reclaimed_only_once_stale(db, tmp_path):
+    service = CSVImportJobService(db)
+    job = service.create(write_leads(tmp_path / "a.csv", 1500), "leads.csv", chunk_size=1000)
+    assert service.claim_next().id == job.id
+    # Claimed and still heartbeating
+    assert service.claim_next() is None
+    
+    # The worker died mid-file
+    job.heartbeat_at = datetime.now(timezone.utc) - timedelta(seconds=settings.csv_import_stale_seconds + 60)
+    db.commit()
+    reclaimed = service.claim_next()
+    assert reclaimed.id == job.id
+    assert service.run(reclaimed).status == "completed"
+    assert db.query(Contact).count() == 1500
+
+
+def test_failed_job_is_retried_from_its_last_committed_chunk(db, tmp_path, monkeypatch):
+    service = CSVImportJobService(db)
+    job = service.create(write_leads(tmp_path / "a.csv", 2500), "leads.csv", chunk_size=1000)
+    import_chunk = CSVService.import_chunk
+    calls = []
+    
+    def fail_on_second_chunk(self, df, *args, **kwargs):
+        calls.append(len(df))
+        if len(calls) == 2:
+            raise OSError("disk full")
+        return import_chunk(self, df, *args, **kwargs)
+    
+    monkeypatch.setattr(CSVService, "import_chunk", fail_on_second_chunk)
+    job = service.run(service.claim_next())
+    assert job.status == "failed"
+    assert job.error == "disk full"
+    assert job.chunks_done == 1
+    assert db.query(Contact).count() == 1000
+    
+    with pytest.raises(ValueError):
+        service.retry(job.id + 1000)
+    assert service.retry(job.id).status == "pending"
+    job = service.run(service.claim_next())
+    assert job.status == "completed"
+    assert job.chunks_done == 3
+    assert job.rows_processed == 2500
+    assert job.contacts_imported == 2500
+    assert db.query(Contact).count() == 2500
+    with pytest.raises(ValueError):
+        service.retry(job.id)
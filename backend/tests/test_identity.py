@@ -0,0 +1,34 @@
+"""Identity keys used to dedupe imported contacts."""
+import pytest
+
+from app.utils.identity import contact_identity_key
+
+
+@pytest.mark.parametrize("website, key", [
+    ("https://www.acmeplumbing.com/", "domain:acmeplumbing.com"),
+    ("https://acmeplumbing.com/services/drains", "domain:acmeplumbing.com"),
+    ("https://www.yelp.com/biz/acme-plumbing-austin", "url:yelp.com/biz/acme-plumbing-austin"),
+])
+def test_business_site_is_keyed_on_domain(website, key):
+    assert contact_identity_key(website=website) == key
+
+
+@pytest.mark.parametrize("website, key", [
+    ("https://www.acmeplumbing.com/", "domain:acmeplumbing.com"),
+    ("https://www.acmeplumbing.com", "domain:acmeplumbing.com"),
+    ("https://news.example.com/2024/best-plumbers-austin", "url:news.example.com/2024/best-plumbers-austin"),
+    ("https://www.yelp.com/biz/acme-plumbing-austin", "url:yelp.com/biz/acme-plumbing-austin"),
+])
+def test_result_page_is_keyed_on_path(website, key):
+    assert contact_identity_key(website=website, page=True) == key
+
+
+def test_articles_on_one_site_get_different_keys():
+    first = contact_identity_key(website="https://blog.example.com/top-10-roofers", page=True)
+    second = contact_identity_key(website="https://blog.example.com/how-to-fix-a-leak", page=True)
+    assert first != second
+
+
+def test_directory_home_page_falls_back_to_name():
+    key = contact_identity_key(website="https://www.yelp.com/", company="Acme Plumbing", city="Austin", page=True)
+    assert key == "name:acme plumbing|austin"
@@ -0,0 +1,159 @@
+"""Batch intent scoring must agree with the per-contact scorer."""
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.config import get_settings
+from app.models.contact import Contact
+from app.services.batch_scorer import BatchIntentScorer
+from app.services.intent_scorer import IntentScoringService
+from app.services.scoring_rules import DEFAULT_KEYWORDS, ScoringRules, scoring_rules
+
+settings = get_settings()
+
+FILLER = ["family owned", "licensed and insured", "Austin, TX", "residential", "open 24/7", "& Sons"]
+
+
+def as_row(contact: Contact):
+    """A contact as a ``BatchIntentScorer.SCORING_COLUMNS`` row."""
+    return (contact.id, contact.company, contact.industry, contact.raw_data, contact.created_at, contact.source)
+
+
+def assert_same_scores(contacts, now=None):
+    """Score contacts both ways and compare label, values and signals."""
+    scorer = IntentScoringService(None)
+    expected = [scorer.calculate_intent(contact) for contact in contacts]
+    actual = BatchIntentScorer.score_rows([as_row(contact) for contact in contacts], now, scorer.rules)
+    
+    assert len(actual) == len(expected)
+    for want, got in zip(expected, actual):
+        assert got["contact_id"] == want.contact_id
+        assert got["score"] == want.score
+        assert got["score_value"] == want.score_value
+        assert got["base_score_value"] == want.base_score_value
+        assert got["signals"] == want.signals
+
+
+def make_contact(contact_id=1, company=None, industry=None, raw_data=None, source=None, age=timedelta(days=1)):
+    return Contact(
+        id=contact_id,
+        company=company,
+        industry=industry,
+        raw_data=raw_data,
+        source=source,
+        created_at=datetime.now(timezone.utc) - age
+    )
+
+
+def test_synthetic_contacts_score_identically():
+    rng = random.Random(7)
+    keywords = [keyword for tier in DEFAULT_KEYWORDS.values() for keyword in tier]
+    
+    def phrase():
+        words = rng.sample(FILLER, 2) + rng.sample(keywords, rng.choice([0, 1, 2, 3]))
+        rng.shuffle(words)
+        text = " ".join(words)
+        return text.upper() if rng.random() < 0.2 else text
+    
+    contacts = [
+        make_contact(
+            contact_id=contact_id,
+            company=phrase() if rng.random() < 0.9 else None,
+            industry=rng.choice([None, "Plumbing", "HVAC Services"]),
+            raw_data={key: phrase() for key in ("title", "snippet", "search_query", "link") if rng.random() < 0.6} or None,
+            source=rng.choice(["serpapi", "csv", None]),
+            # Stay clear of the recency cutoff; the edge has its own tests
+            age=timedelta(days=rng.choice([0, 2, 200]), hours=rng.randint(0, 20))
+        )
+        for contact_id in range(1, 501)
+    ]
+    assert_same_scores(contacts)
+
+
+@pytest.mark.parametrize("company, raw_data", [
+    (None, None),
+    ("", {}),
+    ("Need an urgent quote", None),
+    ("NEED AN URGENT QUOTE", None),
+    (None, {"title": "How to fix a leak", "snippet": "free tutorial", "link": "need help"}),
+    ("Best plumber near me", {"description": "compare reviews, call to schedule"}),
+])
+def test_keyword_edges_score_identically(company, raw_data):
+    assert_same_scores([make_contact(company=company, raw_data=raw_data)])
+
+
+@pytest.mark.parametrize("source", ["serpapi", "csv", "manual", None])
+def test_source_boost_edges_score_identically(source):
+    contact = make_contact(company="need a repair quote", source=source)
+    assert_same_scores([contact])
+    assert contact.intent_base_score >= (0.1 if source == "serpapi" else 0.0)
+
+
+@pytest.mark.parametrize("age, recent", [
+    (timedelta(0), True),
+    (timedelta(days=settings.intent_recency_days) - timedelta(minutes=5), True),
+    (timedelta(days=settings.intent_recency_days) + timedelta(minutes=5), False),
+    (timedelta(days=365), False),
+])
+def test_recency_boost_edges_score_identically(age, recent):
+    contact = make_contact(company="looking for a plumber", source="serpapi", age=age)
+    assert_same_scores([contact])
+    score = IntentScoringService(None).calculate_intent(contact)
+    assert score.signals["recency_boost"] is recent
+
+
+def test_naive_created_at_is_taken_as_utc():
+    contact = make_contact(company="urgent repair")
+    contact.created_at = contact.created_at.replace(tzinfo=None)
+    assert_same_scores([contact])
+
+
+def test_recency_cutoff_is_inclusive_in_both_scorers():
+    now = datetime.now(timezone.utc)
+    cutoff = IntentScoringService.recency_cutoff(now)
+    rows = [
+        (1, "need help", None, None, cutoff, "csv"),
+        (2, "need help", None, None, cutoff - timedelta(microseconds=1), "csv"),
+    ]
+    at_cutoff, before_cutoff = BatchIntentScorer.score_rows(rows, now)
+    assert at_cutoff["signals"]["recency_boost"] is IntentScoringService.is_recent(cutoff, now) is True
+    assert before_cutoff["signals"]["recency_boost"] is False
+    assert not IntentScoringService.is_recent(cutoff - timedelta(microseconds=1), now)
+
+
+def test_score_is_capped_at_one():
+    keywords = " ".join(DEFAULT_KEYWORDS["high"])
+    contact = make_contact(company=keywords, source="serpapi")
+    assert_same_scores([contact])
+    score = IntentScoringService(None).calculate_intent(contact)
+    assert score.score_value == 1.0
+    assert score.score == "HIGH"
+
+
+def test_recency_boost_comes_from_the_scorers_rules(monkeypatch):
+    scorer = IntentScoringService(None)
+    rules = scorer.rules
+    # Another rule set activated while the scorer is in use
+    newer = ScoringRules(rules.keywords, rules.weights, rules.recency_boost + 0.25, rules.source_boost)
+    monkeypatch.setattr(scoring_rules, "current", lambda: newer)
+    
+    score = scorer.calculate_intent(make_contact(company="need help", age=timedelta(0)))
+    assert score.signals["recency_boost"] is True
+    assert score.score_value == min(score.base_score_value + rules.recency_boost, 1.0)
+
+
+def test_rule_version_ignores_the_recency_window(monkeypatch):
+    version = IntentScoringService.compute_rule_version()
+    monkeypatch.setattr(settings, "intent_recency_days", settings.intent_recency_days + 30)
+    assert IntentScoringService.compute_rule_version() == version
+
+
+def test_unchanged_contact_is_not_rescored():
+    scorer = IntentScoringService(None)
+    contact = make_contact(company="need a plumber")
+    scorer.calculate_intent(contact)
+    # The score history isn't loaded (or needed) to tell the score is current
+    assert "intent_scores" not in contact.__dict__
+    assert scorer.rescore_if_changed(contact) is None
+    assert "intent_scores" not in contact.__dict__
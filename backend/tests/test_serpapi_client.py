@@ -0,0 +1,99 @@
+"""SerpAPIClient against a stand-in SerpAPI (httpx.MockTransport)."""
+import httpx
+import pytest
+
+from app.services.serpapi_client import SerpAPIClient
+
+PARAMS = {"q": "plumber austin", "api_key": "test-key", "engine": "google", "num": 10}
+
+
+def make_client(handler) -> SerpAPIClient:
+    return SerpAPIClient(base_url="http://serpapi.test", transport=httpx.MockTransport(handler))
+
+
+@pytest.mark.asyncio
+async def test_successful_search_returns_parsed_json():
+    requests = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, json={"organic_results": [{"title": "Acme Plumbing"}]})
+    
+    client = make_client(handler)
+    try:
+        results = await client.search(PARAMS)
+    finally:
+        await client.aclose()
+    
+    assert results == {"organic_results": [{"title": "Acme Plumbing"}]}
+    assert requests[0].url.path == "/search"
+    assert requests[0].url.params["q"] == "plumber austin"
+    assert requests[0].url.params["output"] == "json"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [200, 401])
+async def test_error_body_raises_its_message(status):
+    client = make_client(lambda request: httpx.Response(status, json={"error": "Invalid API key."}))
+    try:
+        with pytest.raises(ValueError, match="SerpAPI error: Invalid API key."):
+            await client.search(PARAMS)
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_non_200_status_raises():
+    client = make_client(lambda request: httpx.Response(503, json={"organic_results": []}))
+    try:
+        with pytest.raises(ValueError, match="HTTP 503"):
+            await client.search(PARAMS)
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_timeout_raises():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ReadTimeout("timed out", request=request)
+    
+    client = make_client(handler)
+    try:
+        with pytest.raises(ValueError, match="timed out"):
+            await client.search(PARAMS)
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_connection_error_raises():
+    def handler(request: httpx.Request) -> httpx.Response:
+        raise httpx.ConnectError("connection refused", request=request)
+    
+    client = make_client(handler)
+    try:
+        with pytest.raises(ValueError, match="ConnectError"):
+            await client.search(PARAMS)
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [200, 502])
+async def test_non_json_body_raises(status):
+    client = make_client(lambda request: httpx.Response(status, text="<html>Bad Gateway</html>"))
+    try:
+        with pytest.raises(ValueError, match=f"non-JSON response \\(HTTP {status}\\)"):
+            await client.search(PARAMS)
+    finally:
+        await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_non_object_json_raises():
+    client = make_client(lambda request: httpx.Response(200, json=["not", "an", "object"]))
+    try:
+        with pytest.raises(ValueError, match="SerpAPI returned error"):
+            await client.search(PARAMS)
+    finally:
+        await client.aclose()
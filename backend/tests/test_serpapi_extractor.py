@@ -0,0 +1,77 @@
+"""Industry and location extraction from SerpAPI queries and results."""
+import random
+
+import pytest
+
+from app.services.serpapi_extractor import (
+    INDUSTRY_KEYWORDS,
+    KeywordExtractor,
+    extract_industry,
+    extract_location,
+)
+
+
+def first_by_scan(keywords, text):
+    """The reference answer: check each keyword with ``in``, in priority order."""
+    for keyword, label in keywords:
+        if keyword in text:
+            return label
+    return None
+
+
+@pytest.mark.parametrize("keywords, text, label", [
+    ([("need", "A"), ("need help", "B")], "we need help today", "A"),
+    ([("need help", "B"), ("need", "A")], "we need help today", "B"),
+    ([("need help", "B"), ("need", "A")], "we need it today", "A"),
+    ([("help", "A"), ("need help", "B")], "need help", "A"),
+    ([("help me", "A"), ("need help", "B")], "please need help me", "A"),
+    ([("roof", "A"), ("roofer", "B")], "best roofer", "A"),
+    ([("roofer", "B"), ("roof", "A")], "best roofer", "B"),
+    ([("aa", "A")], "aaa", "A"),
+    ([("plumber", "A")], "electrician", None),
+])
+def test_overlapping_keywords_match_like_in(keywords, text, label):
+    assert KeywordExtractor(keywords).first(text) == label
+    assert first_by_scan(keywords, text) == label
+
+
+def test_random_overlapping_keywords_match_like_in():
+    rng = random.Random(3)
+    alphabet = "ab "
+    for _ in range(300):
+        keywords = [
+            ("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))), f"L{index}")
+            for index in range(rng.randint(1, 6))
+        ]
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 20)))
+        assert KeywordExtractor(keywords).first(text) == first_by_scan(keywords, text), (keywords, text)
+
+
+@pytest.mark.parametrize("query", [
+    "emergency plumber austin",
+    "best plumbing and roofing contractor",
+    "real estate agent near me",
+    "auto repair mechanic",
+    "divorce lawyer",
+    "coffee shop",
+])
+def test_industry_matches_scan_of_table(query):
+    assert extract_industry(query) == first_by_scan(INDUSTRY_KEYWORDS, query.lower())
+
+
+def test_location_is_found_in_text():
+    assert extract_location("Best plumber in Austin, TX - call now") == ("Austin", "TX")
+    assert extract_location("No location here") == (None, None)
+
+
+@pytest.mark.parametrize("text", [
+    "Smith Plumbing, Austin, TX 78701",
+    "Call Joe, Austin, TX",
+])
+def test_location_after_a_business_name_is_found(text):
+    assert extract_location(text) == ("Austin", "TX")
+
+
+@pytest.mark.parametrize("query", ["travel agent austin", "mortgage broker"])
+def test_agent_and_broker_have_no_industry(query):
+    assert extract_industry(query) is None
@@ -0,0 +1,54 @@
+"""Raw SerpAPI response storage and compaction."""
+import pytest
+from sqlalchemy import event, insert
+
+from app.database import SessionLocal
+from app.models.serpapi_payload import SerpAPIPayload
+from app.models.serpapi_search import SerpAPISearch
+from app.services.serpapi_payload_store import SerpAPIPayloadStore
+
+
+@pytest.fixture
+def db():
+    session = SessionLocal()
+    yield session
+    session.rollback()
+    session.query(SerpAPISearch).delete()
+    session.query(SerpAPIPayload).delete()
+    session.commit()
+    session.close()
+
+
+def test_compact_deletes_only_unreferenced_payloads(db):
+    store = SerpAPIPayloadStore(db)
+    kept = store.put({"organic_results": [{"title": "kept"}]})
+    orphan = store.put({"organic_results": [{"title": "orphan"}]})
+    db.add(SerpAPISearch(query="plumber", payload_id=kept))
+    db.commit()
+    
+    stats = store.compact(retention_days=0)
+    
+    assert stats["payloads_deleted"] == 1
+    assert db.get(SerpAPIPayload, kept) is not None
+    assert db.get(SerpAPIPayload, orphan) is None
+
+
+def test_compact_keeps_a_payload_referenced_after_it_was_selected(db):
+    store = SerpAPIPayloadStore(db)
+    payload_id = store.put({"organic_results": [{"title": "reused"}]})
+    db.commit()
+    
+    @event.listens_for(db, "do_orm_execute")
+    def reuse_after_select(state):
+        # A concurrent import reuses the payload right after compaction picked it
+        if state.is_select and "serpapi_payloads" in str(state.statement):
+            result = state.invoke_statement()
+            state.session.connection().execute(insert(SerpAPISearch).values(query="reused", payload_id=payload_id))
+            event.remove(db, "do_orm_execute", reuse_after_select)
+            return result
+    
+    stats = store.compact(retention_days=0)
+    
+    assert stats["payloads_deleted"] == 0
+    assert stats["bytes_freed"] == 0
+    assert store.get(payload_id) == {"organic_results": [{"title": "reused"}]}
@@ -147,7 +147,7 @@ export default function AudienceDetailPage() {
                                                     </div>
                                                 </td>
                                                 <td className="px-6 py-4 whitespace-nowrap">
-                                                    <IntentBadge score={contact.intent_scores?.[0]} />
+                                                    <IntentBadge level={contact.intent_level} />
                                                 </td>
                                             </tr>
                                         ))}
@@ -191,7 +191,7 @@ export default function ContactsPage() {
                                             </div>
                                         </td>
                                         <td className="px-6 py-4 whitespace-nowrap">
-                                            <IntentBadge score={contact.intent_scores?.[0]} />
+                                            <IntentBadge level={contact.intent_level} />
                                         </td>
                                         <td className="px-6 py-4 whitespace-nowrap text-sm text-gray-500">
                                             {formatDateTime(contact.created_at)}
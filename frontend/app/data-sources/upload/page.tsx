@@ -1,19 +1,40 @@
 'use client'
 
-import { useState, useRef } from 'react'
-import { api } from '@/lib/api'
+import { useState, useRef, useEffect } from 'react'
+import { api, CSVImportJob } from '@/lib/api'
 import Link from 'next/link'
 
+// How often a running import job is polled for progress
+const JOB_POLL_INTERVAL_MS = 1000
+
 export default function CSVUploadPage() {
     const [file, setFile] = useState<File | null>(null)
     const [uploading, setUploading] = useState(false)
-    const [result, setResult] = useState<any>(null)
+    const [job, setJob] = useState<CSVImportJob | null>(null)
     const fileInputRef = useRef<HTMLInputElement>(null)
 
+    const jobFinished = job?.status === 'completed' || job?.status === 'failed'
+
+    useEffect(() => {
+        if (!job || jobFinished) {
+            return
+        }
+        const timer = setTimeout(async () => {
+            try {
+                const response = await api.get<CSVImportJob>(`/data-sources/csv/jobs/${job.id}`)
+                setJob(response.data)
+            } catch (error) {
+                console.error('Failed to fetch import status:', error)
+                setJob({ ...job })  // Try again on the next tick
+            }
+        }, JOB_POLL_INTERVAL_MS)
+        return () => clearTimeout(timer)
+    }, [job, jobFinished])
+
     const handleFileChange = (e: React.ChangeEvent<HTMLInputElement>) => {
         if (e.target.files && e.target.files[0]) {
             setFile(e.target.files[0])
-            setResult(null)
+            setJob(null)
         }
     }
 
@@ -21,7 +42,7 @@ export default function CSVUploadPage() {
         e.preventDefault()
 
         if (!file) {
-            alert('Please select a CSV file')
+            alert('Please select a file')
             return
         }
 
@@ -31,13 +52,13 @@ export default function CSVUploadPage() {
             const formData = new FormData()
             formData.append('file', file)
 
-            const response = await api.post('/data-sources/csv/upload', formData, {
+            const response = await api.post<CSVImportJob>('/data-sources/csv/upload', formData, {
                 headers: {
                     'Content-Type': 'multipart/form-data',
                 },
             })
 
-            setResult(response.data)
+            setJob(response.data)
             setFile(null)
             if (fileInputRef.current) {
                 fileInputRef.current.value = ''
@@ -54,7 +75,7 @@ export default function CSVUploadPage() {
             <div className="mb-8">
                 <h1 className="text-3xl font-bold text-gray-900">CSV Upload</h1>
                 <p className="mt-2 text-gray-600">
-                    Import contacts from a CSV file
+                    Import contacts from a CSV, JSONL, Parquet or Arrow file
                 </p>
             </div>
 
@@ -64,7 +85,7 @@ export default function CSVUploadPage() {
                     CSV Format Guidelines
                 </h2>
                 <div className="text-sm text-blue-800 space-y-2">
-                    <p>Your CSV should include these columns (case-insensitive):</p>
+                    <p>Your file should include these columns (case-insensitive):</p>
                     <ul className="list-disc list-inside ml-4 space-y-1">
                         <li><code className="bg-blue-100 px-1 rounded">first_name</code>, <code className="bg-blue-100 px-1 rounded">last_name</code></li>
                         <li><code className="bg-blue-100 px-1 rounded">email</code>, <code className="bg-blue-100 px-1 rounded">phone</code></li>
@@ -81,7 +102,7 @@ export default function CSVUploadPage() {
                 <form onSubmit={handleUpload} className="space-y-6">
                     <div>
                         <label className="block text-sm font-medium text-gray-700 mb-2">
-                            Select CSV File
+                            Select File
                         </label>
                         <div className="mt-1 flex justify-center px-6 pt-5 pb-6 border-2 border-gray-300 border-dashed rounded-md hover:border-blue-400 transition">
                             <div className="space-y-1 text-center">
@@ -110,14 +131,14 @@ export default function CSVUploadPage() {
                                             ref={fileInputRef}
                                             name="file-upload"
                                             type="file"
-                                            accept=".csv"
+                                            accept=".csv,.csv.gz,.jsonl,.ndjson,.jsonl.gz,.parquet,.arrow,.feather"
                                             onChange={handleFileChange}
                                             className="sr-only"
                                         />
                                     </label>
                                     <p className="pl-1">or drag and drop</p>
                                 </div>
-                                <p className="text-xs text-gray-500">CSV files only</p>
+                                <p className="text-xs text-gray-500">CSV, gzip CSV, JSONL, Parquet or Arrow</p>
                                 {file && (
                                     <p className="text-sm font-medium text-green-600 mt-2">
                                         Selected: {file.name}
@@ -129,46 +150,63 @@ export default function CSVUploadPage() {
 
                     <button
                         type="submit"
-                        disabled={!file || uploading}
+                        disabled={!file || uploading || (job !== null && !jobFinished)}
                         className="w-full px-4 py-3 bg-blue-600 text-white rounded-md font-medium hover:bg-blue-700 transition disabled:opacity-50 disabled:cursor-not-allowed"
                     >
-                        {uploading ? 'Uploading...' : 'Upload & Import'}
+                        {uploading ? 'Uploading...' : job && !jobFinished ? 'Importing...' : 'Upload & Import'}
                     </button>
                 </form>
             </div>
 
-            {/* Results */}
-            {result && (
+            {/* Import progress and results */}
+            {job && (
                 <div className="bg-white rounded-lg shadow p-6">
                     <h2 className="text-xl font-semibold text-gray-900 mb-4">
-                        Import Complete ✓
+                        {job.status === 'completed' && 'Import Complete ✓'}
+                        {job.status === 'failed' && 'Import Failed'}
+                        {job.status === 'pending' && 'Import Queued...'}
+                        {job.status === 'running' && 'Importing...'}
                     </h2>
                     <div className="space-y-2 text-gray-700 mb-4">
-                        <p><strong>File:</strong> {result.filename}</p>
-                        <p><strong>Total Rows:</strong> {result.total_rows}</p>
-                        <p><strong>Imported Contacts:</strong> {result.imported_contacts}</p>
-                        <p><strong>Skipped Rows:</strong> {result.skipped_rows}</p>
+                        <p><strong>File:</strong> {job.filename}</p>
+                        <p><strong>Rows Processed:</strong> {job.rows_processed}</p>
+                        <p><strong>Imported Contacts:</strong> {job.contacts_imported}</p>
+                        <p><strong>Skipped Rows:</strong> {job.rows_skipped}</p>
+                        {job.rows_unchanged > 0 && (
+                            <p><strong>Unchanged Rows:</strong> {job.rows_unchanged} (already imported by job #{job.base_job_id})</p>
+                        )}
+                        {job.rows_per_second != null && (
+                            <p><strong>Throughput:</strong> {Math.round(job.rows_per_second)} rows/s</p>
+                        )}
                     </div>
 
-                    {result.errors && result.errors.length > 0 && (
+                    {job.error && (
+                        <div className="bg-red-50 border border-red-200 rounded-lg p-4 mb-4 text-sm text-red-800">
+                            {job.error}
+                        </div>
+                    )}
+
+                    {job.errors && job.errors.length > 0 && (
                         <div className="bg-red-50 border border-red-200 rounded-lg p-4 mb-4">
                             <h3 className="text-sm font-semibold text-red-900 mb-2">
-                                Errors ({result.errors.length})
+                                Errors ({job.errors.length})
                             </h3>
                             <ul className="text-sm text-red-800 list-disc list-inside space-y-1">
-                                {result.errors.map((error: string, index: number) => (
+                                {job.errors.map((error: string, index: number) => (
                                     <li key={index}>{error}</li>
                                 ))}
                             </ul>
                         </div>
                     )}
 
-                    <Link
-                        href="/contacts"
-                        className="inline-block px-4 py-2 bg-green-600 text-white rounded-md hover:bg-green-700 transition"
-                    >
-                        View Contacts
-                    </Link>
+                    {job.status === 'completed' && (
+                        <Link
+                            href="/contacts"
+                            className="inline-block px-4 py-2 bg-green-600 text-white rounded-md hover:bg-green-700 transition"
+                        >
+                            View Contacts
+                        </Link>
+                    )}
                 </div>
             )}
         </div>
@@ -25,13 +25,13 @@ export default function Home() {
             const stats = {
                 totalContacts: response.data.total,
                 highIntent: contacts.filter((c: any) =>
-                    c.intent_scores?.[0]?.score === 'HIGH'
+                    c.intent_level === 'HIGH'
                 ).length,
                 mediumIntent: contacts.filter((c: any) =>
-                    c.intent_scores?.[0]?.score === 'MEDIUM'
+                    c.intent_level === 'MEDIUM'
                 ).length,
                 lowIntent: contacts.filter((c: any) =>
-                    c.intent_scores?.[0]?.score === 'LOW'
+                    c.intent_level === 'LOW'
                 ).length,
             }
 
@@ -1,11 +1,11 @@
-import { IntentScore } from '@/lib/api'
+import { IntentLevel } from '@/lib/api'
 
 interface IntentBadgeProps {
-    score: IntentScore | undefined
+    level: IntentLevel | null | undefined
 }
 
-export default function IntentBadge({ score }: IntentBadgeProps) {
-    if (!score) {
+export default function IntentBadge({ level }: IntentBadgeProps) {
+    if (!level) {
         return (
             <span className="inline-flex items-center px-3 py-1 rounded-full text-xs font-semibold bg-gray-100 text-gray-600 border border-gray-200">
                 N/A
@@ -26,9 +26,9 @@ export default function IntentBadge({ score }: IntentBadgeProps) {
     }
 
     return (
-        <span className={`inline-flex items-center gap-1.5 px-3 py-1 rounded-full text-xs font-semibold border ${styles[score.score]}`}>
-            <span>{icons[score.score]}</span>
-            <span>{score.score}</span>
+        <span className={`inline-flex items-center gap-1.5 px-3 py-1 rounded-full text-xs font-semibold border ${styles[level]}`}>
+            <span>{icons[level]}</span>
+            <span>{level}</span>
         </span>
     )
 }
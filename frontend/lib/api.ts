@@ -25,13 +25,17 @@ export interface Contact {
     source?: string
     created_at: string
     updated_at: string
+    intent_level?: IntentLevel | null
+    intent_score_value?: number | null
     intent_scores?: IntentScore[]
 }
 
+export type IntentLevel = 'LOW' | 'MEDIUM' | 'HIGH'
+
 export interface IntentScore {
     id: number
     contact_id: number
-    score: 'LOW' | 'MEDIUM' | 'HIGH'
+    score: IntentLevel
     score_value: number
     signals?: any
     calculated_at: string
@@ -46,3 +50,27 @@ export interface Audience {
     created_at: string
     updated_at: string
 }
+
+export type CSVImportStatus = 'pending' | 'running' | 'failed' | 'completed'
+
+export interface CSVImportJob {
+    id: number
+    filename: string
+    status: CSVImportStatus
+    chunk_size: number
+    chunks_done: number
+    rows_processed: number
+    contacts_imported: number
+    rows_skipped: number
+    contacts_scored: number
+    rows_unchanged: number
+    base_job_id?: number | null
+    content_sha256?: string | null
+    rows_per_second?: number | null
+    peak_memory_mb?: number | null
+    errors: string[]
+    error?: string | null
+    created_at: string
+    started_at?: string | null
+    completed_at?: string | null
+}